@@ -1,26 +1,123 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
+import time
+
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.const import Platform, CONF_SCAN_INTERVAL
-from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.core import Event, HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.const import Platform, CONF_ACCESS_TOKEN, CONF_SCAN_INTERVAL, CONF_WEBHOOK_ID
+from homeassistant.helpers import config_entry_oauth2_flow, entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN, CONF_USE_SANDBOX, DEFAULT_UPDATE_INTERVAL_MIN
-from .coordinator import OuraDataUpdateCoordinator
-from .api import OuraApiClient
+from .const import (
+    DOMAIN,
+    CONF_USE_SANDBOX,
+    DEFAULT_UPDATE_INTERVAL_MIN,
+    CONF_MAX_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENCY,
+    CONF_USE_WEBHOOKS,
+    WEBHOOK_DATA_TYPES,
+    WEBHOOK_FALLBACK_TTL_SEC,
+    CONF_HR_STATISTICS,
+    CONF_ADAPTIVE_POLLING,
+    STORAGE_VERSION,
+    ENDPOINT_TIERS,
+)
+from .adaptive import WATCH_ENDPOINTS, OuraAdaptivePolling
+from .coordinator import OuraDataUpdateCoordinator, endpoint_ttls, async_remove_cache
+from .api import OuraApiClient, OuraOAuthAuth, OuraTokenAuth
+from .backfill import OuraBackfill
+from .heartrate_history import OuraHeartRateHistory
+from .scheduler import OuraRefreshScheduler
+from .sensor import SENSORS
+from .webhook import OuraWebhookManager, OuraWebhookSubscriptionApi
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BUTTON]
 _LOGGER = logging.getLogger(__name__)
 
+BACKFILL_SCHEMA = vol.Schema({
+    vol.Optional("entry_id"): cv.string,
+    vol.Required("start_date"): cv.date,
+    vol.Optional("end_date"): cv.date,
+})
+
+def _target_entries(hass: HomeAssistant, entry_id: str | None) -> dict:
+    domain_data = hass.data.get(DOMAIN, {})
+    if entry_id:
+        return {entry_id: domain_data[entry_id]} if entry_id in domain_data else {}
+    return {k: v for k, v in domain_data.items() if not k.startswith("_")}
+
+def _granted_scopes(entry: ConfigEntry) -> list[str] | None:
+    """Scopes the user actually granted; None when the token does not say."""
+    scope = (entry.data.get("token") or {}).get("scope")
+    if isinstance(scope, str):
+        return scope.split()
+    return list(scope) if isinstance(scope, (list, tuple)) else None
+
+def _required_endpoints(hass: HomeAssistant, entry: ConfigEntry, uid_prefix: str) -> set[str] | None:
+    """Endpoints backing the entry's enabled sensors; None before any sensor is registered."""
+    by_unique_id = {f"{uid_prefix}_{desc.key}": desc.endpoints for desc in SENSORS}
+    registered = [
+        reg for reg in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+        if reg.unique_id in by_unique_id
+    ]
+    if not registered:
+        return None
+    # personal_info names the device; hourly HR statistics read the heart-rate buffer;
+    # adaptive polling learns wake and score arrival times from the sleep endpoints
+    required = {"personal_info"}
+    if entry.options.get(CONF_HR_STATISTICS, True):
+        required.add("heartrate")
+    if entry.options.get(CONF_ADAPTIVE_POLLING, False):
+        required.update(WATCH_ENDPOINTS)
+    for reg in registered:
+        if reg.disabled_by is None:
+            required.update(by_unique_id[reg.unique_id] or ENDPOINT_TIERS)
+    return required
+
+async def _async_forced_refresh(data: dict) -> dict:
+    """Service refresh of one account, reported back as response data."""
+    coordinator: OuraDataUpdateCoordinator = data["coordinator"]
+    telemetry = data["client"].telemetry
+    requests = telemetry.total("requests")
+    started = time.monotonic()
+    joined = await coordinator.async_refresh_coalesced(force=True)
+    return {
+        "success": coordinator.last_update_success,
+        "joined": joined,
+        "duration_sec": round(time.monotonic() - started, 3),
+        "requests": telemetry.total("requests") - requests,
+        "error": str(coordinator.last_exception) if not coordinator.last_update_success else None,
+    }
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    implementation = await config_entry_oauth2_flow.async_get_config_entry_implementation(hass, entry)
-    session = config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation)
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler: OuraRefreshScheduler = domain_data.get("_scheduler")
+    if scheduler is None:
+        scheduler = domain_data["_scheduler"] = OuraRefreshScheduler(hass)
+
+    implementation = None
+    if CONF_ACCESS_TOKEN in entry.data:
+        # Personal access token: no OAuth app, nothing to refresh
+        auth = OuraTokenAuth(entry.data[CONF_ACCESS_TOKEN])
+    else:
+        implementation = await config_entry_oauth2_flow.async_get_config_entry_implementation(hass, entry)
+        auth = OuraOAuthAuth(config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation))
     use_sandbox = entry.options.get(CONF_USE_SANDBOX, False)
-    client = OuraApiClient(session, use_sandbox=use_sandbox)
+    client = OuraApiClient(
+        async_get_clientsession(hass),
+        auth,
+        use_sandbox=use_sandbox,
+        max_concurrency=entry.options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+        request_limiter=scheduler.request_limiter,
+    )
 
     scan_interval_sec = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_UPDATE_INTERVAL_MIN * 60)
     coordinator = OuraDataUpdateCoordinator(
@@ -29,8 +126,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_interval=timedelta(seconds=scan_interval_sec),
         title=f"oura_{entry.entry_id}",
         entry_id=entry.entry_id,
+        endpoint_ttls=endpoint_ttls(entry.options),
+        granted_scopes=_granted_scopes(entry),
     )
-    await coordinator.async_config_entry_first_refresh()
+    # Key for external statistic ids; stable across re-adding the same Oura account
+    stats_key = entry.unique_id or entry.entry_id
+    if entry.options.get(CONF_HR_STATISTICS, True):
+        coordinator.hr_history = OuraHeartRateHistory(hass, client, entry.entry_id, stats_key)
+        await coordinator.hr_history.async_load()
+    if entry.options.get(CONF_ADAPTIVE_POLLING, False):
+        coordinator.adaptive = OuraAdaptivePolling(
+            timedelta(seconds=scan_interval_sec), lambda: scheduler.async_reschedule(entry.entry_id)
+        )
+
+    webhooks = None
+    if entry.options.get(CONF_USE_WEBHOOKS, False) and implementation is None:
+        _LOGGER.warning("Oura webhooks need an OAuth application; not available with a personal access token")
+    elif entry.options.get(CONF_USE_WEBHOOKS, False):
+        OuraWebhookManager.ensure_entry_data(hass, entry)
+        webhooks = OuraWebhookManager(
+            hass, entry, coordinator,
+            OuraWebhookSubscriptionApi(hass, implementation.client_id, implementation.client_secret),
+        )
+        if await webhooks.async_setup():
+            coordinator.use_push_for(WEBHOOK_DATA_TYPES, WEBHOOK_FALLBACK_TTL_SEC)
+            entry.async_on_unload(webhooks.async_unload)
+        else:
+            webhooks = None
+
+    restored = await coordinator.async_load_cache()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
+    # Entities restored from cache get their stale endpoints refreshed within the startup
+    # stagger window; after that every account polls in its own slot of the interval
+    scheduler.async_register(coordinator, refresh_soon=restored)
+    entry.async_on_unload(lambda: scheduler.async_unregister(entry.entry_id))
 
     pi = (coordinator.data.payloads.get("personal_info", {}) if coordinator.data else {}) or {}
     user = pi.get("id") or pi.get("email") or entry.unique_id or entry.entry_id
@@ -44,35 +174,102 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "coordinator": coordinator,
         "client": client,
+        "webhooks": webhooks,
+        "backfill": OuraBackfill(hass, client, entry.entry_id, stats_key),
+        "backfill_task": None,
         "device_info": device_info,
         "uid_prefix": f"{entry.entry_id}",
+        # What the entry was set up with; token refreshes rewrite entry.data and must not reload
+        "options": dict(entry.options),
     }
 
     # Register refresh service once
     if not hass.data[DOMAIN].get("_service_registered"):
-        async def _handle_request_refresh(call: ServiceCall):
-            entry_id = call.data.get("entry_id")
-            targets = []
-            if entry_id:
-                data = hass.data.get(DOMAIN, {}).get(entry_id)
-                if data:
-                    targets.append(data["coordinator"])
-            else:
-                for k, v in hass.data.get(DOMAIN, {}).items():
-                    if k.startswith("_"):
-                        continue
-                    targets.append(v["coordinator"])
-            for coord in targets:
-                await coord.async_request_refresh()
-
-        hass.services.async_register(DOMAIN, "request_refresh", _handle_request_refresh)
+        async def _handle_request_refresh(call: ServiceCall) -> ServiceResponse:
+            # Accounts refresh concurrently; the scheduler's request limiter bounds the
+            # requests in flight across all of them
+            targets = _target_entries(hass, call.data.get("entry_id"))
+            results = await asyncio.gather(*(_async_forced_refresh(v) for v in targets.values()))
+            return {"entries": dict(zip(targets, results))} if call.return_response else None
+
+        async def _handle_backfill(call: ServiceCall):
+            # Runs in the background: multi-year ranges take many minutes, and the
+            # checkpoint lets an interrupted run pick up where it stopped
+            for entry_id, data in _target_entries(hass, call.data.get("entry_id")).items():
+                task = data.get("backfill_task")
+                if task and not task.done():
+                    _LOGGER.warning("Oura backfill already running for %s", entry_id)
+                    continue
+                data["backfill_task"] = hass.async_create_background_task(
+                    data["backfill"].async_run(call.data["start_date"], call.data.get("end_date")),
+                    f"{DOMAIN}_backfill_{entry_id}",
+                )
+
+        hass.services.async_register(
+            DOMAIN, "request_refresh", _handle_request_refresh, supports_response=SupportsResponse.OPTIONAL
+        )
+        hass.services.async_register(DOMAIN, "backfill", _handle_backfill, schema=BACKFILL_SCHEMA)
         hass.data[DOMAIN]["_service_registered"] = True
 
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    @callback
+    def _async_update_required(event: Event | None = None) -> None:
+        if event is not None:
+            reg = er.async_get(hass).async_get(event.data["entity_id"])
+            if event.data["action"] != "remove" and (reg is None or reg.config_entry_id != entry.entry_id):
+                return
+        uid_prefix = hass.data[DOMAIN][entry.entry_id]["uid_prefix"]
+        added = coordinator.set_required_endpoints(_required_endpoints(hass, entry, uid_prefix))
+        if added and event is not None:
+            # A sensor was just enabled: fetch its data now rather than at the next slot
+            hass.async_create_task(coordinator.async_refresh_coalesced(added))
+
+    # Entities are registered by now; the first refresh above still fetched everything
+    _async_update_required()
+    entry.async_on_unload(hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _async_update_required))
     return True
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if data is None or data["options"] != dict(entry.options):
+        await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    scheduler: OuraRefreshScheduler | None = hass.data.get(DOMAIN, {}).get("_scheduler")
+    data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    # Stop polling first so no scheduled refresh starts while the platforms unload
+    if scheduler is not None:
+        scheduler.async_unregister(entry.entry_id)
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    if unload_ok and entry.entry_id in hass.data.get(DOMAIN, {}):
+    if not unload_ok:
+        if scheduler is not None and data is not None:
+            scheduler.async_register(data["coordinator"])
+        return False
+    if data is not None:
         hass.data[DOMAIN].pop(entry.entry_id)
-    return unload_ok
+        # Background work must not outlive the client and stores it uses
+        if data["backfill_task"] is not None:
+            data["backfill_task"].cancel()
+        coordinator: OuraDataUpdateCoordinator = data["coordinator"]
+        if coordinator.hr_history is not None:
+            coordinator.hr_history.async_unload()
+        await coordinator.async_shutdown()
+    if scheduler is not None and scheduler.empty:
+        # Last account gone: drop the scheduler; the next setup creates a fresh one
+        scheduler.async_shutdown()
+        hass.data[DOMAIN].pop("_scheduler")
+    return True
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await async_remove_cache(hass, entry.entry_id)
+    for key in (f"{DOMAIN}.backfill.{entry.entry_id}", f"{DOMAIN}.hr_history.{entry.entry_id}"):
+        await Store(hass, STORAGE_VERSION, key).async_remove()
+    if CONF_WEBHOOK_ID in entry.data:
+        try:
+            implementation = await config_entry_oauth2_flow.async_get_config_entry_implementation(hass, entry)
+            api = OuraWebhookSubscriptionApi(hass, implementation.client_id, implementation.client_secret)
+            await OuraWebhookManager(hass, entry, None, api).async_remove_subscriptions()
+        except Exception as err:
+            _LOGGER.warning("Could not remove Oura webhook subscriptions: %s", err)
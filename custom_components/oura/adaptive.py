@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .const import (
+    ADAPTIVE_FAST_INTERVAL_SEC,
+    ADAPTIVE_IDLE_INTERVAL_SEC,
+    ADAPTIVE_HISTORY_DAYS,
+    ADAPTIVE_MIN_OBSERVATIONS,
+    ADAPTIVE_WINDOW_MARGIN_MIN,
+)
+
+# Daily scores that appear once the ring has synced after wake-up
+SYNC_ENDPOINTS = ("daily_sleep", "daily_readiness")
+# Fetched on every poll inside the sync window, whatever their TTL
+WATCH_ENDPOINTS = ("daily_sleep", "daily_readiness", "sleep")
+_DAY_MIN = 24 * 60
+
+def _minute_of_day(ts: datetime) -> int:
+    return ts.hour * 60 + ts.minute
+
+def _quantile(values: List[int], q: float) -> int:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def _records(payload: Any) -> List[Dict[str, Any]]:
+    return [r for r in ((payload or {}).get("data") or []) if isinstance(r, dict)] if isinstance(payload, dict) else []
+
+class OuraAdaptivePolling:
+    """Learns when an account's ring syncs after wake-up and picks the poll interval.
+
+    Two observations are kept per day, as minutes after local midnight: the wake time
+    (`bedtime_end` of the main sleep) and when today's daily scores were first seen.
+    Inside the predicted window the coordinator polls every ADAPTIVE_FAST_INTERVAL_SEC
+    until today's scores arrive; the rest of the day it backs off to the idle interval."""
+
+    def __init__(self, base_interval: timedelta, reschedule: Callable[[], None]) -> None:
+        self.base_interval = base_interval
+        self.reschedule = reschedule
+        self._wake: Dict[str, int] = {}
+        self._arrival: Dict[str, int] = {}
+        self._seen_today: Optional[str] = None
+
+    def load(self, stored: Any) -> None:
+        if isinstance(stored, dict):
+            self._wake = {day: int(m) for day, m in (stored.get("wake") or {}).items()}
+            self._arrival = {day: int(m) for day, m in (stored.get("arrival") or {}).items()}
+            self._seen_today = stored.get("seen_today")
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"wake": self._wake, "arrival": self._arrival, "seen_today": self._seen_today}
+
+    def observe(self, payloads: Dict[str, Any], today: str, now: datetime) -> None:
+        for record in _records(payloads.get("sleep")):
+            if record.get("type") == "long_sleep" and record.get("day") and record.get("bedtime_end"):
+                try:
+                    wake = datetime.fromisoformat(record["bedtime_end"])
+                except ValueError:
+                    continue
+                # The timestamp carries the wearer's offset; arrivals and the window check use
+                # `now`, so convert before comparing minutes of the day
+                self._wake[record["day"]] = _minute_of_day(wake.astimezone(now.tzinfo) if wake.tzinfo else wake)
+        if self._seen_today != today and self.arrived(payloads, today):
+            self._seen_today = today
+            self._arrival.setdefault(today, _minute_of_day(now))
+        for days in (self._wake, self._arrival):
+            for day in sorted(days)[:-ADAPTIVE_HISTORY_DAYS]:
+                del days[day]
+
+    @staticmethod
+    def arrived(payloads: Dict[str, Any], today: str) -> bool:
+        # Endpoints the account cannot read (no scope, gated) are not waited for
+        keys = [key for key in SYNC_ENDPOINTS if key in payloads]
+        return bool(keys) and all(any(r.get("day") == today for r in _records(payloads[key])) for key in keys)
+
+    def window(self) -> Optional[Tuple[int, int]]:
+        """Predicted sync window in minutes after midnight; None until enough days were seen."""
+        wakes, arrivals = list(self._wake.values()), list(self._arrival.values())
+        if max(len(wakes), len(arrivals)) < ADAPTIVE_MIN_OBSERVATIONS:
+            return None
+        start = _quantile(wakes or arrivals, 0.2) - ADAPTIVE_WINDOW_MARGIN_MIN
+        if arrivals:
+            end = _quantile(arrivals, 0.8) + 2 * ADAPTIVE_WINDOW_MARGIN_MIN
+        else:
+            end = _quantile(wakes, 0.8) + 6 * ADAPTIVE_WINDOW_MARGIN_MIN
+        return max(0, start), min(_DAY_MIN - 1, end)
+
+    def watching(self, today: str, now: datetime) -> bool:
+        """Inside the sync window with today's scores still missing."""
+        window = self.window()
+        return window is not None and self._seen_today != today and window[0] <= _minute_of_day(now) <= window[1]
+
+    def interval(self, today: str, now: datetime) -> timedelta:
+        window = self.window()
+        if window is None:
+            return self.base_interval
+        idle = max(self.base_interval, timedelta(seconds=ADAPTIVE_IDLE_INTERVAL_SEC))
+        minute = _minute_of_day(now)
+        if self._seen_today == today:
+            return idle
+        if window[0] <= minute <= window[1]:
+            return timedelta(seconds=ADAPTIVE_FAST_INTERVAL_SEC)
+        if minute > window[1]:
+            # Later than usual today (slept in, ring off the charger): keep the normal pace
+            return self.base_interval
+        # Before the window: back off, but wake up in time for it
+        until_start = timedelta(minutes=window[0] - minute)
+        return max(timedelta(seconds=ADAPTIVE_FAST_INTERVAL_SEC), min(idle, until_start))
+
+    def diagnostics(self, today: str, now: datetime) -> Dict[str, Any]:
+        window = self.window()
+        return {
+            "window": [f"{m // 60:02d}:{m % 60:02d}" for m in window] if window else None,
+            "observed_days": {"wake": len(self._wake), "arrival": len(self._arrival)},
+            "arrived_today": self._seen_today == today,
+            "interval_sec": self.interval(today, now).total_seconds(),
+        }
@@ -1,72 +1,352 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import abc
+import asyncio
+import contextlib
+import json
+import logging
+import random
+import time
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, TypedDict, Union
 
+from aiohttp import ClientResponseError, ClientSession
+from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
 
-from .const import API_BASE, SANDBOX_API_BASE
+from .const import (
+    API_BASE,
+    SANDBOX_API_BASE,
+    DEFAULT_MAX_CONCURRENCY,
+    RATE_LIMIT_REQUESTS,
+    RATE_LIMIT_PERIOD_SEC,
+    MAX_RETRIES,
+    BACKOFF_BASE_SEC,
+    BACKOFF_MAX_SEC,
+    MAX_RETRY_WAIT_SEC,
+    TOKEN_REFRESH_MARGIN_SEC,
+)
+from .telemetry import OuraTelemetry, endpoint_name
+
+try:
+    import orjson
+except ImportError:  # Home Assistant ships orjson; plain json keeps the client usable without it
+    orjson = None
+
+_LOGGER = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Nested sample arrays no sensor or statistic reads, dropped from each record right after decode
+DROPPED_FIELDS = {
+    "sleep": ("heart_rate", "hrv", "movement_30_sec", "sleep_phase_5_min"),
+    "daily_activity": ("met", "class_5_min"),
+    "session": ("heart_rate", "hrv", "motion_count"),
+}
+
+DateLike = Union[date, str]
+DateTimeLike = Union[datetime, str]
+
+class OuraCollection(TypedDict):
+    data: List[Dict[str, Any]]
+    next_token: Optional[str]
+
+class PersonalInfo(TypedDict, total=False):
+    id: str
+    age: int
+    weight: float
+    height: float
+    biological_sex: str
+    email: str
+
+def _iso(value: Union[date, str]) -> str:
+    return value.isoformat() if isinstance(value, date) else value
+
+def _date_range(start_date: DateLike, end_date: DateLike) -> Dict[str, str]:
+    return {"start_date": _iso(start_date), "end_date": _iso(end_date)}
+
+def json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def json_dumps_sorted(value: Any) -> bytes:
+    """Canonical encoding, used for change fingerprints."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+def project_payload(endpoint: str, payload: Any) -> Any:
+    """Drop DROPPED_FIELDS of `endpoint` from every record of a collection payload, in place."""
+    fields = DROPPED_FIELDS.get(endpoint)
+    if fields and isinstance(payload, dict):
+        for record in payload.get("data") or []:
+            if isinstance(record, dict):
+                for name in fields:
+                    record.pop(name, None)
+    return payload
 
 class OuraApiError(Exception):
+    def __init__(self, message: str, status: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+class OuraRateLimitError(OuraApiError):
     pass
 
-class OuraApiClient:
-    def __init__(self, session: OAuth2Session, *, use_sandbox: bool = False) -> None:
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter around the nominal delay."""
+    return min(BACKOFF_MAX_SEC, BACKOFF_BASE_SEC * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+class _TokenBucket:
+    """Client-side view of the per-token quota, plus a pause window set by Retry-After."""
+
+    def __init__(self, capacity: int, period: float) -> None:
+        self._capacity = float(capacity)
+        self._rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                paused = self._paused_until - now
+                if paused > MAX_RETRY_WAIT_SEC:
+                    raise OuraRateLimitError(f"Rate limited by Oura for another {paused:.0f}s", status=429)
+                if paused > 0:
+                    await asyncio.sleep(paused)
+                    continue
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+class OuraAuth(abc.ABC):
+    """Source of the bearer token sent with every request."""
+
+    # Whether a 401 is worth one retry with a refreshed token
+    can_refresh = False
+
+    @abc.abstractmethod
+    async def async_get_access_token(self, rejected: Optional[str] = None) -> str:
+        """A valid access token; `rejected` is one the API just answered 401 to."""
+
+class OuraTokenAuth(OuraAuth):
+    """A fixed token: a personal access token, or the fresh OAuth token of a config flow."""
+
+    def __init__(self, access_token: str) -> None:
+        self._access_token = access_token
+
+    async def async_get_access_token(self, rejected: Optional[str] = None) -> str:
+        return self._access_token
+
+class OuraRefreshingAuth(OuraAuth):
+    """OAuth token refreshed ahead of expiry. Concurrent callers share one refresh, so a
+    burst of requests at expiry never spends the single-use refresh token twice."""
+
+    can_refresh = True
+
+    def __init__(self) -> None:
+        self._refresh_task: Optional[asyncio.Future] = None
+        self.refreshes = 0
+
+    @property
+    @abc.abstractmethod
+    def token(self) -> Dict[str, Any]:
+        """The current OAuth token, with `access_token` and `expires_at`."""
+
+    @abc.abstractmethod
+    async def _async_refresh_token(self, token: Dict[str, Any]) -> Dict[str, Any]:
+        """Exchange and store `token`, returning the new one."""
+
+    async def async_get_access_token(self, rejected: Optional[str] = None) -> str:
+        token = self.token
+        expires_at = token.get("expires_at")
+        # Short-lived tokens (test servers) are refreshed at half their lifetime instead
+        lifetime = token.get("expires_in")
+        margin = min(TOKEN_REFRESH_MARGIN_SEC, float(lifetime) / 2) if lifetime else TOKEN_REFRESH_MARGIN_SEC
+        expiring = expires_at is not None and float(expires_at) - time.time() < margin
+        if expiring or (rejected is not None and token.get("access_token") == rejected):
+            if self._refresh_task is None:
+                self._refresh_task = asyncio.ensure_future(self._async_refresh_once(token))
+            # Shielded: a caller cancelled mid-refresh must not cancel it for the others
+            token = await asyncio.shield(self._refresh_task)
+        return token["access_token"]
+
+    async def _async_refresh_once(self, token: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            new_token = await self._async_refresh_token(token)
+            self.refreshes += 1
+            return new_token
+        finally:
+            self._refresh_task = None
+
+class OuraOAuthAuth(OuraRefreshingAuth):
+    """Token of an OAuth config entry; refreshed tokens are written back to the entry."""
+
+    def __init__(self, session: OAuth2Session) -> None:
+        super().__init__()
         self._session = session
-        self._api_base = SANDBOX_API_BASE if use_sandbox else API_BASE
+
+    @property
+    def token(self) -> Dict[str, Any]:
+        return self._session.token
+
+    async def _async_refresh_token(self, token: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            new_token = await self._session.implementation.async_refresh_token(token)
+        except ClientResponseError as err:
+            if 400 <= err.status < 500:
+                raise ConfigEntryAuthFailed("Oura rejected the token refresh") from err
+            raise
+        entry = self._session.config_entry
+        self._session.hass.config_entries.async_update_entry(entry, data={**entry.data, "token": new_token})
+        return new_token
+
+class OuraApiClient:
+    def __init__(self, http: ClientSession, auth: OuraAuth, *, use_sandbox: bool = False,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 request_limiter: Optional[asyncio.Semaphore] = None, api_base: Optional[str] = None) -> None:
+        # Shared keep-alive pool (Home Assistant's client session): no handshake per request
+        self._http = http
+        self._auth = auth
+        # api_base points the client at another host, e.g. tools/mock_server.py
+        self._api_base = api_base or (SANDBOX_API_BASE if use_sandbox else API_BASE)
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        # Budget shared with other accounts; taken after the per-client slot so one
+        # account waiting on its own cap never holds global capacity
+        self._request_limiter = request_limiter
+        self._bucket = _TokenBucket(RATE_LIMIT_REQUESTS, RATE_LIMIT_PERIOD_SEC)
+        self.telemetry = OuraTelemetry()
 
     async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         url = f"{self._api_base}{path}"
-        resp = await self._session.async_request("get", url, params=params)
-        if resp.status >= 400:
-            text = await resp.text()
-            raise OuraApiError(f"GET {url} -> {resp.status}: {text}")
-        return await resp.json()
+        stats = self.telemetry.endpoint(path)
+        endpoint = endpoint_name(path)
+        attempt = 0
+        rejected: Optional[str] = None
+        while True:
+            token = await self._auth.async_get_access_token(rejected)
+            await self._bucket.acquire()
+            async with self._semaphore, self._request_limiter or contextlib.nullcontext():
+                started = time.monotonic()
+                try:
+                    async with self._http.get(
+                        url, params=params, headers={"Authorization": f"Bearer {token}"}
+                    ) as resp:
+                        body = await resp.read()
+                        status = resp.status
+                        retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
+                except Exception as err:
+                    stats.record(None, (time.monotonic() - started) * 1000, error=repr(err))
+                    raise
+                stats.record(status, (time.monotonic() - started) * 1000, len(body), None if status < 400 else f"HTTP {status}")
+                if status < 400:
+                    return project_payload(endpoint, json_loads(body))
+                text = body.decode(errors="replace")
+
+            if status == 401 and rejected is None and self._auth.can_refresh:
+                # Revoked or expired early (clock skew): one retry with a refreshed token
+                rejected = token
+                stats.retries += 1
+                continue
+            if status == 429 and retry_after is not None:
+                # The quota is per token: hold back every request of this client, not just this one
+                self._bucket.pause(retry_after)
+            if status in RETRY_STATUSES and attempt < MAX_RETRIES and (retry_after or 0) <= MAX_RETRY_WAIT_SEC:
+                delay = retry_after if retry_after is not None else _backoff_delay(attempt)
+                attempt += 1
+                stats.retries += 1
+                _LOGGER.debug("GET %s -> %s, retry %d/%d in %.1fs", path, status, attempt, MAX_RETRIES, delay)
+                await asyncio.sleep(delay)
+                continue
+            error = OuraRateLimitError if status == 429 else OuraApiError
+            raise error(f"GET {url} -> {status}: {text}", status=status)
+
+    async def iter_records(self, path: str, params: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the records of a collection endpoint, fetching one page at a time via `next_token`."""
+        params = dict(params or {})
+        while True:
+            page = await self._get(path, params)
+            for record in page.get("data") or []:
+                yield record
+            next_token = page.get("next_token")
+            if not next_token or next_token == params.get("next_token"):
+                return
+            params["next_token"] = next_token
+
+    async def get_collection(self, path: str, params: Optional[Dict[str, Any]] = None) -> OuraCollection:
+        """All pages of a collection endpoint merged into a single `{"data": [...]}` payload."""
+        return {"data": [record async for record in self.iter_records(path, params)], "next_token": None}
 
-    async def personal_info(self) -> Dict[str, Any]:
+    async def personal_info(self) -> PersonalInfo:
         return await self._get("/usercollection/personal_info")
 
-    async def ring_configuration(self) -> Dict[str, Any]:
-        return await self._get("/usercollection/ring_configuration")
+    async def ring_configuration(self) -> OuraCollection:
+        return await self.get_collection("/usercollection/ring_configuration")
 
-    async def rest_mode_period(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        return await self._get("/usercollection/rest_mode_period", {"start_date": start_date, "end_date": end_date})
+    async def heartrate(self, start_datetime: DateTimeLike, end_datetime: DateTimeLike) -> OuraCollection:
+        return await self.get_collection(
+            "/usercollection/heartrate", {"start_datetime": _iso(start_datetime), "end_datetime": _iso(end_datetime)}
+        )
 
-    async def daily_readiness(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        return await self._get("/usercollection/daily_readiness", {"start_date": start_date, "end_date": end_date})
+    async def rest_mode_period(self, start_date: DateLike, end_date: DateLike) -> OuraCollection:
+        return await self.get_collection("/usercollection/rest_mode_period", _date_range(start_date, end_date))
 
-    async def daily_sleep(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        return await self._get("/usercollection/daily_sleep", {"start_date": start_date, "end_date": end_date})
+    async def daily_readiness(self, start_date: DateLike, end_date: DateLike) -> OuraCollection:
+        return await self.get_collection("/usercollection/daily_readiness", _date_range(start_date, end_date))
 
-    async def daily_activity(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        return await self._get("/usercollection/daily_activity", {"start_date": start_date, "end_date": end_date})
+    async def daily_sleep(self, start_date: DateLike, end_date: DateLike) -> OuraCollection:
+        return await self.get_collection("/usercollection/daily_sleep", _date_range(start_date, end_date))
 
-    async def daily_spo2(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        return await self._get("/usercollection/daily_spo2", {"start_date": start_date, "end_date": end_date})
+    async def daily_activity(self, start_date: DateLike, end_date: DateLike) -> OuraCollection:
+        return await self.get_collection("/usercollection/daily_activity", _date_range(start_date, end_date))
 
-    async def daily_stress(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        return await self._get("/usercollection/daily_stress", {"start_date": start_date, "end_date": end_date})
+    async def daily_spo2(self, start_date: DateLike, end_date: DateLike) -> OuraCollection:
+        return await self.get_collection("/usercollection/daily_spo2", _date_range(start_date, end_date))
 
-    async def daily_resilience(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        return await self._get("/usercollection/daily_resilience", {"start_date": start_date, "end_date": end_date})
+    async def daily_stress(self, start_date: DateLike, end_date: DateLike) -> OuraCollection:
+        return await self.get_collection("/usercollection/daily_stress", _date_range(start_date, end_date))
 
-    async def heartrate(self, start_datetime: str, end_datetime: str) -> Dict[str, Any]:
-        return await self._get("/usercollection/heartrate", {"start_datetime": start_datetime, "end_datetime": end_datetime})
+    async def daily_resilience(self, start_date: DateLike, end_date: DateLike) -> OuraCollection:
+        return await self.get_collection("/usercollection/daily_resilience", _date_range(start_date, end_date))
 
-    async def workout(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        return await self._get("/usercollection/workout", {"start_date": start_date, "end_date": end_date})
+    async def workout(self, start_date: DateLike, end_date: DateLike) -> OuraCollection:
+        return await self.get_collection("/usercollection/workout", _date_range(start_date, end_date))
 
-    async def session(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        return await self._get("/usercollection/session", {"start_date": start_date, "end_date": end_date})
+    async def session(self, start_date: DateLike, end_date: DateLike) -> OuraCollection:
+        return await self.get_collection("/usercollection/session", _date_range(start_date, end_date))
 
-    async def sleep(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        return await self._get("/usercollection/sleep", {"start_date": start_date, "end_date": end_date})
+    async def sleep(self, start_date: DateLike, end_date: DateLike) -> OuraCollection:
+        return await self.get_collection("/usercollection/sleep", _date_range(start_date, end_date))
 
-    async def enhanced_tag(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        return await self._get("/usercollection/enhanced_tag", {"start_date": start_date, "end_date": end_date})
+    async def enhanced_tag(self, start_date: DateLike, end_date: DateLike) -> OuraCollection:
+        return await self.get_collection("/usercollection/enhanced_tag", _date_range(start_date, end_date))
 
-    async def vo2max(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        return await self._get("/usercollection/vo2max", {"start_date": start_date, "end_date": end_date})
+    async def vo2max(self, start_date: DateLike, end_date: DateLike) -> OuraCollection:
+        return await self.get_collection("/usercollection/vo2max", _date_range(start_date, end_date))
 
-    async def daily_cardiovascular_age(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        return await self._get("/usercollection/daily_cardiovascular_age", {"start_date": start_date, "end_date": end_date})
+    async def daily_cardiovascular_age(self, start_date: DateLike, end_date: DateLike) -> OuraCollection:
+        return await self.get_collection("/usercollection/daily_cardiovascular_age", _date_range(start_date, end_date))
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from aiohttp import ClientError
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import OuraApiClient, OuraApiError
+from .const import DOMAIN, STORAGE_VERSION, BACKFILL_CHUNK_DAYS, BACKFILL_CONCURRENCY
+from .statistics import DAILY_METRICS, daily_rows, import_statistics, pick_main_sleep, statistic_metadata
+
+_LOGGER = logging.getLogger(__name__)
+
+DayRange = Tuple[date, date]  # inclusive
+
+def _merge_ranges(ranges: List[DayRange]) -> List[DayRange]:
+    merged: List[DayRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+def _missing_ranges(start: date, end: date, done: List[DayRange]) -> Iterator[DayRange]:
+    cursor = start
+    for done_start, done_end in done:
+        if done_end < cursor:
+            continue
+        if done_start > end:
+            break
+        if done_start > cursor:
+            yield cursor, done_start - timedelta(days=1)
+        cursor = max(cursor, done_end + timedelta(days=1))
+    if cursor <= end:
+        yield cursor, end
+
+def _chunks(ranges: Iterator[DayRange], size: int) -> Iterator[DayRange]:
+    for start, end in ranges:
+        while start <= end:
+            chunk_end = min(end, start + timedelta(days=size - 1))
+            yield start, chunk_end
+            start = chunk_end + timedelta(days=1)
+
+class OuraBackfill:
+    """Imports daily Oura metrics for a date range into recorder long-term statistics.
+
+    Finished chunks are checkpointed, so an interrupted run resumes where it stopped and
+    days that were already imported are never fetched again."""
+
+    def __init__(self, hass: HomeAssistant, client: OuraApiClient, entry_id: str, user_key: str) -> None:
+        self.hass = hass
+        self._client = client
+        self._entry_id = entry_id
+        self._user_key = user_key
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.backfill.{entry_id}")
+        self._done: List[DayRange] = []
+        self._metadata = {m.key: statistic_metadata(user_key, m.key, m.name, m.unit) for m in DAILY_METRICS}
+
+    async def _async_load(self) -> None:
+        stored = await self._store.async_load() or {}
+        self._done = _merge_ranges([
+            (date.fromisoformat(start), date.fromisoformat(end)) for start, end in stored.get("done", [])
+        ])
+
+    def _checkpoint(self, chunk: DayRange) -> None:
+        self._done = _merge_ranges(self._done + [chunk])
+        self._store.async_delay_save(
+            lambda: {"done": [[s.isoformat(), e.isoformat()] for s, e in self._done]}, 1
+        )
+
+    async def _async_fetch_by_day(self, endpoint: str, start: date, end: date) -> Dict[str, dict]:
+        params = {"start_date": start.isoformat(), "end_date": end.isoformat()}
+        by_day: Dict[str, dict] = {}
+        async for record in self._client.iter_records(f"/usercollection/{endpoint}", params):
+            day = record.get("day") if isinstance(record, dict) else None
+            if not day:
+                continue
+            by_day[day] = pick_main_sleep(by_day.get(day), record) if endpoint == "sleep" else record
+        return by_day
+
+    async def _async_import_chunk(self, start: date, end: date) -> int:
+        endpoints = sorted({m.endpoint for m in DAILY_METRICS})
+        fetched = await asyncio.gather(*(self._async_fetch_by_day(ep, start, end) for ep in endpoints))
+        by_endpoint = dict(zip(endpoints, fetched))
+        imported = 0
+        for metric in DAILY_METRICS:
+            imported += import_statistics(
+                self.hass, self._metadata[metric.key], daily_rows(metric, by_endpoint[metric.endpoint])
+            )
+        return imported
+
+    async def async_run(self, start: date, end: Optional[date] = None) -> int:
+        """Backfill [start, end]; end defaults to yesterday since today is not final yet."""
+        yesterday = dt_util.now().date() - timedelta(days=1)
+        end = min(end or yesterday, yesterday)
+        if start > end:
+            return 0
+        await self._async_load()
+        # Lazily produced so multi-year ranges never materialize their chunk list
+        chunks = _chunks(_missing_ranges(start, end, list(self._done)), BACKFILL_CHUNK_DAYS)
+        imported = 0
+        failure: Optional[Exception] = None
+
+        async def _worker() -> None:
+            nonlocal imported, failure
+            for chunk_start, chunk_end in chunks:
+                if failure is not None:
+                    return
+                try:
+                    imported += await self._async_import_chunk(chunk_start, chunk_end)
+                except (OuraApiError, ClientError, asyncio.TimeoutError, ConfigEntryAuthFailed) as err:
+                    # Stops the other worker too: it finishes its chunk and takes no new one
+                    failure = failure or err
+                    return
+                except Exception as err:
+                    # Stops the run the same way instead of failing the service task
+                    _LOGGER.exception("Unexpected error importing Oura backfill %s..%s", chunk_start, chunk_end)
+                    failure = failure or err
+                    return
+                self._checkpoint((chunk_start, chunk_end))
+                _LOGGER.debug("Oura backfill imported %s..%s", chunk_start, chunk_end)
+
+        await asyncio.gather(*(_worker() for _ in range(BACKFILL_CONCURRENCY)))
+        if isinstance(failure, ConfigEntryAuthFailed):
+            _LOGGER.warning(
+                "Oura backfill of %s..%s stopped after %d statistic rows, Oura rejected the token: %s. "
+                "Reauthenticate, then run it again to resume", start, end, imported, failure,
+            )
+            if (entry := self.hass.config_entries.async_get_entry(self._entry_id)) is not None:
+                entry.async_start_reauth(self.hass)
+            return imported
+        if failure is not None:
+            _LOGGER.warning(
+                "Oura backfill of %s..%s stopped after %d statistic rows: %s. Run it again to resume; "
+                "imported days are checkpointed", start, end, imported, failure,
+            )
+            return imported
+        _LOGGER.info("Oura backfill of %s..%s finished, %d statistic rows imported", start, end, imported)
+        return imported
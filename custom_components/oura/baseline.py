@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import math
+from collections import deque
+from datetime import date
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .const import BASELINE_METRICS, BASELINE_WINDOWS
+from .statistics import DAILY_METRICS
+
+# (mean, standard deviation, days in the window)
+BaselineStats = Tuple[Optional[float], Optional[float], int]
+
+class RollingWindow:
+    """Mean and variance of the values of the last `days` days, from running sums.
+
+    Days are pushed in order; pushing evicts the days that fell out of the window, so each
+    day is added and removed exactly once."""
+
+    __slots__ = ("days", "_values", "_sum", "_sumsq")
+
+    def __init__(self, days: int) -> None:
+        self.days = days
+        self._values: deque = deque()  # (day ordinal, value)
+        self._sum = 0.0
+        self._sumsq = 0.0
+
+    def push(self, ordinal: int, value: float) -> None:
+        self._values.append((ordinal, value))
+        self._sum += value
+        self._sumsq += value * value
+        self.advance(ordinal + 1)
+
+    def advance(self, ordinal: int) -> None:
+        """Drop days before the `days` days that precede day `ordinal`."""
+        while self._values and self._values[0][0] < ordinal - self.days:
+            _, value = self._values.popleft()
+            self._sum -= value
+            self._sumsq -= value * value
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def stats(self) -> BaselineStats:
+        count = len(self._values)
+        if not count:
+            return None, None, 0
+        mean = self._sum / count
+        # Running sums can drift a hair below zero for a constant series
+        var = max(0.0, self._sumsq / count - mean * mean)
+        return mean, math.sqrt(var), count
+
+class OuraBaselines:
+    """7/14/30-day baselines of the DAILY_METRICS listed in BASELINE_METRICS.
+
+    Fed only with days the day store has finalized, oldest first, so an update costs
+    O(1) per metric and window whatever the window length."""
+
+    def __init__(self) -> None:
+        self._metrics = [m for m in DAILY_METRICS if m.key in BASELINE_METRICS]
+        self._windows: Dict[str, Dict[int, RollingWindow]] = {
+            m.key: {days: RollingWindow(days) for days in BASELINE_WINDOWS} for m in self._metrics
+        }
+        self._last: Dict[str, int] = {}
+
+    def ingest(self, endpoint: str, finalized: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        for day, record in finalized:
+            ordinal = date.fromisoformat(day).toordinal()
+            for metric in self._metrics:
+                if metric.endpoint != endpoint or ordinal <= self._last.get(metric.key, 0):
+                    continue
+                value = metric.value_fn(record)
+                if not isinstance(value, (int, float)) or isinstance(value, bool):
+                    continue
+                self._last[metric.key] = ordinal
+                for window in self._windows[metric.key].values():
+                    window.push(ordinal, float(value))
+
+    def stats(self, today: str) -> Dict[str, Dict[int, BaselineStats]]:
+        """Per metric and window length, over the days before `today`."""
+        ordinal = date.fromisoformat(today).toordinal()
+        result: Dict[str, Dict[int, BaselineStats]] = {}
+        for key, windows in self._windows.items():
+            result[key] = {}
+            for days, window in windows.items():
+                window.advance(ordinal)
+                result[key][days] = window.stats()
+        return result
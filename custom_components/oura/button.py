@@ -30,4 +30,4 @@ class OuraRefreshButton(CoordinatorEntity[OuraData], ButtonEntity):
         self._attr_device_info = device_info
 
     async def async_press(self) -> None:
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_coalesced(force=True)
@@ -2,16 +2,38 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
+import voluptuous as vol
+from aiohttp import ClientError
+
 from homeassistant import config_entries
+from homeassistant.const import CONF_ACCESS_TOKEN
 from homeassistant.core import callback
 from homeassistant.helpers import config_entry_oauth2_flow
-
-from .const import DOMAIN as OURA_DOMAIN, OAUTH_SCOPES_DEFAULT
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    DOMAIN as OURA_DOMAIN,
+    OAUTH_SCOPES_DEFAULT,
+    CONF_TTL_STATIC,
+    CONF_TTL_DAILY,
+    CONF_TTL_HEARTRATE,
+    DEFAULT_TIER_TTLS,
+    CONF_MAX_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENCY,
+    CONF_USE_WEBHOOKS,
+    CONF_HR_STATISTICS,
+    CONF_ADAPTIVE_POLLING,
+)
+from .api import OuraApiClient, OuraApiError, OuraTokenAuth, PersonalInfo
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entry data written by either way of signing in
+_AUTH_KEYS = ("auth_implementation", "token", CONF_ACCESS_TOKEN)
+
 class OAuth2FlowHandler(config_entry_oauth2_flow.AbstractOAuth2FlowHandler, domain=OURA_DOMAIN):
     """Config flow to handle Oura OAuth2."""
 
@@ -26,31 +48,67 @@ class OAuth2FlowHandler(config_entry_oauth2_flow.AbstractOAuth2FlowHandler, doma
     def logger(self) -> logging.Logger:
         return _LOGGER
 
+    async def async_step_user(self, user_input: dict[str, Any] | None = None):
+        return self.async_show_menu(step_id="user", menu_options=["pick_implementation", "personal_access_token"])
+
+    async def async_step_personal_access_token(self, user_input: dict[str, Any] | None = None):
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            token = user_input[CONF_ACCESS_TOKEN].strip()
+            try:
+                info = await self._async_personal_info(token)
+            except OuraApiError as err:
+                errors["base"] = "invalid_auth" if err.status in (401, 403) else "cannot_connect"
+            except ClientError:
+                errors["base"] = "cannot_connect"
+            else:
+                return await self._async_finish({CONF_ACCESS_TOKEN: token}, info)
+        return self.async_show_form(
+            step_id="personal_access_token",
+            data_schema=vol.Schema({vol.Required(CONF_ACCESS_TOKEN): str}),
+            errors=errors,
+        )
+
     async def async_oauth_create_entry(self, data: dict[str, Any]) -> config_entries.ConfigEntry:
         """Create the config entry after OAuth finished."""
-        implementation = self.flow_impl
-        session = config_entry_oauth2_flow.OAuth2Session(self.hass, data, implementation)
-
-        title = "Oura V2"
-        unique_id: str | None = None
         try:
-            resp = await session.async_request("get", "https://api.ouraring.com/v2/usercollection/personal_info")
-            js = await resp.json()
-            uid = js.get("id") or js.get("email")
-            if uid:
-                unique_id = str(uid).lower()
-        except Exception:
-            pass
+            info = await self._async_personal_info(data["token"]["access_token"])
+        except (OuraApiError, ClientError) as err:
+            _LOGGER.debug("Could not read Oura personal info: %s", err)
+            info = {}
+        return await self._async_finish(data, info)
+
+    async def _async_personal_info(self, access_token: str) -> PersonalInfo:
+        client = OuraApiClient(async_get_clientsession(self.hass), OuraTokenAuth(access_token))
+        return await client.personal_info()
+
+    async def _async_finish(self, data: dict[str, Any], info: PersonalInfo):
+        uid = info.get("id") or info.get("email")
+        unique_id = str(uid).lower() if uid else None
+
+        if self.reauth_entry is not None:
+            if unique_id and self.reauth_entry.unique_id and unique_id != self.reauth_entry.unique_id:
+                return self.async_abort(reason="wrong_account")
+            # Credentials of either kind replace the old ones; webhook state is kept
+            kept = {k: v for k, v in self.reauth_entry.data.items() if k not in _AUTH_KEYS}
+            return self.async_update_reload_and_abort(self.reauth_entry, data={**kept, **data})
 
         if unique_id:
             await self.async_set_unique_id(unique_id)
             self._abort_if_unique_id_configured()
 
-        return self.async_create_entry(title=title, data=data)
+        return self.async_create_entry(title="Oura V2", data=data)
 
-    async def async_step_reauth(self, user_input: dict[str, Any] | None = None):
+    async def async_step_reauth(self, entry_data: Mapping[str, Any]):
         self.reauth_entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
-        return await super().async_step_reauth(user_input)
+        if CONF_ACCESS_TOKEN in entry_data:
+            return await self.async_step_personal_access_token()
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(self, user_input: dict[str, Any] | None = None):
+        if user_input is None:
+            return self.async_show_form(step_id="reauth_confirm")
+        return await self.async_step_pick_implementation()
 
     @staticmethod
     @callback
@@ -62,7 +120,6 @@ class OuraOptionsFlow(config_entries.OptionsFlow):
         self._entry = entry
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
-        import voluptuous as vol
         from homeassistant.const import CONF_SCAN_INTERVAL
 
         if user_input is not None:
@@ -71,6 +128,13 @@ class OuraOptionsFlow(config_entries.OptionsFlow):
         options = self._entry.options
         schema = vol.Schema({
             vol.Optional(CONF_SCAN_INTERVAL, default=options.get(CONF_SCAN_INTERVAL, 1800)): int,
+            vol.Optional(CONF_TTL_STATIC, default=options.get(CONF_TTL_STATIC, DEFAULT_TIER_TTLS[CONF_TTL_STATIC])): int,
+            vol.Optional(CONF_TTL_DAILY, default=options.get(CONF_TTL_DAILY, DEFAULT_TIER_TTLS[CONF_TTL_DAILY])): int,
+            vol.Optional(CONF_TTL_HEARTRATE, default=options.get(CONF_TTL_HEARTRATE, DEFAULT_TIER_TTLS[CONF_TTL_HEARTRATE])): int,
+            vol.Optional(CONF_MAX_CONCURRENCY, default=options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY)): vol.All(int, vol.Range(min=1, max=16)),
+            vol.Optional(CONF_USE_WEBHOOKS, default=options.get(CONF_USE_WEBHOOKS, False)): bool,
+            vol.Optional(CONF_HR_STATISTICS, default=options.get(CONF_HR_STATISTICS, True)): bool,
+            vol.Optional(CONF_ADAPTIVE_POLLING, default=options.get(CONF_ADAPTIVE_POLLING, False)): bool,
         })
         return self.async_show_form(step_id="init", data_schema=schema)
 
@@ -11,6 +11,66 @@ SANDBOX_API_BASE = "https://api.ouraring.com/v2/sandbox"
 
 DEFAULT_UPDATE_INTERVAL_MIN = 30
 
+# Request engine: Oura allows 5000 requests per 5 minutes per access token
+CONF_MAX_CONCURRENCY = "max_concurrency"
+DEFAULT_MAX_CONCURRENCY = 4
+RATE_LIMIT_REQUESTS = 5000
+RATE_LIMIT_PERIOD_SEC = 300
+MAX_RETRIES = 3
+BACKOFF_BASE_SEC = 1.0
+BACKOFF_MAX_SEC = 30.0
+# A Retry-After longer than this fails fast instead of stalling the refresh
+MAX_RETRY_WAIT_SEC = 60.0
+
+# OAuth access tokens are refreshed this long before they expire
+TOKEN_REFRESH_MARGIN_SEC = 300
+
+# Domain-wide scheduler: requests in flight across all accounts, and the window
+# over which accounts restored from cache spread their first refresh
+GLOBAL_MAX_IN_FLIGHT = 8
+STARTUP_STAGGER_SEC = 120
+# A forced refresh (button/service) this soon after the last one returns its result instead
+FORCED_REFRESH_MIN_INTERVAL_SEC = 60
+
+# Opt-in adaptive polling: fast polls inside each account's learned wake/sync window until
+# today's scores arrive, idle pace otherwise; learned from the last ADAPTIVE_HISTORY_DAYS days
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+ADAPTIVE_FAST_INTERVAL_SEC = 300
+ADAPTIVE_IDLE_INTERVAL_SEC = 2 * 3600
+ADAPTIVE_HISTORY_DAYS = 14
+ADAPTIVE_MIN_OBSERVATIONS = 3
+ADAPTIVE_WINDOW_MARGIN_MIN = 30
+
+# Daily records kept per endpoint and day (covers the 30-day baselines)
+DAYSTORE_RETENTION_DAYS = 35
+
+# Rolling baselines: DAILY_METRICS keys averaged over each window length (days)
+BASELINE_METRICS = ("hrv", "resting_heart_rate", "readiness_score", "sleep_score", "temperature_deviation")
+BASELINE_WINDOWS = (7, 14, 30)
+
+# Persisted coordinator cache (homeassistant.helpers.storage)
+STORAGE_VERSION = 1
+CACHE_SAVE_DELAY = 10
+
+# oura.backfill service: days per API window and windows fetched in parallel
+BACKFILL_CHUNK_DAYS = 30
+BACKFILL_CONCURRENCY = 2
+
+# Rolling heart-rate buffer kept by the coordinator
+HR_WINDOW_HOURS = 30
+HR_OVERLAP_MIN = 15
+
+# Hourly heart-rate statistics; gaps left by downtime are re-fetched in chunks
+CONF_HR_STATISTICS = "hr_statistics"
+HR_GAP_CHUNK_HOURS = 24
+HR_GAP_CONCURRENCY = 3
+HR_GAP_MAX_DAYS = 30
+
+# Request telemetry: latency histogram bucket upper bounds, and the dispatcher signal
+# (formatted with the entry id) sent after every refresh
+TELEMETRY_LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10000)
+SIGNAL_TELEMETRY = "oura_telemetry_{}"
+
 OAUTH_SCOPES_DEFAULT = [
     "email",
     "personal",
@@ -23,3 +83,74 @@ OAUTH_SCOPES_DEFAULT = [
 ]
 
 CONF_USE_SANDBOX = "use_sandbox"
+
+# Endpoint capability: feature-gated endpoints answer 401/403/404 and are skipped,
+# then re-probed after a backoff that doubles up to the maximum
+CAPABILITY_RECHECK_SEC = 6 * 3600
+CAPABILITY_RECHECK_MAX_SEC = 7 * 24 * 3600
+# OAuth scopes that grant an endpoint, any one of them (spellings differ between the
+# docs and issued tokens); endpoints not listed only need "daily"
+ENDPOINT_SCOPES = {
+    "personal_info": ("personal",),
+    "heartrate": ("heartrate",),
+    "workout": ("workout",),
+    "session": ("session",),
+    "enhanced_tag": ("tag",),
+    "daily_spo2": ("spo2", "spo2Daily"),
+}
+
+# Per-endpoint refresh tiers; each endpoint is only re-fetched once its tier TTL expired
+CONF_TTL_STATIC = "ttl_static"
+CONF_TTL_DAILY = "ttl_daily"
+CONF_TTL_HEARTRATE = "ttl_heartrate"
+
+DEFAULT_TIER_TTLS = {
+    CONF_TTL_STATIC: 24 * 3600,
+    CONF_TTL_DAILY: 3600,
+    CONF_TTL_HEARTRATE: 300,
+}
+
+ENDPOINT_TIERS = {
+    "personal_info": CONF_TTL_STATIC,
+    "ring_configuration": CONF_TTL_STATIC,
+    "rest_mode_period": CONF_TTL_DAILY,
+    "daily_readiness": CONF_TTL_DAILY,
+    "daily_sleep": CONF_TTL_DAILY,
+    "daily_activity": CONF_TTL_DAILY,
+    "daily_spo2": CONF_TTL_DAILY,
+    "daily_stress": CONF_TTL_DAILY,
+    "daily_resilience": CONF_TTL_DAILY,
+    "heartrate": CONF_TTL_HEARTRATE,
+    "workout": CONF_TTL_DAILY,
+    "session": CONF_TTL_DAILY,
+    "sleep": CONF_TTL_DAILY,
+    "enhanced_tag": CONF_TTL_DAILY,
+    "vo2max": CONF_TTL_DAILY,
+    "daily_cardiovascular_age": CONF_TTL_DAILY,
+}
+
+# Webhook push updates (Oura v2 webhook subscriptions)
+CONF_USE_WEBHOOKS = "use_webhooks"
+CONF_WEBHOOK_VERIFICATION_TOKEN = "webhook_verification_token"
+WEBHOOK_SUBSCRIPTION_PATH = "/webhook/subscription"
+WEBHOOK_EVENT_TYPES = ("create", "update")
+# Oura data types that can be pushed; they share their name with the coordinator endpoint
+WEBHOOK_DATA_TYPES = (
+    "daily_readiness",
+    "daily_sleep",
+    "daily_activity",
+    "daily_spo2",
+    "daily_stress",
+    "sleep",
+    "workout",
+    "session",
+    "enhanced_tag",
+    "rest_mode_period",
+    "ring_configuration",
+)
+# Pushed endpoints are still polled, but only this rarely, in case a notification is lost
+WEBHOOK_FALLBACK_TTL_SEC = 6 * 3600
+# A sync pushes several data types within seconds; they are refreshed together
+WEBHOOK_DEBOUNCE_SEC = 5
+WEBHOOK_RENEW_INTERVAL_HOURS = 24
+WEBHOOK_RENEW_BEFORE_DAYS = 7
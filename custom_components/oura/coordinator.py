@@ -2,21 +2,62 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .api import OuraApiClient, OuraApiError
+from .adaptive import WATCH_ENDPOINTS
+from .baseline import OuraBaselines
+from .daystore import DAILY_ENDPOINTS, DAY_KEYED_ENDPOINTS, OuraDayStore
+from .api import OuraApiClient, OuraApiError, OuraRateLimitError, json_dumps_sorted, project_payload
+from .heartrate import HeartRateSeries, samples_from_records
+from .snapshot import OuraSnapshot
+from .const import (
+    DOMAIN,
+    DEFAULT_TIER_TTLS,
+    ENDPOINT_TIERS,
+    HR_WINDOW_HOURS,
+    HR_OVERLAP_MIN,
+    STORAGE_VERSION,
+    CACHE_SAVE_DELAY,
+    SIGNAL_TELEMETRY,
+    CAPABILITY_RECHECK_SEC,
+    CAPABILITY_RECHECK_MAX_SEC,
+    ENDPOINT_SCOPES,
+    FORCED_REFRESH_MIN_INTERVAL_SEC,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
+ENDPOINTS = tuple(ENDPOINT_TIERS)
+_UNWINDOWED_ENDPOINTS = ("personal_info", "ring_configuration")
+# Absorbs scheduling jitter so a TTL equal to a multiple of the scan interval still fires on that tick
+_TTL_SLACK = timedelta(seconds=60)
+# Statuses meaning "not for this account" rather than a transient failure
+_CAPABILITY_STATUSES = frozenset({401, 403, 404})
+
+# Identity equality: with always_update=False the coordinator only notifies listeners
+# when _async_update_data hands back a new object, never after a deep compare.
+@dataclass(eq=False)
 class OuraData:
     payloads: Dict[str, Any]
+    days: Optional[OuraDayStore] = field(default=None, repr=False)
+    baselines: Optional[OuraBaselines] = field(default=None, repr=False)
+    snapshot: Optional[OuraSnapshot] = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        # Derived once per update; sensors only read fields from it
+        if self.snapshot is None:
+            self.snapshot = OuraSnapshot(self.payloads, days=self.days, baselines=self.baselines)
 
 def _today_dates():
     now = datetime.now(timezone.utc).astimezone()
@@ -24,65 +65,380 @@ def _today_dates():
     yesterday = today - timedelta(days=1)
     return yesterday.isoformat(), today.isoformat(), now
 
+def _parse_ts(value) -> Optional[datetime]:
+    try:
+        ts = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+def endpoint_ttls(options) -> Dict[str, int]:
+    """Resolve per-endpoint TTLs (seconds) from the tier values stored in entry options."""
+    return {key: int(options.get(tier, DEFAULT_TIER_TTLS[tier])) for key, tier in ENDPOINT_TIERS.items()}
+
+def _fingerprint(payload: Any) -> str:
+    # The heart-rate series is updated in place; its version counts every change
+    if isinstance(payload, HeartRateSeries):
+        return f"v{payload.version}"
+    return hashlib.blake2b(json_dumps_sorted(payload), digest_size=16).hexdigest()
+
+def _cache_store(hass: HomeAssistant, entry_id: str) -> Store:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+async def async_remove_cache(hass: HomeAssistant, entry_id: str) -> None:
+    await _cache_store(hass, entry_id).async_remove()
+
 class OuraDataUpdateCoordinator(DataUpdateCoordinator[OuraData]):
-    def __init__(self, hass: HomeAssistant, client: OuraApiClient, update_interval: timedelta, title: str, entry_id: str) -> None:
-        super().__init__(hass, _LOGGER, name=title, update_interval=update_interval)
+    def __init__(self, hass: HomeAssistant, client: OuraApiClient, update_interval: timedelta, title: str, entry_id: str,
+                 endpoint_ttls: Optional[Dict[str, int]] = None, granted_scopes: Optional[Iterable[str]] = None) -> None:
+        # Polling is driven by the domain-wide OuraRefreshScheduler, which staggers accounts
+        super().__init__(hass, _LOGGER, name=title, update_interval=None, always_update=False)
+        self.poll_interval = update_interval
         self._client = client
         self.entry_id = entry_id  # for unique_id prefixes
+        self._endpoint_ttls = dict(endpoint_ttls or {})
+        self._fetched_at: Dict[str, datetime] = {}
+        # Endpoints that answered at least once; unlike _fetched_at, never invalidated
+        self._succeeded: set = set()
+        self._window_end_date: Optional[str] = None
+        self._store = _cache_store(hass, entry_id)
+        self._fingerprints: Dict[str, str] = {}
+        # Optional OuraHeartRateHistory fed from the rolling heart-rate series
+        self.hr_history = None
+        # Optional OuraAdaptivePolling that sets poll_interval after every refresh
+        self.adaptive = None
+        # Endpoints that changed in the update being dispatched; None wakes every listener
+        self._changed_endpoints: Optional[frozenset] = None
+        self.updates_applied = 0
+        self.updates_skipped = 0
+        # Daily records by day; past days that can no longer change are not fetched again
+        self.days = OuraDayStore()
+        # Rolling baselines, fed with the days the store finalizes
+        self.baselines = OuraBaselines()
+        # Rolling heart-rate window; also what payloads["heartrate"] holds
+        self._hr_series = HeartRateSeries()
+        # Endpoints the token seems to lack a scope for (None: scopes unknown). Only a hint:
+        # they start out unavailable and are re-probed like feature-gated endpoints
+        granted = None if granted_scopes is None else set(granted_scopes)
+        self._scope_missing = frozenset(
+            key for key in ENDPOINTS
+            if granted is not None and granted.isdisjoint(ENDPOINT_SCOPES.get(key, ("daily",)))
+        )
+        # Feature-gated endpoints: key -> (re-probe time, consecutive denials)
+        self._unavailable: Dict[str, Tuple[datetime, int]] = {}
+        self._seed_scope_missing()
+        # Endpoints backing enabled entities; None polls everything
+        self._required: Optional[frozenset] = None
+        # Coalesced refresh in flight, the endpoints it was started to cover, and when the
+        # last one finished
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_covers: frozenset = frozenset()
+        self._refresh_done: Optional[Tuple[float, frozenset]] = None
+        self.refreshes_joined = 0
+
+    async def async_load_cache(self) -> bool:
+        """Serve the last persisted payloads; returns False when there is nothing to restore."""
+        stored = await self._store.async_load()
+        if not isinstance(stored, dict) or not stored.get("payloads"):
+            return False
+        # Caches written before field projection still carry the dropped sample arrays
+        payloads: Dict[str, Any] = {key: project_payload(key, value) for key, value in stored["payloads"].items()}
+        self._fetched_at = {
+            key: ts for key, value in (stored.get("fetched_at") or {}).items() if (ts := _parse_ts(value))
+        }
+        self._window_end_date = stored.get("window_end_date")
+        # Caches from before "succeeded" was stored: whatever they hold was fetched once
+        self._succeeded = set(stored.get("succeeded") or [*self._fetched_at, *payloads])
+        if self.adaptive is not None:
+            self.adaptive.load(stored.get("adaptive"))
+        self._unavailable = {
+            key: (ts, int(strikes)) for key, (retry_at, strikes) in (stored.get("unavailable") or {}).items()
+            if (ts := _parse_ts(retry_at))
+        }
+        self._seed_scope_missing()
+        if "heartrate" in payloads:
+            # Older caches hold the API-shaped {"data": [...]} list
+            self._hr_series = payloads["heartrate"] = HeartRateSeries.from_payload(payloads["heartrate"])
+        # Caches from before the day store only hold the last yesterday-today window
+        self.days = OuraDayStore.from_dict(stored["days"]) if stored.get("days") else OuraDayStore.from_payloads(payloads)
+        self.baselines = OuraBaselines()
+        for key in DAY_KEYED_ENDPOINTS:
+            self.baselines.ingest(key, self.days.final_days(key))
+        self._fingerprints = {key: _fingerprint(payload) for key, payload in payloads.items()}
+        self._changed_endpoints = None
+        self.async_set_updated_data(OuraData(payloads=payloads, days=self.days, baselines=self.baselines))
+        return True
+
+    def diagnostics(self) -> Dict[str, Any]:
+        return {
+            "last_update_success": self.last_update_success,
+            "poll_interval_sec": self.poll_interval.total_seconds(),
+            "updates_applied": self.updates_applied,
+            "updates_skipped": self.updates_skipped,
+            "refreshes_joined": self.refreshes_joined,
+            "endpoint_ttls": self._endpoint_ttls,
+            "fetched_at": {key: ts.isoformat() for key, ts in self._fetched_at.items()},
+            "payload_keys": sorted(self.data.payloads) if self.data else [],
+            "heartrate_samples": len(self._hr_series),
+            "days": self.days.diagnostics(),
+            "required_endpoints": sorted(self._required) if self._required is not None else None,
+            "scope_missing": sorted(self._scope_missing),
+            "unavailable_endpoints": {
+                key: {"recheck_at": retry_at.isoformat(), "denials": strikes}
+                for key, (retry_at, strikes) in self._unavailable.items()
+            },
+            "adaptive": self.adaptive.diagnostics(*_today_dates()[1:]) if self.adaptive is not None else None,
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Only wake listeners whose endpoint context intersects the endpoints that changed."""
+        changed, self._changed_endpoints = self._changed_endpoints, None
+        if changed is None or not self.last_update_success:
+            super().async_update_listeners()
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    def _cache_data(self) -> Dict[str, Any]:
+        payloads = dict(self.data.payloads) if self.data else {}
+        if isinstance(payloads.get("heartrate"), HeartRateSeries):
+            payloads["heartrate"] = payloads["heartrate"].as_dict()
+        return {
+            "payloads": payloads,
+            "fetched_at": {key: ts.isoformat() for key, ts in self._fetched_at.items()},
+            "succeeded": sorted(self._succeeded),
+            "window_end_date": self._window_end_date,
+            "unavailable": {key: [ts.isoformat(), strikes] for key, (ts, strikes) in self._unavailable.items()},
+            "adaptive": self.adaptive.as_dict() if self.adaptive is not None else None,
+            "days": self.days.as_dict(),
+        }
+
+    def _heartrate_fetch_start(self, now: datetime) -> datetime:
+        """Only ask for samples newer than the series holds, minus a small overlap for late syncs."""
+        window_start = now - timedelta(hours=HR_WINDOW_HOURS)
+        latest = self._hr_series.latest_time
+        if latest is None:
+            return window_start
+        return max(window_start, latest - timedelta(minutes=HR_OVERLAP_MIN))
+
+    def _merge_heartrate(self, payload: Optional[Dict[str, Any]], fetch_start: datetime, now: datetime) -> HeartRateSeries:
+        window_start = int((now - timedelta(hours=HR_WINDOW_HOURS)).timestamp())
+        # Evicted even when the fetch failed, so aged-out samples leave the window
+        self._hr_series.evict_before(window_start)
+        if payload is not None:
+            # The overlap region is replaced by what the API returned for it
+            fresh = [s for s in samples_from_records(payload.get("data") or []) if s[0] >= window_start]
+            self._hr_series.replace_from(int(fetch_start.timestamp()), fresh)
+        return self._hr_series
+
+    def endpoint_available(self, key: str) -> bool:
+        """False for endpoints this account has no scope or feature for."""
+        return key not in self._unavailable
+
+    def _seed_scope_missing(self) -> None:
+        """Start endpoints without a granted scope as unavailable, unless already tracked."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=CAPABILITY_RECHECK_SEC)
+        for key in self._scope_missing:
+            self._unavailable.setdefault(key, (retry_at, 1))
+
+    def _mark_unavailable(self, key: str, status: int, now: datetime) -> None:
+        strikes = self._unavailable.get(key, (now, 0))[1] + 1
+        backoff = min(CAPABILITY_RECHECK_MAX_SEC, CAPABILITY_RECHECK_SEC * 2 ** (strikes - 1))
+        self._unavailable[key] = (now + timedelta(seconds=backoff), strikes)
+        log = _LOGGER.info if strikes == 1 else _LOGGER.debug
+        log("Oura endpoint %s is not available for this account (HTTP %s), re-checking in %s",
+            key, status, timedelta(seconds=backoff))
+
+    def set_required_endpoints(self, keys: Optional[Iterable[str]]) -> frozenset:
+        """Only poll `keys` (None: every endpoint); returns the endpoints that became required."""
+        before = frozenset(ENDPOINTS) if self._required is None else self._required
+        self._required = None if keys is None else frozenset(keys)
+        added = (frozenset(ENDPOINTS) if self._required is None else self._required) - before
+        self.invalidate(added)
+        return added
+
+    def _is_due(self, key: str, now: datetime) -> bool:
+        if self._required is not None and key not in self._required:
+            return False
+        unavailable = self._unavailable.get(key)
+        if unavailable is not None:
+            return now >= unavailable[0]
+        fetched_at = self._fetched_at.get(key)
+        if fetched_at is None:
+            return True
+        return now - fetched_at + _TTL_SLACK >= timedelta(seconds=self._endpoint_ttls.get(key, 0))
+
+    def use_push_for(self, keys: Iterable[str], fallback_ttl: int) -> None:
+        """Endpoints kept fresh by push notifications only need an occasional safety poll."""
+        for key in keys:
+            if key in self._endpoint_ttls:
+                self._endpoint_ttls[key] = max(self._endpoint_ttls[key], fallback_ttl)
+
+    def invalidate(self, keys: Optional[Iterable[str]] = None) -> None:
+        """Force the given endpoints (default: all) to be fetched on the next refresh."""
+        if keys is None:
+            self._fetched_at.clear()
+            return
+        for key in keys:
+            self._fetched_at.pop(key, None)
+
+    async def async_refresh_coalesced(self, keys: Optional[Iterable[str]] = None, *, force: bool = False) -> bool:
+        """Refresh now, re-fetching `keys` (every endpoint with force), joining a refresh already
+        in flight that covers them instead of starting another. Returns True when joined."""
+        wanted = frozenset(ENDPOINTS) if force else frozenset(keys or ())
+        task = self._refresh_task
+        if task is not None and not task.done():
+            await asyncio.shield(task)
+            if wanted <= self._refresh_covers:
+                self.refreshes_joined += 1
+                return True
+            # Started before these endpoints were invalidated: follow up with a new one
+            return await self.async_refresh_coalesced(wanted)
+        if force and self._refresh_done is not None:
+            done_at, covered = self._refresh_done
+            if wanted <= covered and time.monotonic() - done_at < FORCED_REFRESH_MIN_INTERVAL_SEC:
+                self.refreshes_joined += 1
+                return True
+        self.invalidate(wanted)
+        self._refresh_covers = wanted
+        self._refresh_task = self.hass.async_create_task(self._async_coalesced_run(wanted), f"oura_refresh_{self.entry_id}")
+        await asyncio.shield(self._refresh_task)
+        return False
+
+    async def _async_coalesced_run(self, covers: frozenset) -> None:
+        await self.async_refresh()
+        self._refresh_done = (time.monotonic(), covers if self.last_update_success else frozenset())
+
+    async def async_shutdown(self) -> None:
+        """Also cancel a coalesced refresh in flight; its client and store are going away."""
+        await super().async_shutdown()
+        task, self._refresh_task = self._refresh_task, None
+        if task is not None and not task.done():
+            task.cancel()
+
+    def _endpoint_call(self, key: str, start_date: str, end_date: str, start_dt: str, end_dt: str):
+        fetch = getattr(self._client, key)
+        if key in _UNWINDOWED_ENDPOINTS:
+            return fetch()
+        if key == "heartrate":
+            return fetch(start_dt, end_dt)
+        return fetch(start_date, end_date)
 
     async def _async_update_data(self) -> OuraData:
+        started = time.monotonic()
+        try:
+            return await self._async_poll()
+        finally:
+            self._client.telemetry.record_refresh(time.monotonic() - started)
+            async_dispatcher_send(self.hass, SIGNAL_TELEMETRY.format(self.entry_id))
+
+    async def _async_poll(self) -> OuraData:
         start_date, end_date, now = _today_dates()
-        start_dt = (now - timedelta(hours=30)).isoformat(timespec="seconds")
+        hr_fetch_start = self._heartrate_fetch_start(now)
+        start_dt = hr_fetch_start.isoformat(timespec="seconds")
         end_dt = now.isoformat(timespec="seconds")
 
+        day_rolled = self._window_end_date != end_date
+        if day_rolled:
+            # The yesterday/today window moved: every date-windowed endpoint is stale
+            self.invalidate(k for k in ENDPOINTS if k not in _UNWINDOWED_ENDPOINTS)
+            self._window_end_date = end_date
+        if self.adaptive is not None and self.adaptive.watching(end_date, now):
+            # Waiting for today's scores: ask for them on every poll, whatever their TTL
+            self.invalidate(WATCH_ENDPOINTS)
+
+        denied: Dict[str, int] = {}
+
         async def _fetch_safely(coro, key: str):
             try:
                 return await coro
+            except ConfigEntryAuthFailed:
+                raise
+            except OuraRateLimitError as err:
+                _LOGGER.warning("Rate limited fetching %s, keeping previous data: %s", key, err)
+                return None
             except OuraApiError as err:
+                if err.status in _CAPABILITY_STATUSES:
+                    denied[key] = err.status
                 _LOGGER.debug("Endpoint %s unavailable: %s", key, err)
                 return None
             except Exception as err:
                 _LOGGER.warning("Unexpected error fetching %s: %s", key, err)
                 return None
 
-        (personal_info, ring_configuration, rest_mode_period, daily_readiness, daily_sleep,
-         daily_activity, daily_spo2, daily_stress, daily_resilience, heartrate, workout,
-         session, sleep, enhanced_tag, vo2max, daily_cardiovascular_age) = await asyncio.gather(
-            _fetch_safely(self._client.personal_info(), "personal_info"),
-            _fetch_safely(self._client.ring_configuration(), "ring_configuration"),
-            _fetch_safely(self._client.rest_mode_period(start_date, end_date), "rest_mode_period"),
-            _fetch_safely(self._client.daily_readiness(start_date, end_date), "daily_readiness"),
-            _fetch_safely(self._client.daily_sleep(start_date, end_date), "daily_sleep"),
-            _fetch_safely(self._client.daily_activity(start_date, end_date), "daily_activity"),
-            _fetch_safely(self._client.daily_spo2(start_date, end_date), "daily_spo2"),
-            _fetch_safely(self._client.daily_stress(start_date, end_date), "daily_stress"),
-            _fetch_safely(self._client.daily_resilience(start_date, end_date), "daily_resilience"),
-            _fetch_safely(self._client.heartrate(start_dt, end_dt), "heartrate"),
-            _fetch_safely(self._client.workout(start_date, end_date), "workout"),
-            _fetch_safely(self._client.session(start_date, end_date), "session"),
-            _fetch_safely(self._client.sleep(start_date, end_date), "sleep"),
-            _fetch_safely(self._client.enhanced_tag(start_date, end_date), "enhanced_tag"),
-            _fetch_safely(self._client.vo2max(start_date, end_date), "vo2max"),
-            _fetch_safely(self._client.daily_cardiovascular_age(start_date, end_date), "daily_cardiovascular_age"),
+        due = [k for k in ENDPOINTS if self._is_due(k, now)]
+        # Re-probes of endpoints held back as unavailable say nothing about the token
+        probing = frozenset(k for k in due if k in self._unavailable)
+        checked = [k for k in due if k not in probing]
+        # Daily endpoints only ask for the days that are not final yet
+        starts = {k: self.days.fetch_start(k, start_date, end_date) if k in DAILY_ENDPOINTS else start_date for k in due}
+        results = await asyncio.gather(
+            *(_fetch_safely(self._endpoint_call(k, starts[k], end_date, start_dt, end_dt), k) for k in due)
         )
-        payloads = {
-            k: v for k, v in {
-                "personal_info": personal_info,
-                "ring_configuration": ring_configuration,
-                "rest_mode_period": rest_mode_period,
-                "daily_readiness": daily_readiness,
-                "daily_sleep": daily_sleep,
-                "daily_activity": daily_activity,
-                "daily_spo2": daily_spo2,
-                "daily_stress": daily_stress,
-                "daily_resilience": daily_resilience,
-                "heartrate": heartrate,
-                "workout": workout,
-                "session": session,
-                "sleep": sleep,
-                "enhanced_tag": enhanced_tag,
-                "vo2max": vo2max,
-                "daily_cardiovascular_age": daily_cardiovascular_age,
-            }.items() if v is not None
-        }
-        return OuraData(payloads=payloads)
+
+        # Endpoints that were not due (or failed) keep their last result
+        payloads = dict(self.data.payloads) if self.data else {}
+        changed = set()
+        for key, result in zip(due, results):
+            if result is not None:
+                self._fetched_at[key] = now
+                self._succeeded.add(key)
+                if self._unavailable.pop(key, None) is not None:
+                    changed.add(key)
+            if key == "heartrate":
+                # Merged even on failure so aged-out samples are evicted
+                result = self._merge_heartrate(result, hr_fetch_start, now)
+            elif result is None:
+                continue
+            elif key in DAY_KEYED_ENDPOINTS:
+                finalized = self.days.merge(key, result.get("data") or [], starts[key], end_date, end_date)
+                self.baselines.ingest(key, finalized)
+            fingerprint = _fingerprint(result)
+            if self._fingerprints.get(key) != fingerprint:
+                self._fingerprints[key] = fingerprint
+                changed.add(key)
+            payloads[key] = result
+        # A 401 from every endpoint is an expired or revoked token, not a missing feature
+        any_success = any(result is not None for result in results)
+        # The client already retried with a refreshed token; a lone endpoint that never
+        # worked may just be gated
+        if (checked and all(denied.get(k) == 401 for k in due)
+                and (len(checked) > 1 or checked[0] in self._succeeded)):
+            raise ConfigEntryAuthFailed("Oura rejected the access token")
+        for key, status in denied.items():
+            if status == 401 and not any_success and key not in probing:
+                continue
+            self._mark_unavailable(key, status, now)
+            self._fingerprints.pop(key, None)
+            if payloads.pop(key, None) is not None:
+                changed.add(key)
+            if key == "heartrate":
+                self._hr_series = HeartRateSeries()
+            elif key in DAY_KEYED_ENDPOINTS:
+                self.days.drop(key)
+        if self.adaptive is not None:
+            self.adaptive.observe(payloads, end_date, now)
+            interval = self.adaptive.interval(end_date, now)
+            if interval != self.poll_interval:
+                _LOGGER.debug("Oura poll interval for %s now %s", self.entry_id, interval)
+                self.poll_interval = interval
+                self.adaptive.reschedule()
+        _LOGGER.debug("Refreshed %d/%d Oura endpoints: %s (changed: %s)", len(due), len(ENDPOINTS), due, sorted(changed))
+        if self.hr_history is not None and "heartrate" in changed:
+            self.hr_history.async_ingest(self._hr_series, now - timedelta(hours=HR_WINDOW_HOURS))
+
+        if self.data is not None and not changed and not day_rolled:
+            # Same object back: the coordinator skips notifying every entity
+            self._changed_endpoints = None
+            self.updates_skipped += 1
+            return self.data
+        # Today's workouts/sessions are relative to the date, so a new day re-evaluates everything
+        recovering = not self.last_update_success
+        self._changed_endpoints = None if day_rolled or recovering else frozenset(changed)
+        self.updates_applied += 1
+        data = OuraData(payloads=payloads, days=self.days, baselines=self.baselines)
+        # By the time the delayed write runs, self.data is the object returned here
+        self._store.async_delay_save(self._cache_data, CACHE_SAVE_DELAY)
+        return data
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .const import DAYSTORE_RETENTION_DAYS
+from .statistics import pick_main_sleep
+
+# Endpoints returning one summary record per `day`
+DAILY_ENDPOINTS = (
+    "daily_readiness",
+    "daily_sleep",
+    "daily_activity",
+    "daily_spo2",
+    "daily_stress",
+    "daily_resilience",
+    "vo2max",
+    "daily_cardiovascular_age",
+)
+# Also stored by day, keeping the main sleep period of each day; the sleep window itself
+# is still fetched in full since the last-night sensors read it
+DAY_KEYED_ENDPOINTS = DAILY_ENDPOINTS + ("sleep",)
+
+def _shift(day: str, days: int) -> str:
+    return (date.fromisoformat(day) + timedelta(days=days)).isoformat()
+
+def _by_day(key: str, records: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+    by_day: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        if isinstance(record, dict) and record.get("day"):
+            day = record["day"]
+            by_day[day] = pick_main_sleep(by_day.get(day), record) if key == "sleep" else record
+    return by_day
+
+class OuraDayStore:
+    """Daily summary records keyed by endpoint and `day`, kept across refreshes.
+
+    Oura only publishes a day's record once the previous day has closed, so a day fetched
+    in the same response as a later one can no longer change: it is final and never
+    requested again. Only the days after the last final one are re-fetched."""
+
+    __slots__ = ("_days", "_latest", "_final")
+
+    def __init__(self) -> None:
+        self._days: Dict[str, Dict[str, Dict[str, Any]]] = {key: {} for key in DAY_KEYED_ENDPOINTS}
+        # Per endpoint: newest day held, and the newest day known to be final
+        self._latest: Dict[str, str] = {}
+        self._final: Dict[str, str] = {}
+
+    @classmethod
+    def from_payloads(cls, payloads: Dict[str, Any]) -> "OuraDayStore":
+        """Transient store over API-shaped payloads; nothing is marked final."""
+        store = cls()
+        for key in DAY_KEYED_ENDPOINTS:
+            for record in _by_day(key, (payloads.get(key) or {}).get("data") or []).values():
+                store._put(key, record)
+        return store
+
+    @classmethod
+    def from_dict(cls, stored: Any) -> "OuraDayStore":
+        store = cls()
+        if isinstance(stored, dict):
+            for key, days in (stored.get("days") or {}).items():
+                if key in store._days:
+                    for record in days.values():
+                        store._put(key, record)
+            store._final = {k: v for k, v in (stored.get("final") or {}).items() if k in store._days}
+        return store
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"days": self._days, "final": self._final}
+
+    def diagnostics(self) -> Dict[str, Any]:
+        return {
+            key: {"days": len(days), "latest": self._latest.get(key), "final_through": self._final.get(key)}
+            for key, days in self._days.items() if days or key in self._final
+        }
+
+    # --- reads ---
+
+    def get(self, key: str, day: str) -> Optional[Dict[str, Any]]:
+        return self._days.get(key, {}).get(day)
+
+    def latest(self, key: str) -> Optional[Dict[str, Any]]:
+        """The newest record of an endpoint, whichever day that is."""
+        day = self._latest.get(key)
+        return self._days[key][day] if day is not None else None
+
+    def days(self, key: str) -> Dict[str, Dict[str, Any]]:
+        return self._days.get(key, {})
+
+    def final_days(self, key: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Final days held for an endpoint, oldest first."""
+        final = self._final.get(key)
+        days = self._days.get(key, {})
+        return [(d, days[d]) for d in sorted(days) if final is not None and d <= final]
+
+    def fetch_start(self, key: str, default: str, today: str) -> str:
+        """First day worth requesting: the day after the last final one, or `default`
+        (yesterday) before anything is final. Capped at the retention window."""
+        final = self._final.get(key)
+        if final is None:
+            return default
+        floor = _shift(today, -DAYSTORE_RETENTION_DAYS)
+        return min(today, max(_shift(final, 1), floor))
+
+    # --- updates ---
+
+    def _put(self, key: str, record: Dict[str, Any]) -> None:
+        day = record["day"]
+        self._days[key][day] = record
+        if day > self._latest.get(key, ""):
+            self._latest[key] = day
+
+    def merge(self, key: str, records: Iterable[Any], start: str, end: str, today: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Apply a fetch that is authoritative for days start..end. Returns the days that
+        became final with it, oldest first, as (day, record)."""
+        days = self._days[key]
+        fetched = _by_day(key, records)
+        for day in [d for d in days if start <= d <= end and d not in fetched]:
+            del days[day]
+        for record in fetched.values():
+            self._put(key, record)
+
+        finalized: List[Tuple[str, Dict[str, Any]]] = []
+        newest = max(fetched, default=None)
+        if newest is not None and newest > start:
+            final = _shift(newest, -1)
+            previous = self._final.get(key, "")
+            if final > previous:
+                self._final[key] = final
+                finalized = [(d, days[d]) for d in sorted(days) if previous < d <= final]
+
+        floor = _shift(today, -DAYSTORE_RETENTION_DAYS)
+        for day in [d for d in days if d < floor]:
+            del days[day]
+        if self._latest.get(key) not in days:
+            self._latest.pop(key, None)
+            if days:
+                self._latest[key] = max(days)
+        return finalized
+
+    def drop(self, key: str) -> None:
+        self._days[key].clear()
+        self._latest.pop(key, None)
+        self._final.pop(key, None)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_WEBHOOK_VERIFICATION_TOKEN
+
+TO_REDACT = {
+    "access_token",
+    "refresh_token",
+    "client_secret",
+    "email",
+    "user_id",
+    CONF_WEBHOOK_ID,
+    CONF_WEBHOOK_VERIFICATION_TOKEN,
+}
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    domain_data = hass.data.get(DOMAIN, {})
+    data = domain_data.get(entry.entry_id) or {}
+    coordinator = data.get("coordinator")
+    client = data.get("client")
+    scheduler = domain_data.get("_scheduler")
+    webhooks = data.get("webhooks")
+    entry_data = dict(entry.data)
+    if token := entry_data.get("token"):
+        entry_data["token"] = {"scope": token.get("scope"), "expires_at": token.get("expires_at")}
+    return async_redact_data({
+        "entry_data": entry_data,
+        "options": dict(entry.options),
+        "coordinator": coordinator.diagnostics() if coordinator else None,
+        "telemetry": client.telemetry.as_dict() if client else None,
+        "webhooks": webhooks.diagnostics() if webhooks else None,
+        "schedule": scheduler.as_dict() if scheduler else None,
+    }, TO_REDACT)
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Source codes stored per sample; 0 is anything not listed
+SOURCES = ("awake", "rest", "sleep", "session", "live", "workout")
+_SOURCE_CODES = {name: code for code, name in enumerate(SOURCES, start=1)}
+_HOUR = 3600
+
+Sample = Tuple[int, int, int]  # (epoch seconds, bpm, source code)
+
+def _epoch(value: Any) -> Optional[int]:
+    try:
+        ts = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return int(ts.timestamp())
+
+def samples_from_records(records: Iterable[Any]) -> List[Sample]:
+    """API heart-rate records -> samples sorted by time; records without time or bpm are skipped."""
+    samples = []
+    for record in records:
+        if not isinstance(record, dict) or not isinstance(record.get("bpm"), (int, float)):
+            continue
+        ts = _epoch(record.get("timestamp"))
+        if ts is not None:
+            samples.append((ts, int(round(record["bpm"])), _SOURCE_CODES.get(record.get("source"), 0)))
+    samples.sort(key=lambda s: s[0])
+    return samples
+
+class HeartRateSeries:
+    """Heart-rate samples in parallel arrays (epoch seconds, bpm, source code), oldest first.
+
+    Window min/max are kept in monotonic deques and the window and last-hour means as
+    running sums, all updated on append/evict, so every read is O(1). Indices in the
+    deques are absolute: arrays hold samples from `_base` on, the window starts at `_head`."""
+
+    __slots__ = ("_ts", "_bpm", "_src", "_base", "_head", "_max_q", "_min_q", "_sum", "_hour_head", "_hour_sum", "version")
+
+    def __init__(self) -> None:
+        self._ts = array("q")
+        self._bpm = array("H")
+        self._src = array("B")
+        self._base = 0
+        self._head = 0
+        self._max_q: deque = deque()
+        self._min_q: deque = deque()
+        self._sum = 0
+        self._hour_head = 0
+        self._hour_sum = 0
+        # Bumped on every mutation; the coordinator uses it as the change fingerprint
+        self.version = 0
+
+    @classmethod
+    def from_samples(cls, samples: Iterable[Sample]) -> "HeartRateSeries":
+        series = cls()
+        for ts, bpm, src in samples:
+            series.append(ts, bpm, src)
+        return series
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> "HeartRateSeries":
+        """From as_dict() output, or from an API-shaped {"data": [...]} payload."""
+        if isinstance(payload, dict) and "ts" in payload:
+            return cls.from_samples(zip(payload["ts"], payload["bpm"], payload["src"]))
+        return cls.from_samples(samples_from_records((payload or {}).get("data") or []))
+
+    def as_dict(self) -> Dict[str, List[int]]:
+        start = self._head - self._base
+        return {"ts": self._ts[start:].tolist(), "bpm": self._bpm[start:].tolist(), "src": self._src[start:].tolist()}
+
+    # --- reads ---
+
+    def __len__(self) -> int:
+        return self._base + len(self._ts) - self._head
+
+    def _bpm_at(self, index: int) -> int:
+        return self._bpm[index - self._base]
+
+    @property
+    def latest_bpm(self) -> Optional[int]:
+        return self._bpm[-1] if len(self) else None
+
+    @property
+    def latest_time(self) -> Optional[datetime]:
+        return datetime.fromtimestamp(self._ts[-1], timezone.utc) if len(self) else None
+
+    @property
+    def latest_source(self) -> Optional[str]:
+        if not len(self):
+            return None
+        code = self._src[-1]
+        return SOURCES[code - 1] if code else None
+
+    @property
+    def min(self) -> Optional[int]:
+        return self._bpm_at(self._min_q[0]) if self._min_q else None
+
+    @property
+    def max(self) -> Optional[int]:
+        return self._bpm_at(self._max_q[0]) if self._max_q else None
+
+    @property
+    def mean(self) -> Optional[float]:
+        count = len(self)
+        return self._sum / count if count else None
+
+    @property
+    def mean_1h(self) -> Optional[float]:
+        """Mean over the hour up to the latest sample."""
+        count = self._base + len(self._ts) - self._hour_head
+        return self._hour_sum / count if count else None
+
+    def iter_samples(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> Iterator[Tuple[datetime, int]]:
+        """(timestamp, bpm) for window samples with start <= timestamp < end."""
+        lo = self._head - self._base
+        if start is not None:
+            lo = bisect_left(self._ts, int(start.timestamp()), lo)
+        hi = len(self._ts) if end is None else bisect_left(self._ts, int(end.timestamp()), lo)
+        for i in range(lo, hi):
+            yield datetime.fromtimestamp(self._ts[i], timezone.utc), self._bpm[i]
+
+    # --- updates ---
+
+    def append(self, ts: int, bpm: int, src: int = 0) -> None:
+        """Add a sample no older than the latest one."""
+        if len(self) and ts < self._ts[-1]:
+            raise ValueError("heart-rate samples must be appended in time order")
+        index = self._base + len(self._ts)
+        self._ts.append(ts)
+        self._bpm.append(bpm)
+        self._src.append(src)
+        self._sum += bpm
+        while self._max_q and self._bpm_at(self._max_q[-1]) <= bpm:
+            self._max_q.pop()
+        self._max_q.append(index)
+        while self._min_q and self._bpm_at(self._min_q[-1]) >= bpm:
+            self._min_q.pop()
+        self._min_q.append(index)
+        self._hour_sum += bpm
+        while self._ts[self._hour_head - self._base] < ts - _HOUR:
+            self._hour_sum -= self._bpm_at(self._hour_head)
+            self._hour_head += 1
+        self.version += 1
+
+    def evict_before(self, ts: int) -> None:
+        """Drop samples older than `ts` from the window."""
+        end = self._base + len(self._ts)
+        head = self._head
+        while head < end and self._ts[head - self._base] < ts:
+            self._sum -= self._bpm_at(head)
+            head += 1
+        if head == self._head:
+            return
+        self._head = head
+        while self._max_q and self._max_q[0] < head:
+            self._max_q.popleft()
+        while self._min_q and self._min_q[0] < head:
+            self._min_q.popleft()
+        while self._hour_head < head:
+            self._hour_sum -= self._bpm_at(self._hour_head)
+            self._hour_head += 1
+        # Reclaim the evicted prefix once it is the larger part of the arrays
+        dead = head - self._base
+        if dead > 256 and dead * 2 > len(self._ts):
+            del self._ts[:dead], self._bpm[:dead], self._src[:dead]
+            self._base = head
+        self.version += 1
+
+    def replace_from(self, since: int, samples: Sequence[Sample]) -> None:
+        """Merge a fetch that is authoritative for every sample at or after `since`.
+
+        The common case - the overlap came back unchanged - only appends; a late sync that
+        altered the overlap truncates it and rebuilds the deques."""
+        samples = [s for s in samples if s[0] >= since]
+        cut = bisect_left(self._ts, since, self._head - self._base)
+        tail = len(self._ts) - cut
+        if tail <= len(samples) and all(
+            self._ts[cut + j] == samples[j][0] and self._bpm[cut + j] == samples[j][1] for j in range(tail)
+        ):
+            new = samples[tail:]
+        else:
+            self._truncate(cut)
+            new = samples
+        for ts, bpm, src in new:
+            self.append(ts, bpm, src)
+
+    def _truncate(self, cut: int) -> None:
+        """Drop array positions from `cut` on and rebuild the derived state."""
+        del self._ts[cut:], self._bpm[cut:], self._src[cut:]
+        start = self._head - self._base
+        self._sum = sum(self._bpm[start:])
+        self._max_q.clear()
+        self._min_q.clear()
+        for i in range(start, len(self._ts)):
+            index, bpm = self._base + i, self._bpm[i]
+            while self._max_q and self._bpm_at(self._max_q[-1]) <= bpm:
+                self._max_q.pop()
+            self._max_q.append(index)
+            while self._min_q and self._bpm_at(self._min_q[-1]) >= bpm:
+                self._min_q.pop()
+            self._min_q.append(index)
+        hour = bisect_left(self._ts, self._ts[-1] - _HOUR, start) if len(self._ts) > start else len(self._ts)
+        self._hour_head = self._base + hour
+        self._hour_sum = sum(self._bpm[hour:])
+        self.version += 1
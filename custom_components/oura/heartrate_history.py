@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from aiohttp import ClientError
+from homeassistant.components.recorder.models import StatisticData
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import OuraApiClient, OuraApiError
+from .const import (
+    DOMAIN,
+    STORAGE_VERSION,
+    HR_GAP_CHUNK_HOURS,
+    HR_GAP_CONCURRENCY,
+    HR_GAP_MAX_DAYS,
+)
+from .heartrate import HeartRateSeries
+from .statistics import import_statistics, statistic_metadata
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR = timedelta(hours=1)
+
+def _floor_hour(ts: datetime) -> datetime:
+    return ts.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+def _parse(value: Any) -> Optional[datetime]:
+    ts = dt_util.parse_datetime(str(value)) if value else None
+    if ts is not None and ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts
+
+def hourly_rows(samples: Iterable[Tuple[datetime, float]], start: datetime, end: datetime) -> List[StatisticData]:
+    """Aggregate (timestamp, bpm) samples into hourly mean/min/max rows for hours in [start, end)."""
+    hours: Dict[datetime, List[float]] = {}
+    for ts, bpm in samples:
+        if start <= ts < end:
+            acc = hours.setdefault(_floor_hour(ts), [0.0, 0, bpm, bpm])
+            acc[0] += bpm
+            acc[1] += 1
+            acc[2] = min(acc[2], bpm)
+            acc[3] = max(acc[3], bpm)
+    return [
+        StatisticData(start=hour, mean=total / count, min=low, max=high)
+        for hour, (total, count, low, high) in sorted(hours.items())
+    ]
+
+class OuraHeartRateHistory:
+    """Imports the heart-rate series as hourly long-term statistics.
+
+    Hours are imported from the coordinator's rolling series once a later sample exists,
+    so a late ring sync cannot leave a half-filled hour behind. Hours that fell out of
+    the window while Home Assistant was down are recorded as gaps and fetched separately."""
+
+    def __init__(self, hass: HomeAssistant, client: OuraApiClient, entry_id: str, user_key: str) -> None:
+        self.hass = hass
+        self._client = client
+        self._entry_id = entry_id
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.hr_history.{entry_id}")
+        self._metadata = statistic_metadata(user_key, "heart_rate", "Heart Rate", "bpm")
+        self._last_hour: Optional[datetime] = None  # start of the last imported hour, UTC
+        self._gaps: List[Tuple[datetime, datetime]] = []
+        self._gap_task: Optional[asyncio.Task] = None
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load() or {}
+        self._last_hour = _parse(stored.get("last_hour"))
+        self._gaps = [(s, e) for s, e in ((_parse(a), _parse(b)) for a, b in stored.get("gaps", [])) if s and e]
+
+    def _save(self) -> None:
+        self._store.async_delay_save(lambda: {
+            "last_hour": self._last_hour.isoformat() if self._last_hour else None,
+            "gaps": [[s.isoformat(), e.isoformat()] for s, e in self._gaps],
+        }, 5)
+
+    def async_ingest(self, series: HeartRateSeries, window_start: datetime) -> None:
+        """Import complete hours from the coordinator's heart-rate series."""
+        if not len(series):
+            return
+        # The newest sample's hour may still be filling up
+        end = _floor_hour(series.latest_time)
+        covered_from = _floor_hour(window_start) + HOUR
+        if self._last_hour is not None and self._last_hour + HOUR < covered_from:
+            # Hours that aged out of the window before we saw them (downtime)
+            earliest = covered_from - timedelta(days=HR_GAP_MAX_DAYS)
+            self._gaps.append((max(self._last_hour + HOUR, earliest), covered_from))
+            self._last_hour = covered_from - HOUR
+        start = covered_from if self._last_hour is None else self._last_hour + HOUR
+        if start < end:
+            import_statistics(self.hass, self._metadata, hourly_rows(series.iter_samples(start, end), start, end))
+        if self._last_hour is None or end - HOUR > self._last_hour:
+            self._last_hour = end - HOUR
+        self._save()
+        if self._gaps and (self._gap_task is None or self._gap_task.done()):
+            self._gap_task = self.hass.async_create_background_task(
+                self._async_fill_gaps(), f"{DOMAIN}_hr_gap_fill"
+            )
+
+    def async_unload(self) -> None:
+        """Stop a gap fill still running; unfilled gaps stay stored for the next setup."""
+        if self._gap_task is not None and not self._gap_task.done():
+            self._gap_task.cancel()
+
+    async def _async_fetch_chunk(self, start: datetime, end: datetime) -> int:
+        params = {"start_datetime": start.isoformat(timespec="seconds"), "end_datetime": end.isoformat(timespec="seconds")}
+        samples = []
+        async for record in self._client.iter_records("/usercollection/heartrate", params):
+            ts = _parse(record.get("timestamp")) if isinstance(record, dict) else None
+            if ts is not None and isinstance(record.get("bpm"), (int, float)):
+                samples.append((ts, record["bpm"]))
+        return import_statistics(self.hass, self._metadata, hourly_rows(samples, start, end))
+
+    async def _async_fill_gaps(self) -> None:
+        while self._gaps:
+            gap_start, gap_end = self._gaps[0]
+            chunks = []
+            cursor = gap_start
+            while cursor < gap_end:
+                chunks.append((cursor, min(gap_end, cursor + timedelta(hours=HR_GAP_CHUNK_HOURS))))
+                cursor = chunks[-1][1]
+            semaphore = asyncio.Semaphore(HR_GAP_CONCURRENCY)
+
+            async def _fetch(chunk):
+                async with semaphore:
+                    return await self._async_fetch_chunk(*chunk)
+
+            try:
+                rows = sum(await asyncio.gather(*(_fetch(c) for c in chunks)))
+            except ConfigEntryAuthFailed as err:
+                _LOGGER.warning("Heart-rate gap fill %s..%s stopped, Oura rejected the token: %s", gap_start, gap_end, err)
+                if (entry := self.hass.config_entries.async_get_entry(self._entry_id)) is not None:
+                    entry.async_start_reauth(self.hass)
+                return
+            except (OuraApiError, ClientError, asyncio.TimeoutError) as err:
+                # The gap stays stored; the next ingest starts another fill
+                _LOGGER.warning("Heart-rate gap fill %s..%s failed, will retry: %s", gap_start, gap_end, err)
+                return
+            _LOGGER.debug("Filled heart-rate gap %s..%s with %d hourly rows", gap_start, gap_end, rows)
+            self._gaps.pop(0)
+            self._save()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Dict, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import GLOBAL_MAX_IN_FLIGHT, STARTUP_STAGGER_SEC
+from .coordinator import OuraDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+@dataclass
+class _Slot:
+    coordinator: OuraDataUpdateCoordinator
+    phase: float = 0.0  # fraction of the interval this entry is offset by
+    startup_pending: bool = False
+    unsub: Optional[CALLBACK_TYPE] = None
+    task: Optional[asyncio.Task] = None
+    next_run: Optional[datetime] = None
+    last_run: Optional[datetime] = None
+
+class OuraRefreshScheduler:
+    """Domain-wide poll scheduler: spreads account refreshes evenly over their interval
+    and owns the request budget shared by every account's API client."""
+
+    def __init__(self, hass: HomeAssistant, max_in_flight: int = GLOBAL_MAX_IN_FLIGHT) -> None:
+        self.hass = hass
+        self.max_in_flight = max_in_flight
+        self.request_limiter = asyncio.Semaphore(max_in_flight)
+        self._slots: Dict[str, _Slot] = {}
+
+    @callback
+    def async_register(self, coordinator: OuraDataUpdateCoordinator, *, refresh_soon: bool = False) -> None:
+        """Add an account; with refresh_soon its first poll runs within the startup stagger window."""
+        previous = self._slots.get(coordinator.entry_id)
+        if previous and previous.unsub:
+            previous.unsub()
+        # phase -1 marks the slot as not scheduled yet
+        self._slots[coordinator.entry_id] = _Slot(coordinator, phase=-1.0, startup_pending=refresh_soon)
+        self._rebalance()
+
+    @callback
+    def async_unregister(self, entry_id: str) -> None:
+        slot = self._slots.pop(entry_id, None)
+        if slot:
+            self._cancel(slot)
+        self._rebalance()
+
+    @callback
+    def async_reschedule(self, entry_id: str) -> None:
+        """Re-align an account to its slot, e.g. after its poll interval changed."""
+        if entry_id in self._slots:
+            self._schedule(entry_id)
+
+    @property
+    def empty(self) -> bool:
+        return not self._slots
+
+    @callback
+    def async_shutdown(self) -> None:
+        for slot in self._slots.values():
+            self._cancel(slot)
+        self._slots.clear()
+
+    @staticmethod
+    def _cancel(slot: _Slot) -> None:
+        """Drop the slot's pending timer and the refresh it started, if still running."""
+        if slot.unsub:
+            slot.unsub()
+            slot.unsub = None
+        if slot.task is not None and not slot.task.done():
+            slot.task.cancel()
+
+    @callback
+    def _rebalance(self) -> None:
+        count = len(self._slots)
+        for index, (entry_id, slot) in enumerate(self._slots.items()):
+            # Slots that keep their phase keep their timer, so registering several cached
+            # accounts does not restart the startup stagger of the ones already waiting
+            if slot.phase != index / count:
+                slot.phase = index / count
+                self._schedule(entry_id)
+
+    @callback
+    def _schedule(self, entry_id: str) -> None:
+        slot = self._slots[entry_id]
+        if slot.unsub:
+            slot.unsub()
+        if slot.startup_pending:
+            delay = slot.phase * STARTUP_STAGGER_SEC
+        else:
+            # Next wall-clock instant congruent to this slot's phase of the interval
+            interval = max(1.0, slot.coordinator.poll_interval.total_seconds())
+            offset = slot.phase * interval
+            now = time.time()
+            delay = offset + math.ceil((now - offset) / interval) * interval - now
+            if delay < 1:
+                delay += interval
+        slot.next_run = dt_util.utcnow() + timedelta(seconds=delay)
+        slot.unsub = async_call_later(self.hass, delay, HassJob(partial(self._async_fire, entry_id), cancel_on_shutdown=True))
+
+    @callback
+    def _async_fire(self, entry_id: str, _now: datetime) -> None:
+        slot = self._slots.get(entry_id)
+        if slot is None:
+            return
+        slot.unsub = None
+        slot.startup_pending = False
+        if slot.task is None or slot.task.done():
+            slot.last_run = dt_util.utcnow()
+            slot.task = self.hass.async_create_background_task(
+                slot.coordinator.async_refresh_coalesced(), f"oura_scheduled_refresh_{entry_id}"
+            )
+        else:
+            _LOGGER.debug("Skipping scheduled refresh of %s, previous one still running", entry_id)
+        self._schedule(entry_id)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "max_in_flight": self.max_in_flight,
+            "entries": {
+                entry_id: {
+                    "interval_sec": slot.coordinator.poll_interval.total_seconds(),
+                    "phase": round(slot.phase, 4),
+                    "offset_sec": round(slot.phase * slot.coordinator.poll_interval.total_seconds(), 1),
+                    "next_run": slot.next_run.isoformat() if slot.next_run else None,
+                    "last_run": slot.last_run.isoformat() if slot.last_run else None,
+                    "running": bool(slot.task and not slot.task.done()),
+                }
+                for entry_id, slot in self._slots.items()
+            },
+        }
@@ -2,8 +2,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Callable, Dict, Optional
-from datetime import datetime, timezone
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -11,11 +11,15 @@ from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorStateClass,
 )
-from homeassistant.const import PERCENTAGE, UnitOfTemperature, UnitOfLength
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTemperature, UnitOfLength, UnitOfTime, UnitOfInformation
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, ENDPOINT_TIERS, SIGNAL_TELEMETRY, BASELINE_METRICS, BASELINE_WINDOWS
 from .coordinator import OuraDataUpdateCoordinator, OuraData
+from .statistics import DAILY_METRICS, DailyMetric
+from .telemetry import OuraTelemetry
 
 # ---------- helpers ----------
 def _find_first(data: dict, path: list[str], default=None):
@@ -26,80 +30,27 @@ def _find_first(data: dict, path: list[str], default=None):
         cur = cur[p]
     return cur
 
-def _first_item(lst):
-    if isinstance(lst, list) and lst:
-        return lst[0]
-    return None
-
-def _iso_parse(dt_str):
-    try:
-        if not dt_str:
-            return None
-        return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
-    except Exception:
-        return None
-
 def _min_from_seconds(val):
     try:
         return round((val or 0) / 60, 2)
     except Exception:
         return None
 
-def _sleep_latest(d: OuraData):
-    arr = (d.payloads.get("sleep", {}) or {}).get("data")
-    if not isinstance(arr, list) or not arr:
-        return None
-    def _key(x):
-        return _iso_parse(x.get("bedtime_start") or x.get("timestamp") or "")
-    arr2 = [i for i in arr if isinstance(i, dict)]
-    arr2.sort(key=lambda x: _key(x) or datetime.min.replace(tzinfo=timezone.utc))
-    return arr2[-1] if arr2 else None
-
-def _daily_first(payloads: dict, key: str):
-    return _first_item((payloads.get(key, {}) or {}).get("data", [])) or {}
-
-# Workouts / Sessions helpers
-def _filter_by_day(items, day_key="day", day=None):
-    if day is None:
-        day = datetime.now(timezone.utc).astimezone().date().isoformat()
-    if not isinstance(items, list):
-        return []
-    return [i for i in items if isinstance(i, dict) and i.get(day_key) == day]
-
-def _duration_minutes(start_str, end_str):
-    s = _iso_parse(start_str); e = _iso_parse(end_str)
-    if s and e:
-        return max(0, (e - s).total_seconds()/60.0)
-    return None
-
-def _sum_duration_minutes(items, start_key="start_datetime", end_key="end_datetime"):
-    total = 0.0
-    any_val = False
-    for i in items or []:
-        if not isinstance(i, dict):
-            continue
-        mins = _duration_minutes(i.get(start_key), i.get(end_key))
-        if mins is not None:
-            total += mins
-            any_val = True
-    return total if any_val else 0
-
-def _last_by_time(items, start_key="start_datetime"):
-    best = None
-    best_ts = None
-    for i in items or []:
-        if not isinstance(i, dict):
-            continue
-        ts = _iso_parse(i.get(start_key) or i.get("timestamp"))
-        if ts and (best_ts is None or ts > best_ts):
-            best, best_ts = i, ts
-    return best
+def _sleep(d: OuraData) -> dict:
+    return d.snapshot.sleep_latest
+
+def _daily(d: OuraData, key: str) -> dict:
+    return d.snapshot.daily.get(key) or {}
 
 # ---------- entity description ----------
 @dataclass
 class OuraCalculatedSensorDescription(SensorEntityDescription):
     value_fn: Callable[[OuraData], Any] | None = None
     attr_fn: Callable[[OuraData], Dict[str, Any]] | None = None
+    # Payload keys the value/attributes are derived from; the entity only updates when one of them changed
+    endpoints: tuple[str, ...] = ()
+    # Attributes that change with every poll or repeat another sensor's state: kept out of the recorder
+    unrecorded_attributes: frozenset[str] = frozenset()
 
 SENSORS: list[OuraCalculatedSensorDescription] = [
     # Scores
@@ -108,8 +59,9 @@ SENSORS: list[OuraCalculatedSensorDescription] = [
         name="Oura V2 Readiness Score",
         icon="mdi:arm-flex",
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_readiness"), ["score"]),
-        attr_fn=lambda d: _daily_first(d.payloads, "daily_readiness").get("contributors", {}),
+        endpoints=("daily_readiness",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_readiness"), ["score"]),
+        attr_fn=lambda d: _daily(d, "daily_readiness").get("contributors", {}),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -117,8 +69,9 @@ SENSORS: list[OuraCalculatedSensorDescription] = [
         name="Oura V2 Sleep Score",
         icon="mdi:sleep",
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_sleep"), ["score"]),
-        attr_fn=lambda d: _daily_first(d.payloads, "daily_sleep").get("contributors", {}),
+        endpoints=("daily_sleep",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_sleep"), ["score"]),
+        attr_fn=lambda d: _daily(d, "daily_sleep").get("contributors", {}),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -126,7 +79,8 @@ SENSORS: list[OuraCalculatedSensorDescription] = [
         name="Oura V2 Activity Score",
         icon="mdi:run",
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["score"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["score"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
 
@@ -135,14 +89,16 @@ SENSORS: list[OuraCalculatedSensorDescription] = [
         key="steps",
         name="Oura V2 Steps",
         icon="mdi:walk",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["steps"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["steps"]),
         state_class=SensorStateClass.TOTAL,
     ),
     OuraCalculatedSensorDescription(
         key="total_calories",
         name="Oura V2 Total Calories",
         icon="mdi:fire",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["total_calories"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["total_calories"]),
         state_class=SensorStateClass.TOTAL,
     ),
 
@@ -152,7 +108,8 @@ SENSORS: list[OuraCalculatedSensorDescription] = [
         name="Oura V2 SpO2 Average",
         icon="mdi:blood-bag",
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_spo2"), ["spo2_percentage"]),
+        endpoints=("daily_spo2",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_spo2"), ["spo2_percentage"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
 
@@ -161,7 +118,8 @@ SENSORS: list[OuraCalculatedSensorDescription] = [
         key="resting_heart_rate",
         name="Oura V2 Resting Heart Rate",
         icon="mdi:heart",
-        value_fn=lambda d: _find_first((_sleep_latest(d) or {}), ["lowest_heart_rate"]),
+        endpoints=("sleep",),
+        value_fn=lambda d: _find_first(_sleep(d), ["lowest_heart_rate"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
 
@@ -170,32 +128,31 @@ SENSORS: list[OuraCalculatedSensorDescription] = [
         key="hr_latest",
         name="Oura V2 Heart Rate (Latest)",
         icon="mdi:heart-pulse",
-        value_fn=lambda d: (
-            (lambda arr: (arr[-1].get("bpm") if isinstance(arr, list) and arr and isinstance(arr[-1], dict) else None))
-            ((d.payloads.get("heartrate", {}) or {}).get("data"))
-        ),
+        endpoints=("heartrate",),
+        value_fn=lambda d: d.snapshot.hr_latest,
+        attr_fn=lambda d: {
+            "timestamp": d.snapshot.hr_latest_time.isoformat() if d.snapshot.hr_latest_time else None,
+            "source": d.snapshot.hr_latest_source,
+            "average_1h": round(d.snapshot.hr_mean_1h, 1) if d.snapshot.hr_mean_1h is not None else None,
+            "average_window": round(d.snapshot.hr_mean, 1) if d.snapshot.hr_mean is not None else None,
+        },
+        unrecorded_attributes=frozenset({"timestamp", "source", "average_1h", "average_window"}),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="hr_min",
         name="Oura V2 Heart Rate (Min)",
         icon="mdi:heart-outline",
-        value_fn=lambda d: (
-            (lambda arr: (min((x.get("bpm") for x in arr if isinstance(x, dict) and "bpm" in x), default=None)
-                          if isinstance(arr, list) else None))
-            ((d.payloads.get("heartrate", {}) or {}).get("data"))
-        ),
+        endpoints=("heartrate",),
+        value_fn=lambda d: d.snapshot.hr_min,
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="hr_max",
         name="Oura V2 Heart Rate (Max)",
         icon="mdi:heart-off",
-        value_fn=lambda d: (
-            (lambda arr: (max((x.get("bpm") for x in arr if isinstance(x, dict) and "bpm" in x), default=None)
-                          if isinstance(arr, list) else None))
-            ((d.payloads.get("heartrate", {}) or {}).get("data"))
-        ),
+        endpoints=("heartrate",),
+        value_fn=lambda d: d.snapshot.hr_max,
         state_class=SensorStateClass.MEASUREMENT,
     ),
 
@@ -205,7 +162,8 @@ SENSORS: list[OuraCalculatedSensorDescription] = [
         name="Oura V2 Recovery High (Daily)",
         icon="mdi:meditation",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds(_find_first(_daily_first(d.payloads, "daily_stress"), ["recovery_high"])),
+        endpoints=("daily_stress",),
+        value_fn=lambda d: _min_from_seconds(_find_first(_daily(d, "daily_stress"), ["recovery_high"])),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -213,14 +171,16 @@ SENSORS: list[OuraCalculatedSensorDescription] = [
         name="Oura V2 Stress High (Daily)",
         icon="mdi:chart-timeline-variant",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds(_find_first(_daily_first(d.payloads, "daily_stress"), ["stress_high"])),
+        endpoints=("daily_stress",),
+        value_fn=lambda d: _min_from_seconds(_find_first(_daily(d, "daily_stress"), ["stress_high"])),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="resilience_level",
         name="Oura V2 Resilience Level",
         icon="mdi:shield-heart",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_resilience"), ["level"]),
+        endpoints=("daily_resilience",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_resilience"), ["level"]),
     ),
 ]
 
@@ -231,7 +191,8 @@ SENSORS.extend([
         name="Oura V2 Sleep Total Duration",
         icon="mdi:sleep",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds((_sleep_latest(d) or {}).get("total_sleep_duration")),
+        endpoints=("sleep",),
+        value_fn=lambda d: _min_from_seconds(_sleep(d).get("total_sleep_duration")),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -239,7 +200,8 @@ SENSORS.extend([
         name="Oura V2 Time In Bed",
         icon="mdi:bed",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds((_sleep_latest(d) or {}).get("time_in_bed")),
+        endpoints=("sleep",),
+        value_fn=lambda d: _min_from_seconds(_sleep(d).get("time_in_bed")),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -247,7 +209,8 @@ SENSORS.extend([
         name="Oura V2 Deep Sleep",
         icon="mdi:moon-waning-crescent",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds((_sleep_latest(d) or {}).get("deep_sleep_duration")),
+        endpoints=("sleep",),
+        value_fn=lambda d: _min_from_seconds(_sleep(d).get("deep_sleep_duration")),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -255,7 +218,8 @@ SENSORS.extend([
         name="Oura V2 REM Sleep",
         icon="mdi:moon-waxing-crescent",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds((_sleep_latest(d) or {}).get("rem_sleep_duration")),
+        endpoints=("sleep",),
+        value_fn=lambda d: _min_from_seconds(_sleep(d).get("rem_sleep_duration")),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -263,7 +227,8 @@ SENSORS.extend([
         name="Oura V2 Light Sleep",
         icon="mdi:weather-night",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds((_sleep_latest(d) or {}).get("light_sleep_duration")),
+        endpoints=("sleep",),
+        value_fn=lambda d: _min_from_seconds(_sleep(d).get("light_sleep_duration")),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -271,7 +236,8 @@ SENSORS.extend([
         name="Oura V2 Awake Time",
         icon="mdi:alarm",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds((_sleep_latest(d) or {}).get("awake_time")),
+        endpoints=("sleep",),
+        value_fn=lambda d: _min_from_seconds(_sleep(d).get("awake_time")),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -279,7 +245,8 @@ SENSORS.extend([
         name="Oura V2 Sleep Latency",
         icon="mdi:speedometer-slow",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds((_sleep_latest(d) or {}).get("latency")),
+        endpoints=("sleep",),
+        value_fn=lambda d: _min_from_seconds(_sleep(d).get("latency")),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -287,7 +254,8 @@ SENSORS.extend([
         name="Oura V2 Sleep Efficiency",
         icon="mdi:gauge",
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda d: _find_first((_sleep_latest(d) or {}), ["efficiency"]),
+        endpoints=("sleep",),
+        value_fn=lambda d: _find_first(_sleep(d), ["efficiency"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -295,7 +263,8 @@ SENSORS.extend([
         name="Oura V2 Respiratory Rate (Night)",
         icon="mdi:lungs",
         native_unit_of_measurement="breaths/min",
-        value_fn=lambda d: _find_first((_sleep_latest(d) or {}), ["average_breath"]),
+        endpoints=("sleep",),
+        value_fn=lambda d: _find_first(_sleep(d), ["average_breath"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -303,7 +272,8 @@ SENSORS.extend([
         name="Oura V2 Avg HR (Night)",
         icon="mdi:heart",
         native_unit_of_measurement="bpm",
-        value_fn=lambda d: _find_first((_sleep_latest(d) or {}), ["average_heart_rate"]),
+        endpoints=("sleep",),
+        value_fn=lambda d: _find_first(_sleep(d), ["average_heart_rate"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -311,7 +281,8 @@ SENSORS.extend([
         name="Oura V2 Lowest HR (Night)",
         icon="mdi:heart-outline",
         native_unit_of_measurement="bpm",
-        value_fn=lambda d: _find_first((_sleep_latest(d) or {}), ["lowest_heart_rate"]),
+        endpoints=("sleep",),
+        value_fn=lambda d: _find_first(_sleep(d), ["lowest_heart_rate"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -319,14 +290,16 @@ SENSORS.extend([
         name="Oura V2 HRV RMSSD (Night)",
         icon="mdi:heart-pulse",
         native_unit_of_measurement="ms",
-        value_fn=lambda d: _find_first((_sleep_latest(d) or {}), ["average_hrv"]),
+        endpoints=("sleep",),
+        value_fn=lambda d: _find_first(_sleep(d), ["average_hrv"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="sleep_restless_periods",
         name="Oura V2 Restless Periods",
         icon="mdi:weather-windy",
-        value_fn=lambda d: _find_first((_sleep_latest(d) or {}), ["restless_periods"]),
+        endpoints=("sleep",),
+        value_fn=lambda d: _find_first(_sleep(d), ["restless_periods"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -334,14 +307,16 @@ SENSORS.extend([
         name="Oura V2 Bedtime Start",
         icon="mdi:clock-start",
         device_class=SensorDeviceClass.TIMESTAMP,
-        value_fn=lambda d: _iso_parse(_find_first((_sleep_latest(d) or {}), ["bedtime_start"])),
+        endpoints=("sleep",),
+        value_fn=lambda d: d.snapshot.bedtime_start,
     ),
     OuraCalculatedSensorDescription(
         key="sleep_bedtime_end",
         name="Oura V2 Bedtime End",
         icon="mdi:clock-end",
         device_class=SensorDeviceClass.TIMESTAMP,
-        value_fn=lambda d: _iso_parse(_find_first((_sleep_latest(d) or {}), ["bedtime_end"])),
+        endpoints=("sleep",),
+        value_fn=lambda d: d.snapshot.bedtime_end,
     ),
 ])
 
@@ -352,7 +327,8 @@ SENSORS.extend([
         name="Oura V2 Temperature Deviation",
         icon="mdi:thermometer",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_readiness"), ["temperature_deviation"]),
+        endpoints=("daily_readiness",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_readiness"), ["temperature_deviation"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -360,56 +336,64 @@ SENSORS.extend([
         name="Oura V2 Temperature Trend Deviation",
         icon="mdi:thermometer-lines",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_readiness"), ["temperature_trend_deviation"]),
+        endpoints=("daily_readiness",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_readiness"), ["temperature_trend_deviation"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="readiness_hrv_balance",
         name="Oura V2 Readiness HRV Balance",
         icon="mdi:heart-pulse",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_readiness"), ["contributors","hrv_balance"]),
+        endpoints=("daily_readiness",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_readiness"), ["contributors","hrv_balance"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="readiness_sleep_balance",
         name="Oura V2 Readiness Sleep Balance",
         icon="mdi:sleep",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_readiness"), ["contributors","sleep_balance"]),
+        endpoints=("daily_readiness",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_readiness"), ["contributors","sleep_balance"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="readiness_activity_balance",
         name="Oura V2 Readiness Activity Balance",
         icon="mdi:run",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_readiness"), ["contributors","activity_balance"]),
+        endpoints=("daily_readiness",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_readiness"), ["contributors","activity_balance"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="readiness_previous_day_activity",
         name="Oura V2 Readiness Previous Day Activity",
         icon="mdi:walk",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_readiness"), ["contributors","previous_day_activity"]),
+        endpoints=("daily_readiness",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_readiness"), ["contributors","previous_day_activity"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="readiness_previous_night",
         name="Oura V2 Readiness Previous Night",
         icon="mdi:weather-night",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_readiness"), ["contributors","previous_night"]),
+        endpoints=("daily_readiness",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_readiness"), ["contributors","previous_night"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="readiness_recovery_index",
         name="Oura V2 Readiness Recovery Index",
         icon="mdi:calendar-refresh",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_readiness"), ["contributors","recovery_index"]),
+        endpoints=("daily_readiness",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_readiness"), ["contributors","recovery_index"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="readiness_body_temperature_contrib",
         name="Oura V2 Readiness Body Temperature (Contributor)",
         icon="mdi:thermometer",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_readiness"), ["contributors","body_temperature"]),
+        endpoints=("daily_readiness",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_readiness"), ["contributors","body_temperature"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
 ])
@@ -420,7 +404,8 @@ SENSORS.extend([
         key="activity_active_calories",
         name="Oura V2 Active Calories",
         icon="mdi:fire",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["active_calories"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["active_calories"]),
         state_class=SensorStateClass.TOTAL,
     ),
     OuraCalculatedSensorDescription(
@@ -428,7 +413,8 @@ SENSORS.extend([
         name="Oura V2 Average MET Minutes",
         icon="mdi:clock-outline",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["average_met_minutes"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["average_met_minutes"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -436,7 +422,8 @@ SENSORS.extend([
         name="Oura V2 Equivalent Walking Distance",
         icon="mdi:map-marker-distance",
         native_unit_of_measurement=UnitOfLength.METERS,
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["equivalent_walking_distance"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["equivalent_walking_distance"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -444,7 +431,8 @@ SENSORS.extend([
         name="Oura V2 High Activity MET Minutes",
         icon="mdi:lightning-bolt",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["high_activity_met_minutes"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["high_activity_met_minutes"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -452,14 +440,16 @@ SENSORS.extend([
         name="Oura V2 High Activity Time",
         icon="mdi:timer",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds(_find_first(_daily_first(d.payloads, "daily_activity"), ["high_activity_time"])),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _min_from_seconds(_find_first(_daily(d, "daily_activity"), ["high_activity_time"])),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="activity_inactivity_alerts",
         name="Oura V2 Inactivity Alerts",
         icon="mdi:bell-alert",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["inactivity_alerts"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["inactivity_alerts"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -467,7 +457,8 @@ SENSORS.extend([
         name="Oura V2 Low Activity MET Minutes",
         icon="mdi:chevron-down",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["low_activity_met_minutes"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["low_activity_met_minutes"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -475,7 +466,8 @@ SENSORS.extend([
         name="Oura V2 Low Activity Time",
         icon="mdi:timer-sand",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds(_find_first(_daily_first(d.payloads, "daily_activity"), ["low_activity_time"])),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _min_from_seconds(_find_first(_daily(d, "daily_activity"), ["low_activity_time"])),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -483,7 +475,8 @@ SENSORS.extend([
         name="Oura V2 Medium Activity MET Minutes",
         icon="mdi:swap-vertical",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["medium_activity_met_minutes"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["medium_activity_met_minutes"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -491,7 +484,8 @@ SENSORS.extend([
         name="Oura V2 Medium Activity Time",
         icon="mdi:timer-outline",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds(_find_first(_daily_first(d.payloads, "daily_activity"), ["medium_activity_time"])),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _min_from_seconds(_find_first(_daily(d, "daily_activity"), ["medium_activity_time"])),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -499,7 +493,8 @@ SENSORS.extend([
         name="Oura V2 Meters To Target",
         icon="mdi:target-variant",
         native_unit_of_measurement=UnitOfLength.METERS,
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["meters_to_target"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["meters_to_target"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -507,7 +502,8 @@ SENSORS.extend([
         name="Oura V2 Non-wear Time",
         icon="mdi:ring",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds(_find_first(_daily_first(d.payloads, "daily_activity"), ["non_wear_time"])),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _min_from_seconds(_find_first(_daily(d, "daily_activity"), ["non_wear_time"])),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -515,7 +511,8 @@ SENSORS.extend([
         name="Oura V2 Resting Time",
         icon="mdi:sleep",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds(_find_first(_daily_first(d.payloads, "daily_activity"), ["resting_time"])),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _min_from_seconds(_find_first(_daily(d, "daily_activity"), ["resting_time"])),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -523,7 +520,8 @@ SENSORS.extend([
         name="Oura V2 Sedentary MET Minutes",
         icon="mdi:chair-rolling",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["sedentary_met_minutes"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["sedentary_met_minutes"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -531,14 +529,16 @@ SENSORS.extend([
         name="Oura V2 Sedentary Time",
         icon="mdi:sofa",
         native_unit_of_measurement="min",
-        value_fn=lambda d: _min_from_seconds(_find_first(_daily_first(d.payloads, "daily_activity"), ["sedentary_time"])),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _min_from_seconds(_find_first(_daily(d, "daily_activity"), ["sedentary_time"])),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="activity_target_calories",
         name="Oura V2 Target Calories",
         icon="mdi:bullseye",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["target_calories"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["target_calories"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -546,7 +546,8 @@ SENSORS.extend([
         name="Oura V2 Target Meters",
         icon="mdi:bullseye-arrow",
         native_unit_of_measurement=UnitOfLength.METERS,
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["target_meters"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["target_meters"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     # Contributors
@@ -554,42 +555,48 @@ SENSORS.extend([
         key="activity_contrib_meet_daily_targets",
         name="Oura V2 Activity Contributor: Meet Daily Targets",
         icon="mdi:target",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["contributors","meet_daily_targets"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["contributors","meet_daily_targets"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="activity_contrib_move_every_hour",
         name="Oura V2 Activity Contributor: Move Every Hour",
         icon="mdi:timer-cog",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["contributors","move_every_hour"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["contributors","move_every_hour"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="activity_contrib_recovery_time",
         name="Oura V2 Activity Contributor: Recovery Time",
         icon="mdi:progress-clock",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["contributors","recovery_time"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["contributors","recovery_time"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="activity_contrib_stay_active",
         name="Oura V2 Activity Contributor: Stay Active",
         icon="mdi:run-fast",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["contributors","stay_active"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["contributors","stay_active"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="activity_contrib_training_frequency",
         name="Oura V2 Activity Contributor: Training Frequency",
         icon="mdi:calendar-check",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["contributors","training_frequency"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["contributors","training_frequency"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="activity_contrib_training_volume",
         name="Oura V2 Activity Contributor: Training Volume",
         icon="mdi:dumbbell",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_activity"), ["contributors","training_volume"]),
+        endpoints=("daily_activity",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_activity"), ["contributors","training_volume"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
 ])
@@ -600,7 +607,8 @@ SENSORS.extend([
         key="spo2_breathing_disturbance_index",
         name="Oura V2 Breathing Disturbance Index",
         icon="mdi:lungs",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_spo2"), ["breathing_disturbance_index"]),
+        endpoints=("daily_spo2",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_spo2"), ["breathing_disturbance_index"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
 ])
@@ -611,14 +619,16 @@ SENSORS.extend([
         key="vo2_max",
         name="Oura V2 VO2 Max",
         icon="mdi:lungs",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "vo2max"), ["vo2_max"]),
+        endpoints=("vo2max",),
+        value_fn=lambda d: _find_first(_daily(d, "vo2max"), ["vo2_max"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="cardiovascular_age",
         name="Oura V2 Cardiovascular Age",
         icon="mdi:heart-cog",
-        value_fn=lambda d: _find_first(_daily_first(d.payloads, "daily_cardiovascular_age"), ["vascular_age"]),
+        endpoints=("daily_cardiovascular_age",),
+        value_fn=lambda d: _find_first(_daily(d, "daily_cardiovascular_age"), ["vascular_age"]),
         state_class=SensorStateClass.MEASUREMENT,
     ),
 ])
@@ -629,7 +639,8 @@ SENSORS.extend([
         key="workouts_today_count",
         name="Oura V2 Workouts Today",
         icon="mdi:arm-flex",
-        value_fn=lambda d: (lambda arr: len(_filter_by_day(arr)))(((d.payloads.get("workout", {}) or {}).get("data"))),
+        endpoints=("workout",),
+        value_fn=lambda d: len(d.snapshot.workouts_today),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -637,21 +648,24 @@ SENSORS.extend([
         name="Oura V2 Workouts Duration Today",
         icon="mdi:timer",
         native_unit_of_measurement="min",
-        value_fn=lambda d: (lambda arr: _sum_duration_minutes(_filter_by_day(arr)))(((d.payloads.get("workout", {}) or {}).get("data"))),
+        endpoints=("workout",),
+        value_fn=lambda d: d.snapshot.workouts_today_duration_min,
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="workouts_today_calories",
         name="Oura V2 Workouts Calories Today",
         icon="mdi:fire",
-        value_fn=lambda d: (lambda arr: (sum((i.get("calories", 0) for i in _filter_by_day(arr) if isinstance(i, dict)), 0) if isinstance(arr, list) else 0))(((d.payloads.get("workout", {}) or {}).get("data"))),
+        endpoints=("workout",),
+        value_fn=lambda d: d.snapshot.workouts_today_calories,
         state_class=SensorStateClass.TOTAL,
     ),
     OuraCalculatedSensorDescription(
         key="last_workout",
         name="Oura V2 Last Workout",
         icon="mdi:run",
-        value_fn=lambda d: (lambda w: (w or {}).get("activity"))(_last_by_time(((d.payloads.get("workout", {}) or {}).get("data")))),
+        endpoints=("workout",),
+        value_fn=lambda d: (d.snapshot.last_workout or {}).get("activity"),
         attr_fn=lambda d: (
             (lambda w: ({
                 "activity": w.get("activity"),
@@ -662,17 +676,18 @@ SENSORS.extend([
                 "source": w.get("source"),
                 "start": w.get("start_datetime"),
                 "end": w.get("end_datetime"),
-                "duration_min": _duration_minutes(w.get("start_datetime"), w.get("end_datetime")),
+                "duration_min": d.snapshot.last_workout_duration_min,
                 "day": w.get("day"),
                 "id": w.get("id"),
-            } if isinstance(w, dict) else {}))(_last_by_time(((d.payloads.get("workout", {}) or {}).get("data"))))
+            } if isinstance(w, dict) else {}))(d.snapshot.last_workout)
         ),
     ),
     OuraCalculatedSensorDescription(
         key="sessions_today_count",
         name="Oura V2 Sessions Today",
         icon="mdi:meditation",
-        value_fn=lambda d: (lambda arr: len(_filter_by_day(arr)))(((d.payloads.get("session", {}) or {}).get("data"))),
+        endpoints=("session",),
+        value_fn=lambda d: len(d.snapshot.sessions_today),
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
@@ -680,59 +695,263 @@ SENSORS.extend([
         name="Oura V2 Sessions Duration Today",
         icon="mdi:timer-outline",
         native_unit_of_measurement="min",
-        value_fn=lambda d: (lambda arr: _sum_duration_minutes(_filter_by_day(arr)))(((d.payloads.get("session", {}) or {}).get("data"))),
+        endpoints=("session",),
+        value_fn=lambda d: d.snapshot.sessions_today_duration_min,
         state_class=SensorStateClass.MEASUREMENT,
     ),
     OuraCalculatedSensorDescription(
         key="last_session",
         name="Oura V2 Last Session",
         icon="mdi:meditation",
-        value_fn=lambda d: (lambda s: (s or {}).get("type"))(_last_by_time(((d.payloads.get("session", {}) or {}).get("data")))),
+        endpoints=("session",),
+        value_fn=lambda d: (d.snapshot.last_session or {}).get("type"),
         attr_fn=lambda d: (
             (lambda s: ({
                 "type": s.get("type"),
                 "mood": s.get("mood"),
                 "start": s.get("start_datetime"),
                 "end": s.get("end_datetime"),
-                "duration_min": _duration_minutes(s.get("start_datetime"), s.get("end_datetime")),
+                "duration_min": d.snapshot.last_session_duration_min,
                 "day": s.get("day"),
                 "id": s.get("id"),
-            } if isinstance(s, dict) else {}))(_last_by_time(((d.payloads.get("session", {}) or {}).get("data"))))
+            } if isinstance(s, dict) else {}))(d.snapshot.last_session)
         ),
     ),
 ])
 
+# Rolling baselines
+def _baseline_description(metric: DailyMetric, days: int) -> OuraCalculatedSensorDescription:
+    def _value(d: OuraData):
+        mean = d.snapshot.baselines[metric.key][days][0]
+        return round(mean, 2) if mean is not None else None
+
+    def _attrs(d: OuraData) -> Dict[str, Any]:
+        # Deviation of the latest day (usually today, not in the window yet) from the baseline
+        mean, std, count = d.snapshot.baselines[metric.key][days]
+        record = d.snapshot.days.latest(metric.endpoint)
+        latest = metric.value_fn(record) if record else None
+        deviation = latest - mean if isinstance(latest, (int, float)) and mean is not None else None
+        return {
+            "days": count,
+            "std_dev": round(std, 2) if std is not None else None,
+            "latest": latest,
+            "deviation": round(deviation, 2) if deviation is not None else None,
+            "z_score": round(deviation / std, 2) if deviation is not None and std else None,
+        }
+
+    return OuraCalculatedSensorDescription(
+        key=f"{metric.key}_baseline_{days}d",
+        name=f"Oura V2 {metric.name} {days}-day Average",
+        icon="mdi:chart-bell-curve-cumulative",
+        native_unit_of_measurement=metric.unit,
+        endpoints=(metric.endpoint,),
+        value_fn=_value,
+        attr_fn=_attrs,
+        unrecorded_attributes=frozenset({"std_dev", "latest", "deviation", "z_score"}),
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        # The shortest window is on by default, the longer ones are opt-in
+        entity_registry_enabled_default=days == BASELINE_WINDOWS[0],
+    )
+
+SENSORS.extend(
+    _baseline_description(metric, days)
+    for metric in DAILY_METRICS if metric.key in BASELINE_METRICS
+    for days in BASELINE_WINDOWS
+)
+
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator: OuraDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     device_info = hass.data[DOMAIN][entry.entry_id]["device_info"]
     uid_prefix = hass.data[DOMAIN][entry.entry_id]["uid_prefix"]
-    entities = [OuraCalculatedSensor(coordinator, desc, device_info, uid_prefix) for desc in SENSORS]
+    entities = [
+        _calculated_sensor_class(desc.unrecorded_attributes)(coordinator, desc, device_info, uid_prefix)
+        for desc in SENSORS
+    ]
+    telemetry = hass.data[DOMAIN][entry.entry_id]["client"].telemetry
+    entities += [OuraTelemetrySensor(entry.entry_id, telemetry, desc, device_info, uid_prefix) for desc in TELEMETRY_SENSORS]
+    entities += [
+        OuraTelemetrySensor(entry.entry_id, telemetry, _endpoint_latency_description(endpoint), device_info, uid_prefix)
+        for endpoint in ENDPOINT_TIERS
+    ]
     async_add_entities(entities)
 
 class OuraCalculatedSensor(CoordinatorEntity[OuraData], SensorEntity):
     entity_description: OuraCalculatedSensorDescription
 
     def __init__(self, coordinator: OuraDataUpdateCoordinator, description: OuraCalculatedSensorDescription, device_info: dict, uid_prefix: str):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset(description.endpoints) or None)
         self.entity_description = description
         self._attr_unique_id = f"{uid_prefix}_{description.key}"
         self._attr_device_info = device_info
-
-    @property
-    def native_value(self):
-        if self.entity_description.value_fn and self.coordinator.data:
+        # Value and attributes of the OuraData generation they were computed from; every
+        # update hands out a new OuraData, so identity is the generation stamp
+        self._memo_data: Optional[OuraData] = None
+        self._memo: tuple[Any, Dict[str, Any]] = (None, {})
+
+    def _computed(self) -> tuple[Any, Dict[str, Any]]:
+        data = self.coordinator.data
+        if data is not self._memo_data:
+            self._memo_data = data
+            self._memo = (self._compute_value(data), self._compute_attributes(data)) if data else (None, {})
+        return self._memo
+
+    def _compute_value(self, data: OuraData):
+        if self.entity_description.value_fn:
             try:
-                return self.entity_description.value_fn(self.coordinator.data)
+                return self.entity_description.value_fn(data)
             except Exception:
                 return None
         return None
 
-    @property
-    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
-        if self.entity_description.attr_fn and self.coordinator.data:
+    def _compute_attributes(self, data: OuraData) -> Dict[str, Any]:
+        if self.entity_description.attr_fn:
             try:
-                attrs = self.entity_description.attr_fn(self.coordinator.data) or {}
+                attrs = self.entity_description.attr_fn(data) or {}
                 return attrs if isinstance(attrs, dict) else {}
             except Exception:
                 return {}
         return {}
+
+    @property
+    def available(self) -> bool:
+        # Unavailable, not unknown, when every endpoint feeding it is gated for this account
+        endpoints = self.entity_description.endpoints
+        if endpoints and not any(self.coordinator.endpoint_available(e) for e in endpoints):
+            return False
+        return super().available
+
+    @property
+    def native_value(self):
+        return self._computed()[0]
+
+    @property
+    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
+        return self._computed()[1]
+
+@lru_cache(maxsize=None)
+def _calculated_sensor_class(unrecorded: frozenset[str]) -> type[OuraCalculatedSensor]:
+    """OuraCalculatedSensor excluding `unrecorded` from the recorder. Home Assistant reads
+    the exclusions per class, so each distinct set gets its own subclass."""
+    if not unrecorded:
+        return OuraCalculatedSensor
+    return type("OuraCalculatedSensor", (OuraCalculatedSensor,), {"_unrecorded_attributes": unrecorded})
+
+# ---------- request telemetry (diagnostic) ----------
+@dataclass
+class OuraTelemetrySensorDescription(SensorEntityDescription):
+    value_fn: Callable[[OuraTelemetry], Any] | None = None
+    attr_fn: Callable[[OuraTelemetry], Dict[str, Any]] | None = None
+
+TELEMETRY_SENSORS: list[OuraTelemetrySensorDescription] = [
+    OuraTelemetrySensorDescription(
+        key="api_requests",
+        name="Oura V2 API Requests",
+        icon="mdi:swap-vertical",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda t: t.total("requests"),
+        attr_fn=lambda t: {"statuses": {
+            str(status): t.status_count(status)
+            for status in sorted({s for e in t.endpoints.values() for s in e.statuses})
+        }},
+    ),
+    OuraTelemetrySensorDescription(
+        key="api_errors",
+        name="Oura V2 API Errors",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda t: t.total("errors"),
+        attr_fn=lambda t: {
+            "rate_limited": t.status_count(429),
+            "by_endpoint": {name: e.errors for name, e in t.endpoints.items() if e.errors},
+        },
+    ),
+    OuraTelemetrySensorDescription(
+        key="api_retries",
+        name="Oura V2 API Retries",
+        icon="mdi:restart",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda t: t.total("retries"),
+    ),
+    OuraTelemetrySensorDescription(
+        key="api_response_bytes",
+        name="Oura V2 API Response Data",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda t: t.total("bytes_total"),
+    ),
+    OuraTelemetrySensorDescription(
+        key="last_refresh_duration",
+        name="Oura V2 Last Refresh Duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda t: round(t.last_refresh_sec, 3) if t.last_refresh_sec is not None else None,
+        attr_fn=lambda t: {"refreshes": t.refreshes, "slowest_endpoint": t.slowest_endpoint()},
+    ),
+]
+
+def _endpoint_latency_description(endpoint: str) -> OuraTelemetrySensorDescription:
+    # One per endpoint; disabled by default since most installs never need them
+    def _attrs(t: OuraTelemetry) -> Dict[str, Any]:
+        stats = t.endpoints.get(endpoint)
+        if stats is None:
+            return {}
+        attrs = stats.as_dict()
+        attrs.pop("latency_last_ms", None)
+        return attrs
+
+    return OuraTelemetrySensorDescription(
+        key=f"api_latency_{endpoint}",
+        name=f"Oura V2 API Latency {endpoint.replace('_', ' ').title()}",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        entity_registry_enabled_default=False,
+        value_fn=lambda t: round(t.endpoints[endpoint].last_latency_ms, 1)
+        if endpoint in t.endpoints and t.endpoints[endpoint].last_latency_ms is not None else None,
+        attr_fn=_attrs,
+    )
+
+class OuraTelemetrySensor(SensorEntity):
+    """Request telemetry of the account's API client; refreshed after every poll."""
+
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description: OuraTelemetrySensorDescription
+    # Counters and latency stats change on every poll; the state is what is worth keeping
+    _unrecorded_attributes = frozenset({
+        "statuses", "rate_limited", "by_endpoint", "refreshes", "slowest_endpoint",
+        "requests", "errors", "retries", "bytes_total", "last_bytes", "latency_avg_ms", "latency_p95_ms",
+        "latency_max_ms", "latency_histogram_ms", "last_status", "last_success", "last_error",
+    })
+
+    def __init__(self, entry_id: str, telemetry: OuraTelemetry, description: OuraTelemetrySensorDescription,
+                 device_info: dict, uid_prefix: str):
+        self._entry_id = entry_id
+        self._telemetry = telemetry
+        self.entity_description = description
+        self._attr_unique_id = f"{uid_prefix}_{description.key}"
+        self._attr_device_info = device_info
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_TELEMETRY.format(self._entry_id), self._handle_telemetry)
+        )
+
+    @callback
+    def _handle_telemetry(self) -> None:
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self):
+        return self.entity_description.value_fn(self._telemetry)
+
+    @property
+    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
+        if self.entity_description.attr_fn is None:
+            return None
+        return self.entity_description.attr_fn(self._telemetry)
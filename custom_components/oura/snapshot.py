@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from .baseline import BaselineStats, OuraBaselines
+from .daystore import DAILY_ENDPOINTS, OuraDayStore
+from .heartrate import HeartRateSeries
+
+def iso_parse(dt_str) -> Optional[datetime]:
+    try:
+        if not dt_str:
+            return None
+        return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+    except Exception:
+        return None
+
+def duration_minutes(start_str, end_str) -> Optional[float]:
+    s = iso_parse(start_str); e = iso_parse(end_str)
+    if s and e:
+        return max(0, (e - s).total_seconds()/60.0)
+    return None
+
+def _records(payloads: dict, key: str) -> List[Dict[str, Any]]:
+    arr = (payloads.get(key, {}) or {}).get("data")
+    if not isinstance(arr, list):
+        return []
+    return [i for i in arr if isinstance(i, dict)]
+
+def _sleep_latest(records: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Latest main sleep period; naps only count when there is no long sleep in the window."""
+    candidates = [i for i in records if i.get("type") == "long_sleep"] or records
+    best = None
+    best_ts = None
+    for i in candidates:
+        ts = iso_parse(i.get("bedtime_start") or i.get("timestamp") or "") or datetime.min.replace(tzinfo=timezone.utc)
+        if best_ts is None or ts >= best_ts:
+            best, best_ts = i, ts
+    return best
+
+def _last_by_time(items, start_key="start_datetime"):
+    best = None
+    best_ts = None
+    for i in items:
+        ts = iso_parse(i.get(start_key) or i.get("timestamp"))
+        if ts and (best_ts is None or ts > best_ts):
+            best, best_ts = i, ts
+    return best
+
+def _sum_duration_minutes(items, start_key="start_datetime", end_key="end_datetime"):
+    total = 0.0
+    for i in items:
+        mins = duration_minutes(i.get(start_key), i.get(end_key))
+        if mins is not None:
+            total += mins
+    return total
+
+class OuraSnapshot:
+    """Normalized view of one coordinator update so sensor reads are plain field lookups."""
+
+    __slots__ = (
+        "daily",
+        "days",
+        "baselines",
+        "sleep_latest",
+        "bedtime_start",
+        "bedtime_end",
+        "hr_latest",
+        "hr_latest_time",
+        "hr_latest_source",
+        "hr_min",
+        "hr_max",
+        "hr_mean",
+        "hr_mean_1h",
+        "workouts_today",
+        "workouts_today_duration_min",
+        "workouts_today_calories",
+        "last_workout",
+        "last_workout_duration_min",
+        "sessions_today",
+        "sessions_today_duration_min",
+        "last_session",
+        "last_session_duration_min",
+    )
+
+    def __init__(self, payloads: Dict[str, Any], today: Optional[str] = None, days: Optional[OuraDayStore] = None,
+                 baselines: Optional[OuraBaselines] = None) -> None:
+        if today is None:
+            today = datetime.now(timezone.utc).astimezone().date().isoformat()
+
+        # Daily summaries: sensors show the latest day available; other days via self.days
+        self.days = days if days is not None else OuraDayStore.from_payloads(payloads)
+        self.daily: Dict[str, Dict[str, Any]] = {}
+        for key in DAILY_ENDPOINTS:
+            record = self.days.latest(key)
+            if record is not None:
+                self.daily[key] = record
+        # metric -> window length -> (mean, std dev, days), over the days before today
+        self.baselines: Dict[str, Dict[int, BaselineStats]] = baselines.stats(today) if baselines is not None else {}
+
+        sleep = _sleep_latest(_records(payloads, "sleep"))
+        self.sleep_latest: Dict[str, Any] = sleep or {}
+        self.bedtime_start = iso_parse(self.sleep_latest.get("bedtime_start"))
+        self.bedtime_end = iso_parse(self.sleep_latest.get("bedtime_end"))
+
+        # Read off the series' incrementally maintained window stats
+        hr = payloads.get("heartrate")
+        if not isinstance(hr, HeartRateSeries):
+            hr = HeartRateSeries.from_payload(hr)
+        self.hr_latest = hr.latest_bpm
+        self.hr_latest_time = hr.latest_time
+        self.hr_latest_source = hr.latest_source
+        self.hr_min = hr.min
+        self.hr_max = hr.max
+        self.hr_mean = hr.mean
+        self.hr_mean_1h = hr.mean_1h
+
+        workouts = _records(payloads, "workout")
+        self.workouts_today = [i for i in workouts if i.get("day") == today]
+        self.workouts_today_duration_min = _sum_duration_minutes(self.workouts_today)
+        self.workouts_today_calories = sum((i.get("calories", 0) or 0 for i in self.workouts_today), 0)
+        self.last_workout = _last_by_time(workouts)
+        self.last_workout_duration_min = (
+            duration_minutes(self.last_workout.get("start_datetime"), self.last_workout.get("end_datetime"))
+            if self.last_workout else None
+        )
+
+        sessions = _records(payloads, "session")
+        self.sessions_today = [i for i in sessions if i.get("day") == today]
+        self.sessions_today_duration_min = _sum_duration_minutes(self.sessions_today)
+        self.last_session = _last_by_time(sessions)
+        self.last_session_duration_min = (
+            duration_minutes(self.last_session.get("start_datetime"), self.last_session.get("end_datetime"))
+            if self.last_session else None
+        )
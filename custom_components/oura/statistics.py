@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import PERCENTAGE, UnitOfTemperature
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN
+
+@dataclass(frozen=True)
+class DailyMetric:
+    """One number per day taken from a record of a day-keyed endpoint."""
+    key: str
+    name: str
+    endpoint: str
+    unit: Optional[str]
+    value_fn: Callable[[Dict[str, Any]], Any]
+
+def pick_main_sleep(current: Optional[Dict[str, Any]], candidate: Dict[str, Any]) -> Dict[str, Any]:
+    """The sleep endpoint has several periods per day; keep the longest long_sleep."""
+    def rank(rec):
+        return (rec.get("type") == "long_sleep", rec.get("total_sleep_duration") or 0)
+    return candidate if current is None or rank(candidate) > rank(current) else current
+
+DAILY_METRICS: tuple[DailyMetric, ...] = (
+    DailyMetric("readiness_score", "Readiness Score", "daily_readiness", PERCENTAGE, lambda r: r.get("score")),
+    DailyMetric("sleep_score", "Sleep Score", "daily_sleep", PERCENTAGE, lambda r: r.get("score")),
+    DailyMetric("activity_score", "Activity Score", "daily_activity", PERCENTAGE, lambda r: r.get("score")),
+    DailyMetric("steps", "Steps", "daily_activity", None, lambda r: r.get("steps")),
+    DailyMetric("hrv", "HRV RMSSD (Night)", "sleep", "ms", lambda r: r.get("average_hrv")),
+    DailyMetric("resting_heart_rate", "Resting Heart Rate", "sleep", "bpm", lambda r: r.get("lowest_heart_rate")),
+    DailyMetric(
+        "temperature_deviation", "Temperature Deviation", "daily_readiness",
+        UnitOfTemperature.CELSIUS, lambda r: r.get("temperature_deviation"),
+    ),
+)
+
+def statistic_id(user_key: str, metric: str) -> str:
+    return f"{DOMAIN}:{slugify(user_key)}_{metric}"
+
+def statistic_metadata(user_key: str, metric: str, name: str, unit: Optional[str]) -> StatisticMetaData:
+    return StatisticMetaData(
+        has_mean=True,
+        has_sum=False,
+        name=f"Oura V2 {name}",
+        source=DOMAIN,
+        statistic_id=statistic_id(user_key, metric),
+        unit_of_measurement=unit,
+    )
+
+def day_start(day: date) -> datetime:
+    """Daily values are stored as a single hourly row at local midnight of their day."""
+    return dt_util.start_of_local_day(day)
+
+def daily_statistic(day: date, value: float) -> StatisticData:
+    return StatisticData(start=day_start(day), mean=value, min=value, max=value)
+
+def import_statistics(hass: HomeAssistant, metadata: StatisticMetaData, rows: Iterable[StatisticData]) -> int:
+    rows = sorted(rows, key=lambda r: r["start"])
+    if rows:
+        async_add_external_statistics(hass, metadata, rows)
+    return len(rows)
+
+def daily_rows(metric: DailyMetric, records_by_day: Dict[str, Dict[str, Any]]) -> List[StatisticData]:
+    rows = []
+    for day_str, record in records_by_day.items():
+        value = metric.value_fn(record)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            rows.append(daily_statistic(date.fromisoformat(day_str), float(value)))
+    return rows
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from .const import TELEMETRY_LATENCY_BUCKETS_MS
+
+def endpoint_name(path: str) -> str:
+    """'/usercollection/daily_sleep' -> 'daily_sleep'."""
+    return path.rstrip("/").rsplit("/", 1)[-1]
+
+class EndpointTelemetry:
+    """Counters for one endpoint; latency covers the request and reading the body."""
+
+    __slots__ = (
+        "requests", "retries", "failures", "bytes_total", "last_bytes", "statuses",
+        "buckets", "latency_sum_ms", "latency_max_ms", "last_latency_ms",
+        "last_status", "last_success", "last_error",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0  # requests that never got a response (network errors, timeouts)
+        self.bytes_total = 0
+        self.last_bytes = 0
+        self.statuses: Counter = Counter()
+        # One count per bucket of TELEMETRY_LATENCY_BUCKETS_MS plus a final overflow bucket
+        self.buckets: List[int] = [0] * (len(TELEMETRY_LATENCY_BUCKETS_MS) + 1)
+        self.latency_sum_ms = 0.0
+        self.latency_max_ms = 0.0
+        self.last_latency_ms: Optional[float] = None
+        self.last_status: Optional[int] = None
+        self.last_success: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+    def record(self, status: Optional[int], latency_ms: float, nbytes: int = 0, error: Optional[str] = None) -> None:
+        self.requests += 1
+        self.last_latency_ms = latency_ms
+        self.latency_sum_ms += latency_ms
+        self.latency_max_ms = max(self.latency_max_ms, latency_ms)
+        index = 0
+        while index < len(TELEMETRY_LATENCY_BUCKETS_MS) and latency_ms > TELEMETRY_LATENCY_BUCKETS_MS[index]:
+            index += 1
+        self.buckets[index] += 1
+        self.last_status = status
+        if status is None:
+            self.failures += 1
+        else:
+            self.statuses[status] += 1
+            self.bytes_total += nbytes
+            self.last_bytes = nbytes
+        if status is not None and status < 400:
+            self.last_success = datetime.now(timezone.utc)
+        else:
+            self.last_error = error
+
+    @property
+    def errors(self) -> int:
+        return self.failures + sum(n for status, n in self.statuses.items() if status >= 400)
+
+    @property
+    def latency_avg_ms(self) -> Optional[float]:
+        return self.latency_sum_ms / self.requests if self.requests else None
+
+    def latency_percentile_ms(self, pct: float) -> Optional[float]:
+        """Upper bound of the histogram bucket holding the given percentile."""
+        if not self.requests:
+            return None
+        target = self.requests * pct / 100
+        seen = 0
+        for bound, count in zip(TELEMETRY_LATENCY_BUCKETS_MS, self.buckets):
+            seen += count
+            if seen >= target:
+                return float(bound)
+        return self.latency_max_ms
+
+    def as_dict(self) -> Dict[str, Any]:
+        avg = self.latency_avg_ms
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items())},
+            "bytes_total": self.bytes_total,
+            "last_bytes": self.last_bytes,
+            "latency_last_ms": round(self.last_latency_ms, 1) if self.last_latency_ms is not None else None,
+            "latency_avg_ms": round(avg, 1) if avg is not None else None,
+            "latency_p95_ms": self.latency_percentile_ms(95),
+            "latency_max_ms": round(self.latency_max_ms, 1),
+            "latency_histogram_ms": {
+                **{f"<={b}": n for b, n in zip(TELEMETRY_LATENCY_BUCKETS_MS, self.buckets)},
+                f">{TELEMETRY_LATENCY_BUCKETS_MS[-1]}": self.buckets[-1],
+            },
+            "last_status": self.last_status,
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "last_error": self.last_error,
+        }
+
+class OuraTelemetry:
+    """Per-endpoint request telemetry of one OuraApiClient, plus refresh timings."""
+
+    def __init__(self) -> None:
+        self.endpoints: Dict[str, EndpointTelemetry] = {}
+        self.refreshes = 0
+        self.last_refresh_sec: Optional[float] = None
+
+    def endpoint(self, path: str) -> EndpointTelemetry:
+        name = endpoint_name(path)
+        stats = self.endpoints.get(name)
+        if stats is None:
+            stats = self.endpoints[name] = EndpointTelemetry()
+        return stats
+
+    def record_refresh(self, seconds: float) -> None:
+        self.refreshes += 1
+        self.last_refresh_sec = seconds
+
+    def total(self, attr: str) -> int:
+        return sum(getattr(stats, attr) for stats in self.endpoints.values())
+
+    def status_count(self, status: int) -> int:
+        return sum(stats.statuses.get(status, 0) for stats in self.endpoints.values())
+
+    def slowest_endpoint(self) -> Optional[str]:
+        """Endpoint whose most recent request took longest."""
+        timed = [(s.last_latency_ms, name) for name, s in self.endpoints.items() if s.last_latency_ms is not None]
+        return max(timed)[1] if timed else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "refreshes": self.refreshes,
+            "last_refresh_sec": round(self.last_refresh_sec, 3) if self.last_refresh_sec is not None else None,
+            "requests": self.total("requests"),
+            "errors": self.total("errors"),
+            "retries": self.total("retries"),
+            "bytes_total": self.total("bytes_total"),
+            "endpoints": {name: stats.as_dict() for name, stats in sorted(self.endpoints.items())},
+        }
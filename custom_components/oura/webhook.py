@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Set
+
+from aiohttp import ClientError, web
+
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.network import NoURLAvailableError
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    API_BASE,
+    DOMAIN,
+    CONF_WEBHOOK_VERIFICATION_TOKEN,
+    WEBHOOK_SUBSCRIPTION_PATH,
+    WEBHOOK_EVENT_TYPES,
+    WEBHOOK_DATA_TYPES,
+    WEBHOOK_RENEW_INTERVAL_HOURS,
+    WEBHOOK_RENEW_BEFORE_DAYS,
+    WEBHOOK_DEBOUNCE_SEC,
+)
+from .coordinator import OuraDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+class OuraWebhookSubscriptionApi:
+    """Oura webhook subscription endpoints; these authenticate with the OAuth app's client credentials."""
+
+    def __init__(self, hass: HomeAssistant, client_id: str, client_secret: str, *, api_base: str = API_BASE) -> None:
+        self._session = async_get_clientsession(hass)
+        self._url = f"{api_base}{WEBHOOK_SUBSCRIPTION_PATH}"
+        self._headers = {"x-client-id": client_id, "x-client-secret": client_secret}
+        # Also the key Oura signs notifications with
+        self.client_secret = client_secret
+
+    async def _request(self, method: str, url: str, **kwargs) -> Any:
+        async with self._session.request(method, url, headers=self._headers, **kwargs) as resp:
+            if resp.status >= 400:
+                raise ClientError(f"{method} {url} -> {resp.status}: {await resp.text()}")
+            if resp.status == 204:
+                return None
+            return await resp.json(content_type=None)
+
+    async def list(self) -> List[Dict[str, Any]]:
+        return await self._request("GET", self._url) or []
+
+    async def create(self, callback_url: str, verification_token: str, event_type: str, data_type: str) -> Dict[str, Any]:
+        return await self._request("POST", self._url, json={
+            "callback_url": callback_url,
+            "verification_token": verification_token,
+            "event_type": event_type,
+            "data_type": data_type,
+        })
+
+    async def renew(self, subscription_id: str) -> Dict[str, Any]:
+        return await self._request("PUT", f"{self._url}/renew/{subscription_id}")
+
+    async def delete(self, subscription_id: str) -> None:
+        await self._request("DELETE", f"{self._url}/{subscription_id}")
+
+def _signature_valid(secret: str, timestamp: str, body: bytes, signature: str) -> bool:
+    """Oura signs each notification with HMAC-SHA256 over timestamp + body, keyed with the
+    OAuth app's client secret, sent hex-encoded in x-oura-signature."""
+    expected = hmac.new(secret.encode(), timestamp.encode() + body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature.lower())
+
+class OuraWebhookManager:
+    """Receives Oura push notifications for one config entry and keeps its subscriptions alive."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, coordinator: OuraDataUpdateCoordinator,
+                 api: OuraWebhookSubscriptionApi) -> None:
+        self.hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._api = api
+        self._webhook_id: str = entry.data[CONF_WEBHOOK_ID]
+        self._verification_token: str = entry.data[CONF_WEBHOOK_VERIFICATION_TOKEN]
+        self._unsub_renew = None
+        # Data types notified since the last refresh, and the pending debounce timer
+        self._pending: Set[str] = set()
+        self._unsub_flush = None
+        self.callback_url: Optional[str] = None
+        self.notifications_received = 0
+
+    @staticmethod
+    def ensure_entry_data(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Give the entry a stable webhook id and verification token the first time webhooks are enabled."""
+        if CONF_WEBHOOK_ID in entry.data and CONF_WEBHOOK_VERIFICATION_TOKEN in entry.data:
+            return
+        hass.config_entries.async_update_entry(entry, data={
+            **entry.data,
+            CONF_WEBHOOK_ID: webhook.async_generate_id(),
+            CONF_WEBHOOK_VERIFICATION_TOKEN: secrets.token_urlsafe(24),
+        })
+
+    async def async_setup(self) -> bool:
+        try:
+            self.callback_url = webhook.async_generate_url(self.hass, self._webhook_id, allow_internal=False)
+        except NoURLAvailableError:
+            _LOGGER.warning("Oura webhooks need an external Home Assistant URL; staying on polling")
+            return False
+        webhook.async_register(
+            self.hass, DOMAIN, "Oura V2", self._webhook_id, self._async_handle_webhook,
+            allowed_methods=("GET", "POST"),
+        )
+        try:
+            await self._async_sync_subscriptions()
+        except ClientError as err:
+            _LOGGER.warning("Could not create Oura webhook subscriptions, staying on polling: %s", err)
+            webhook.async_unregister(self.hass, self._webhook_id)
+            return False
+        self._unsub_renew = async_track_time_interval(
+            self.hass, self._async_renew, timedelta(hours=WEBHOOK_RENEW_INTERVAL_HOURS)
+        )
+        return True
+
+    async def async_unload(self) -> None:
+        if self._unsub_renew:
+            self._unsub_renew()
+            self._unsub_renew = None
+        if self._unsub_flush:
+            self._unsub_flush()
+            self._unsub_flush = None
+        webhook.async_unregister(self.hass, self._webhook_id)
+
+    async def async_remove_subscriptions(self) -> None:
+        for sub in await self._api.list():
+            if self._webhook_id in (sub.get("callback_url") or ""):
+                await self._api.delete(sub["id"])
+
+    async def _async_sync_subscriptions(self) -> None:
+        existing = {
+            (sub.get("event_type"), sub.get("data_type"))
+            for sub in await self._api.list()
+            if sub.get("callback_url") == self.callback_url
+        }
+        for data_type in WEBHOOK_DATA_TYPES:
+            for event_type in WEBHOOK_EVENT_TYPES:
+                if (event_type, data_type) in existing:
+                    continue
+                await self._api.create(self.callback_url, self._verification_token, event_type, data_type)
+                _LOGGER.debug("Subscribed to Oura %s/%s notifications", data_type, event_type)
+
+    async def _async_renew(self, _now=None) -> None:
+        horizon = dt_util.utcnow() + timedelta(days=WEBHOOK_RENEW_BEFORE_DAYS)
+        try:
+            for sub in await self._api.list():
+                if sub.get("callback_url") != self.callback_url:
+                    continue
+                expires = dt_util.parse_datetime(sub.get("expiration_time") or "")
+                if expires is None or expires <= horizon:
+                    await self._api.renew(sub["id"])
+            await self._async_sync_subscriptions()
+        except ClientError as err:
+            _LOGGER.warning("Renewing Oura webhook subscriptions failed: %s", err)
+
+    def _user_matches(self, user_id: Optional[str]) -> bool:
+        data = self._coordinator.data
+        own_id = ((data.payloads.get("personal_info") or {}) if data else {}).get("id")
+        return not user_id or not own_id or str(user_id) == str(own_id)
+
+    async def _async_handle_webhook(self, hass: HomeAssistant, webhook_id: str, request: web.Request) -> web.Response:
+        if request.method == "GET":
+            # Subscription verification handshake
+            if request.query.get("verification_token") != self._verification_token:
+                return web.Response(status=401)
+            return web.json_response({"challenge": request.query.get("challenge")})
+
+        raw = await request.read()
+        signature = request.headers.get("x-oura-signature", "")
+        timestamp = request.headers.get("x-oura-timestamp", "")
+        if not _signature_valid(self._api.client_secret, timestamp, raw, signature):
+            _LOGGER.debug("Rejected Oura webhook notification with a missing or invalid signature")
+            return web.Response(status=401)
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            return web.Response(status=400)
+        if not isinstance(body, dict):
+            return web.Response(status=400)
+        data_type = body.get("data_type")
+        if data_type not in WEBHOOK_DATA_TYPES or not self._user_matches(body.get("user_id")):
+            return web.Response(status=200)
+        self.notifications_received += 1
+        _LOGGER.debug("Oura %s notification for %s", body.get("event_type"), data_type)
+        # Acknowledge right away; the refresh runs once the burst of notifications settles
+        self._pending.add(data_type)
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(hass, WEBHOOK_DEBOUNCE_SEC, self._async_flush)
+        return web.Response(status=200)
+
+    async def _async_flush(self, _now=None) -> None:
+        self._unsub_flush = None
+        keys, self._pending = frozenset(self._pending), set()
+        await self._coordinator.async_refresh_coalesced(keys)
+
+    def diagnostics(self) -> Dict[str, Any]:
+        return {
+            "active": self._unsub_renew is not None,
+            "notifications_received": self.notifications_received,
+        }
@@ -0,0 +1,16 @@
+"""Shared fixtures. Tests that need a running Home Assistant use the `hass` fixture of
+pytest-homeassistant-custom-component (see requirements_test.txt)."""
+from __future__ import annotations
+
+import pytest
+
+try:
+    import pytest_homeassistant_custom_component  # noqa: F401
+except ImportError:
+    pass
+else:
+    pytest_plugins = "pytest_homeassistant_custom_component"
+
+    @pytest.fixture(autouse=True)
+    def auto_enable_custom_integrations(enable_custom_integrations):
+        yield
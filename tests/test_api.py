@@ -0,0 +1,71 @@
+"""OuraApiClient against tools/mock_server.py: paging, retries and token refresh."""
+from __future__ import annotations
+
+import dataclasses
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+import aiohttp  # noqa: E402
+
+from custom_components.oura.api import OuraApiClient, OuraApiError, OuraRateLimitError, OuraTokenAuth  # noqa: E402
+from custom_components.oura.const import MAX_RETRIES  # noqa: E402
+from tools.load_test import MockOAuthAuth  # noqa: E402
+from tools.mock_server import PROFILES, Faults, MockOuraServer  # noqa: E402
+
+START = (date.today() - timedelta(days=40)).isoformat()
+END = date.today().isoformat()
+
+@pytest.fixture
+async def mock_api():
+    server = MockOuraServer(PROFILES["realistic"], faults=Faults(retry_after_sec=0), seed=1, strict_tokens=True)
+    base_url = await server.start()
+    async with aiohttp.ClientSession() as http:
+        yield server, base_url, http
+    await server.stop()
+
+async def _client(http, base_url, user="user-1"):
+    auth = await MockOAuthAuth.authorize(http, base_url, user)
+    return OuraApiClient(http, auth, api_base=f"{base_url}/v2"), auth
+
+async def test_paged_collection_matches_a_single_page(mock_api):
+    server, base_url, http = mock_api
+    client, _ = await _client(http, base_url)
+    whole = await client.daily_sleep(START, END)
+    server.faults = dataclasses.replace(server.faults, page_size=7)
+    paged = await client.daily_sleep(START, END)
+    assert len(whole["data"]) > 7
+    assert paged == whole
+    assert server.stats["paged_responses"] == len(whole["data"]) // 7 + (len(whole["data"]) % 7 > 0) - 1
+
+async def test_rate_limit_is_retried_then_raised(mock_api):
+    server, base_url, http = mock_api
+    client, _ = await _client(http, base_url)
+    server.faults = dataclasses.replace(server.faults, rate_429=1.0)
+    with pytest.raises(OuraRateLimitError):
+        await client.daily_readiness(START, END)
+    assert server.stats["injected_429"] == MAX_RETRIES + 1
+    assert client.telemetry.endpoint("/usercollection/daily_readiness").retries == MAX_RETRIES
+
+async def test_rejected_token_is_refreshed_once(mock_api):
+    server, base_url, http = mock_api
+    client, auth = await _client(http, base_url)
+    # Expire every issued token on the server only; the client still thinks its token is valid
+    async with http.post(f"{base_url}/_mock/faults", json={"token_ttl_sec": 0}) as resp:
+        resp.raise_for_status()
+    server.faults = dataclasses.replace(server.faults, token_ttl_sec=86400)
+    payload = await client.daily_activity(START, END)
+    assert payload["data"]
+    assert auth.refreshes == 1
+    assert server.stats["token_refreshes"] == 1
+    assert server.stats["rejected_401"] == 1
+
+async def test_fixed_token_is_not_retried(mock_api):
+    server, base_url, http = mock_api
+    client = OuraApiClient(http, OuraTokenAuth("not-issued"), api_base=f"{base_url}/v2")
+    with pytest.raises(OuraApiError) as err:
+        await client.personal_info()
+    assert err.value.status == 401
+    assert server.stats["rejected_401"] == 1
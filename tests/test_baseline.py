@@ -0,0 +1,90 @@
+"""Rolling baselines against statistics.fmean/pstdev over the same days."""
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+from statistics import fmean, pstdev
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.oura.baseline import OuraBaselines, RollingWindow  # noqa: E402
+from custom_components.oura.const import BASELINE_WINDOWS  # noqa: E402
+
+START = date(2024, 1, 1).toordinal()
+
+def _reference(values: dict, today: int, days: int):
+    window = [v for o, v in values.items() if today - days <= o < today]
+    if not window:
+        return None, None, 0
+    return fmean(window), pstdev(window), len(window)
+
+def _assert_stats(actual, expected):
+    assert actual[2] == expected[2]
+    if expected[2]:
+        assert actual[0] == pytest.approx(expected[0])
+        # Sums carried over hundreds of pushes keep some rounding noise; it surfaces as
+        # ~1e-6 once the variance is near zero and the square root magnifies it
+        assert actual[1] == pytest.approx(expected[1], abs=1e-4)
+    else:
+        assert actual[:2] == (None, None)
+
+@pytest.mark.parametrize("days", BASELINE_WINDOWS)
+def test_running_sums_match_reference_with_gaps(days):
+    rng = random.Random(days)
+    window, values = RollingWindow(days), {}
+    ordinal = today = START
+    for _ in range(200):
+        # Days without a record (ring not worn) leave gaps; days arrive in order and
+        # `today` never goes back
+        ordinal = max(ordinal + rng.choice((1, 1, 1, 2, 5)), today - 1)
+        values[ordinal] = rng.uniform(20, 100)
+        window.push(ordinal, values[ordinal])
+        today = max(today, ordinal + rng.choice((1, 2, days + 3)))
+        window.advance(today)
+        _assert_stats(window.stats(), _reference(values, today, days))
+
+def test_constant_series_has_zero_deviation():
+    window = RollingWindow(7)
+    for i in range(20):
+        window.push(START + i, 0.1)
+    mean, std, count = window.stats()
+    # Running sums leave only rounding noise, never a negative variance
+    assert (mean, std, count) == (pytest.approx(0.1), pytest.approx(0.0, abs=1e-6), 7)
+
+def test_window_empties_after_a_long_gap():
+    window = RollingWindow(7)
+    window.push(START, 50.0)
+    window.advance(START + 30)
+    assert len(window) == 0
+    assert window.stats() == (None, None, 0)
+
+def _readiness(day: date, score):
+    return day.isoformat(), {"day": day.isoformat(), "score": score, "temperature_deviation": 0.1}
+
+def test_baselines_ingest_finalized_days_once():
+    baselines = OuraBaselines()
+    first = date(2024, 1, 1)
+    days = [_readiness(first + timedelta(days=i), 60 + i) for i in range(10)]
+    baselines.ingest("daily_readiness", days)
+    # Replayed or older days are ignored
+    baselines.ingest("daily_readiness", days[-3:])
+    today = (first + timedelta(days=10)).isoformat()
+    stats = baselines.stats(today)["readiness_score"]
+    _assert_stats(stats[7], (fmean(range(63, 70)), pstdev(range(63, 70)), 7))
+    _assert_stats(stats[30], (fmean(range(60, 70)), pstdev(range(60, 70)), 10))
+    # Other endpoints do not feed the readiness metrics
+    assert baselines.stats(today)["sleep_score"][7] == (None, None, 0)
+
+def test_baselines_skip_missing_and_non_numeric_values():
+    baselines = OuraBaselines()
+    first = date(2024, 1, 1)
+    baselines.ingest("daily_readiness", [
+        _readiness(first, 70),
+        _readiness(first + timedelta(days=1), None),
+        _readiness(first + timedelta(days=2), True),
+        _readiness(first + timedelta(days=3), 80),
+    ])
+    stats = baselines.stats((first + timedelta(days=4)).isoformat())["readiness_score"][7]
+    _assert_stats(stats, (75.0, 5.0, 2))
@@ -0,0 +1,123 @@
+"""async_refresh_coalesced: joining a refresh in flight, follow-ups and forced refreshes."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.helpers.update_coordinator import UpdateFailed  # noqa: E402
+
+from custom_components.oura.const import FORCED_REFRESH_MIN_INTERVAL_SEC  # noqa: E402
+from custom_components.oura.coordinator import ENDPOINTS, OuraData, OuraDataUpdateCoordinator  # noqa: E402
+
+class _FakePoll:
+    """Stands in for _async_poll: records what each poll was asked to re-fetch and can be
+    held open to keep a refresh in flight."""
+
+    def __init__(self, coordinator: OuraDataUpdateCoordinator) -> None:
+        self._coordinator = coordinator
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fail = False
+        self.invalidated = []
+
+    async def __call__(self) -> OuraData:
+        fetched_at = self._coordinator._fetched_at
+        self.invalidated.append(frozenset(k for k in ENDPOINTS if k not in fetched_at))
+        # Everything counts as fresh again once polled
+        fetched_at.update(dict.fromkeys(ENDPOINTS, datetime.now(timezone.utc)))
+        await self.gate.wait()
+        if self.fail:
+            raise UpdateFailed("boom")
+        return OuraData(payloads={"polls": len(self.invalidated)})
+
+@pytest.fixture
+def coordinator(hass):
+    coordinator = OuraDataUpdateCoordinator(hass, MagicMock(), timedelta(minutes=30), "Oura", "entry")
+    coordinator._fetched_at.update(dict.fromkeys(ENDPOINTS, datetime.now(timezone.utc)))
+    return coordinator
+
+@pytest.fixture
+def poll(coordinator):
+    fake = _FakePoll(coordinator)
+    with patch.object(coordinator, "_async_poll", fake):
+        yield fake
+
+async def _start(hass, coordinator, *args, **kwargs) -> asyncio.Task:
+    task = hass.async_create_task(coordinator.async_refresh_coalesced(*args, **kwargs))
+    await asyncio.sleep(0)
+    return task
+
+async def test_concurrent_callers_join_one_refresh(hass, coordinator, poll):
+    poll.gate.clear()
+    first = await _start(hass, coordinator, ["daily_sleep"])
+    joiners = [await _start(hass, coordinator, ["daily_sleep"]) for _ in range(3)]
+    poll.gate.set()
+    assert await first is False
+    assert [await task for task in joiners] == [True, True, True]
+    assert poll.invalidated == [frozenset({"daily_sleep"})]
+    assert coordinator.refreshes_joined == 3
+
+async def test_uncovered_endpoint_gets_a_follow_up_refresh(hass, coordinator, poll):
+    poll.gate.clear()
+    first = await _start(hass, coordinator, ["daily_sleep"])
+    second = await _start(hass, coordinator, ["workout"])
+    poll.gate.set()
+    assert await first is False
+    # The poll in flight was not asked for workouts, so it cannot answer for them
+    assert await second is False
+    assert poll.invalidated == [frozenset({"daily_sleep"}), frozenset({"workout"})]
+    assert coordinator.refreshes_joined == 0
+
+async def test_sequential_refreshes_do_not_join(hass, coordinator, poll):
+    assert await coordinator.async_refresh_coalesced(["sleep"]) is False
+    assert await coordinator.async_refresh_coalesced(["sleep"]) is False
+    assert len(poll.invalidated) == 2
+
+async def test_forced_refresh_within_the_minimum_interval_joins(hass, coordinator, poll):
+    assert await coordinator.async_refresh_coalesced(force=True) is False
+    assert poll.invalidated == [frozenset(ENDPOINTS)]
+    assert await coordinator.async_refresh_coalesced(force=True) is True
+    assert len(poll.invalidated) == 1
+    # Non-forced refreshes are not held back by the interval
+    assert await coordinator.async_refresh_coalesced(["sleep"]) is False
+    assert len(poll.invalidated) == 2
+
+async def test_forced_refresh_after_the_minimum_interval_runs(hass, coordinator, poll):
+    assert await coordinator.async_refresh_coalesced(force=True) is False
+    done_at, covered = coordinator._refresh_done
+    coordinator._refresh_done = (done_at - FORCED_REFRESH_MIN_INTERVAL_SEC - 1, covered)
+    assert await coordinator.async_refresh_coalesced(force=True) is False
+    assert poll.invalidated == [frozenset(ENDPOINTS)] * 2
+
+async def test_failed_refresh_does_not_satisfy_a_forced_one(hass, coordinator, poll):
+    poll.fail = True
+    assert await coordinator.async_refresh_coalesced(force=True) is False
+    assert not coordinator.last_update_success
+    poll.fail = False
+    assert await coordinator.async_refresh_coalesced(force=True) is False
+    assert coordinator.last_update_success
+    assert len(poll.invalidated) == 2
+
+async def test_forced_caller_follows_up_on_a_partial_refresh(hass, coordinator, poll):
+    poll.gate.clear()
+    first = await _start(hass, coordinator, ["daily_sleep"])
+    forced = await _start(hass, coordinator, force=True)
+    poll.gate.set()
+    assert await first is False
+    assert await forced is False
+    assert poll.invalidated == [frozenset({"daily_sleep"}), frozenset(ENDPOINTS)]
+
+async def test_shutdown_cancels_the_refresh_in_flight(hass, coordinator, poll):
+    poll.gate.clear()
+    caller = await _start(hass, coordinator, ["daily_sleep"])
+    refresh = coordinator._refresh_task
+    await coordinator.async_shutdown()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    assert refresh.cancelled()
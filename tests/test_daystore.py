@@ -0,0 +1,95 @@
+"""OuraDayStore finalization, fetch windows and persistence."""
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.oura.const import DAYSTORE_RETENTION_DAYS  # noqa: E402
+from custom_components.oura.daystore import OuraDayStore  # noqa: E402
+
+TODAY = "2024-03-10"
+
+def _day(offset: int) -> str:
+    return (date.fromisoformat(TODAY) + timedelta(days=offset)).isoformat()
+
+def _records(*offsets: int, score: int = 80):
+    return [{"day": _day(o), "score": score + o} for o in offsets]
+
+def test_nothing_final_before_a_later_day_arrives():
+    store = OuraDayStore()
+    assert store.merge("daily_sleep", _records(-1), _day(-1), TODAY, TODAY) == []
+    assert store.fetch_start("daily_sleep", _day(-1), TODAY) == _day(-1)
+    assert store.latest("daily_sleep")["day"] == _day(-1)
+
+def test_day_before_the_newest_becomes_final():
+    store = OuraDayStore()
+    finalized = store.merge("daily_sleep", _records(-3, -2, -1, 0), _day(-3), TODAY, TODAY)
+    assert [day for day, _ in finalized] == [_day(-3), _day(-2), _day(-1)]
+    assert [day for day, _ in store.final_days("daily_sleep")] == [_day(-3), _day(-2), _day(-1)]
+    # Only today is requested again
+    assert store.fetch_start("daily_sleep", _day(-1), TODAY) == TODAY
+    # Re-fetching just today finalizes nothing new
+    assert store.merge("daily_sleep", _records(0, score=90), TODAY, TODAY, TODAY) == []
+    assert store.get("daily_sleep", TODAY)["score"] == 90
+    assert store.get("daily_sleep", _day(-1))["score"] == 79
+
+def test_finalized_days_are_reported_once():
+    store = OuraDayStore()
+    store.merge("daily_sleep", _records(-2, -1), _day(-2), _day(-1), _day(-1))
+    finalized = store.merge("daily_sleep", _records(-1, 0), _day(-1), TODAY, TODAY)
+    assert [day for day, _ in finalized] == [_day(-1)]
+
+def test_days_missing_from_an_authoritative_fetch_are_deleted():
+    store = OuraDayStore()
+    store.merge("daily_activity", _records(-1, 0), _day(-1), TODAY, TODAY)
+    store.merge("daily_activity", [], TODAY, TODAY, TODAY)
+    assert store.get("daily_activity", TODAY) is None
+    assert store.latest("daily_activity")["day"] == _day(-1)
+    assert store.get("daily_activity", _day(-1)) is not None
+
+def test_old_days_fall_out_of_retention():
+    store = OuraDayStore()
+    offsets = range(-DAYSTORE_RETENTION_DAYS - 5, 1)
+    store.merge("daily_readiness", _records(*offsets), _day(offsets[0]), TODAY, TODAY)
+    held = sorted(store.days("daily_readiness"))
+    assert held[0] == _day(-DAYSTORE_RETENTION_DAYS)
+    assert held[-1] == TODAY
+
+def test_fetch_start_is_capped_at_the_retention_window():
+    store = OuraDayStore()
+    store.merge("daily_sleep", _records(-3, -2), _day(-3), _day(-2), _day(-2))
+    assert store.fetch_start("daily_sleep", _day(-1), TODAY) == _day(-2)
+    # Weeks without a refresh: never ask for more than the retention window
+    later = _day(DAYSTORE_RETENTION_DAYS * 2)
+    assert store.fetch_start("daily_sleep", _day(-1), later) == _day(DAYSTORE_RETENTION_DAYS)
+
+def test_sleep_keeps_the_main_period_of_each_day():
+    store = OuraDayStore()
+    nap = {"day": TODAY, "type": "sleep", "total_sleep_duration": 1800}
+    night = {"day": TODAY, "type": "long_sleep", "total_sleep_duration": 25000}
+    store.merge("sleep", [night, nap], TODAY, TODAY, TODAY)
+    assert store.get("sleep", TODAY) is night
+
+def test_dict_round_trip_keeps_final_days():
+    store = OuraDayStore()
+    store.merge("daily_sleep", _records(-2, -1, 0), _day(-2), TODAY, TODAY)
+    restored = OuraDayStore.from_dict(store.as_dict())
+    assert restored.final_days("daily_sleep") == store.final_days("daily_sleep")
+    assert restored.latest("daily_sleep") == store.latest("daily_sleep")
+    assert restored.fetch_start("daily_sleep", _day(-1), TODAY) == TODAY
+    assert OuraDayStore.from_dict(None).days("daily_sleep") == {}
+
+def test_from_payloads_marks_nothing_final():
+    store = OuraDayStore.from_payloads({"daily_sleep": {"data": _records(-1, 0)}})
+    assert store.latest("daily_sleep")["day"] == TODAY
+    assert store.final_days("daily_sleep") == []
+
+def test_drop_forgets_an_endpoint():
+    store = OuraDayStore()
+    store.merge("daily_spo2", _records(-1, 0), _day(-1), TODAY, TODAY)
+    store.drop("daily_spo2")
+    assert store.latest("daily_spo2") is None
+    assert store.fetch_start("daily_spo2", _day(-1), TODAY) == _day(-1)
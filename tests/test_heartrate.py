@@ -0,0 +1,129 @@
+"""HeartRateSeries against a brute-force reference over a plain list of samples."""
+from __future__ import annotations
+
+import random
+from datetime import datetime, timezone
+from statistics import fmean
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.oura.heartrate import HeartRateSeries  # noqa: E402
+
+HOUR = 3600
+START = 1_700_000_000
+
+def _assert_matches(series: HeartRateSeries, reference: list) -> None:
+    assert len(series) == len(reference)
+    bpms = [bpm for _, bpm, _ in reference]
+    if not reference:
+        assert series.min is None and series.max is None
+        assert series.mean is None and series.mean_1h is None
+        return
+    assert series.min == min(bpms)
+    assert series.max == max(bpms)
+    assert series.mean == pytest.approx(fmean(bpms))
+    latest = reference[-1][0]
+    assert series.mean_1h == pytest.approx(fmean(bpm for ts, bpm, _ in reference if ts >= latest - HOUR))
+    assert series.latest_bpm == reference[-1][1]
+    assert series.latest_time == datetime.fromtimestamp(latest, timezone.utc)
+
+def test_random_operations_match_reference():
+    rng = random.Random(7)
+    series, reference = HeartRateSeries(), []
+    now = START
+    for _ in range(3000):
+        op = rng.random()
+        if op < 0.8:
+            now += rng.choice((0, 60, 300, 900))
+            sample = (now, rng.randint(40, 180), rng.randint(0, 6))
+            series.append(*sample)
+            reference.append(sample)
+        elif op < 0.9:
+            cutoff = now - rng.randint(0, 12 * HOUR)
+            series.evict_before(cutoff)
+            reference = [s for s in reference if s[0] >= cutoff]
+        else:
+            since = now - rng.randint(0, 2 * HOUR)
+            kept = [s for s in reference if s[0] < since]
+            # Either the same overlap back with new samples after it, or a rewritten one
+            if rng.random() < 0.5:
+                fresh = [s for s in reference if s[0] >= since]
+            else:
+                fresh = [(s[0], rng.randint(40, 180), s[2]) for s in reference if s[0] >= since]
+            for _ in range(rng.randint(0, 5)):
+                now += 60
+                fresh.append((now, rng.randint(40, 180), 0))
+            series.replace_from(since, fresh)
+            reference = kept + fresh
+        _assert_matches(series, reference)
+
+def test_evicting_most_samples_reclaims_the_arrays():
+    series = HeartRateSeries.from_samples((START + i * 60, 60 + i % 50, 0) for i in range(1000))
+    series.evict_before(START + 800 * 60)
+    reference = [(START + i * 60, 60 + i % 50, 0) for i in range(800, 1000)]
+    _assert_matches(series, reference)
+    assert len(series.as_dict()["ts"]) == 200
+    series.append(START + 1000 * 60, 200, 0)
+    _assert_matches(series, reference + [(START + 1000 * 60, 200, 0)])
+
+def test_evicting_everything_then_appending():
+    series = HeartRateSeries.from_samples([(START, 70, 0), (START + 60, 80, 0)])
+    series.evict_before(START + HOUR)
+    _assert_matches(series, [])
+    series.append(START + 2 * HOUR, 55, 0)
+    _assert_matches(series, [(START + 2 * HOUR, 55, 0)])
+
+def test_append_rejects_older_samples():
+    series = HeartRateSeries.from_samples([(START, 70, 0)])
+    with pytest.raises(ValueError):
+        series.append(START - 1, 70, 0)
+
+def test_replace_from_with_unchanged_overlap_only_appends():
+    samples = [(START + i * 60, 60 + i, 0) for i in range(10)]
+    series = HeartRateSeries.from_samples(samples)
+    version = series.version
+    series.replace_from(START + 5 * 60, samples[5:] + [(START + 10 * 60, 99, 0)])
+    # One append, no truncate-and-rebuild
+    assert series.version == version + 1
+    _assert_matches(series, samples + [(START + 10 * 60, 99, 0)])
+
+def test_replace_from_with_changed_overlap_rebuilds():
+    samples = [(START + i * 60, 100 - i, 0) for i in range(10)]
+    series = HeartRateSeries.from_samples(samples)
+    assert series.min == 91
+    rewritten = [(ts, 120, src) for ts, _, src in samples[5:]]
+    series.replace_from(START + 5 * 60, rewritten)
+    _assert_matches(series, samples[:5] + rewritten)
+    assert series.min == 96 and series.max == 120
+
+def test_replace_from_ignores_samples_before_since():
+    samples = [(START + i * 60, 70, 0) for i in range(5)]
+    series = HeartRateSeries.from_samples(samples)
+    series.replace_from(START + 3 * 60, [(START, 200, 0), (START + 3 * 60, 70, 0), (START + 4 * 60, 70, 0)])
+    _assert_matches(series, samples)
+
+def test_payload_round_trip():
+    payload = {"data": [
+        {"timestamp": "2024-01-01T00:01:00+00:00", "bpm": 61, "source": "rest"},
+        {"timestamp": "2024-01-01T00:00:00Z", "bpm": 60.4, "source": "awake"},
+        {"timestamp": "2024-01-01T00:02:00+00:00", "bpm": None, "source": "rest"},
+        {"bpm": 70},
+        {"timestamp": "2024-01-01T00:03:00+00:00", "bpm": 65, "source": "unknown"},
+    ]}
+    series = HeartRateSeries.from_payload(payload)
+    # Sorted by time, bpm rounded, invalid records dropped
+    assert [bpm for _, bpm in series.iter_samples()] == [60, 61, 65]
+    assert series.latest_source is None
+    restored = HeartRateSeries.from_payload(series.as_dict())
+    assert restored.as_dict() == series.as_dict()
+    assert restored.mean == series.mean
+
+def test_iter_samples_range():
+    series = HeartRateSeries.from_samples((START + i * 60, 60 + i, 0) for i in range(10))
+    start = datetime.fromtimestamp(START + 2 * 60, timezone.utc)
+    end = datetime.fromtimestamp(START + 5 * 60, timezone.utc)
+    assert [bpm for _, bpm in series.iter_samples(start, end)] == [62, 63, 64]
+    series.evict_before(START + 4 * 60)
+    assert [bpm for _, bpm in series.iter_samples(None, end)] == [64]
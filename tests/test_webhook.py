@@ -0,0 +1,34 @@
+"""Signature check of incoming Oura webhook notifications."""
+from __future__ import annotations
+
+import hashlib
+import hmac
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.oura.webhook import _signature_valid  # noqa: E402
+
+SECRET = "client-secret"
+BODY = b'{"event_type": "update", "data_type": "daily_sleep", "user_id": "u1"}'
+TIMESTAMP = "1700000000"
+
+def _sign(secret: str, timestamp: str, body: bytes) -> str:
+    return hmac.new(secret.encode(), timestamp.encode() + body, hashlib.sha256).hexdigest().upper()
+
+def test_valid_signature_is_accepted_in_either_case():
+    signature = _sign(SECRET, TIMESTAMP, BODY)
+    assert _signature_valid(SECRET, TIMESTAMP, BODY, signature)
+    assert _signature_valid(SECRET, TIMESTAMP, BODY, signature.lower())
+
+@pytest.mark.parametrize(("secret", "timestamp", "body"), [
+    ("other-secret", TIMESTAMP, BODY),
+    (SECRET, "1700000001", BODY),
+    (SECRET, TIMESTAMP, BODY.replace(b"daily_sleep", b"workout")),
+])
+def test_signature_over_anything_else_is_rejected(secret, timestamp, body):
+    assert not _signature_valid(SECRET, TIMESTAMP, BODY, _sign(secret, timestamp, body))
+
+def test_missing_signature_is_rejected():
+    assert not _signature_valid(SECRET, TIMESTAMP, BODY, "")
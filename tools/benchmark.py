@@ -0,0 +1,282 @@
+"""Benchmarks for sensor extraction and the coordinator refresh cycle.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m tools.benchmark                          # print results
+    python -m tools.benchmark --save before.json       # keep them
+    python -m tools.benchmark --compare before.json    # diff against an earlier run
+
+Every `value_fn`/`attr_fn` in SENSORS is timed against the `OuraData` built from each
+synthetic profile, a full coordinator refresh is run against an in-process fake client,
+and tracemalloc reports what an `OuraData` keeps alive. With --compare the exit status
+is 1 when any timing or memory figure grew by more than --threshold.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.synthetic import PROFILES, Profile, generate_payloads  # noqa: E402
+
+REPEAT = 5
+CYCLES = 7
+
+def _per_call_us(fn: Callable[[], Any]) -> float:
+    """Best-of-REPEAT time per call in microseconds; autorange picks the loop count."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number * 1e6
+
+def _git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+class FakeOuraClient:
+    """Answers every coordinator endpoint from pre-serialized synthetic payloads.
+
+    Each call decodes and projects fresh JSON, as the real client does, and heart-rate
+    requests are filtered by start_datetime so the incremental fetch path is exercised."""
+
+    def __init__(self, payloads: Dict[str, Dict[str, Any]]) -> None:
+        from custom_components.oura.telemetry import OuraTelemetry
+
+        self._raw = {key: json.dumps(value) for key, value in payloads.items()}
+        self.calls = 0
+        self.telemetry = OuraTelemetry()
+
+    def set_payloads(self, payloads: Dict[str, Dict[str, Any]]) -> None:
+        self._raw = {key: json.dumps(value) for key, value in payloads.items()}
+
+    def __getattr__(self, key: str):
+        if key.startswith("_") or key not in self._raw:
+            raise AttributeError(key)
+
+        from custom_components.oura.api import json_loads, project_payload
+
+        async def _call(*args):
+            self.calls += 1
+            payload = project_payload(key, json_loads(self._raw[key]))
+            if key == "heartrate" and args:
+                start = datetime.fromisoformat(args[0])
+                payload["data"] = [s for s in payload["data"] if datetime.fromisoformat(s["timestamp"]) >= start]
+            return payload
+
+        return _call
+
+def bench_sensors(data) -> Dict[str, float]:
+    from custom_components.oura.sensor import SENSORS
+
+    results: Dict[str, float] = {}
+    for desc in SENSORS:
+        for kind in ("value_fn", "attr_fn"):
+            fn = getattr(desc, kind)
+            if fn is None:
+                continue
+            results[f"{desc.key}.{kind}"] = _per_call_us(lambda fn=fn: fn(data))
+    return results
+
+def _as_coordinator_payloads(payloads: Dict[str, Any]) -> Dict[str, Any]:
+    """The coordinator keeps heart rate as a HeartRateSeries, not the API's record list."""
+    from custom_components.oura.heartrate import HeartRateSeries
+
+    return {**payloads, "heartrate": HeartRateSeries.from_payload(payloads.get("heartrate"))}
+
+def bench_decode(payloads: Dict[str, Any]) -> Dict[str, float]:
+    """Decode plus projection of every endpoint's response body, as done on the event loop."""
+    from custom_components.oura.api import json_loads, project_payload
+
+    raw = {key: json.dumps(value).encode() for key, value in payloads.items()}
+    return {"decode_all_us": _per_call_us(
+        lambda: {key: project_payload(key, json_loads(value)) for key, value in raw.items()}
+    )}
+
+def bench_snapshot(payloads: Dict[str, Any]) -> Dict[str, float]:
+    from custom_components.oura.snapshot import OuraSnapshot
+
+    payloads = _as_coordinator_payloads(payloads)
+    return {"snapshot_build_us": _per_call_us(lambda: OuraSnapshot(payloads))}
+
+def bench_memory(payloads: Dict[str, Any]) -> Dict[str, float]:
+    """Bytes allocated for decoded (and projected) payloads and for the snapshot derived from them."""
+    from custom_components.oura.api import json_loads, project_payload
+    from custom_components.oura.coordinator import OuraData
+
+    raw = {key: json.dumps(value).encode() for key, value in payloads.items()}
+    gc.collect()
+    tracemalloc.start()
+    decoded = _as_coordinator_payloads({key: project_payload(key, json_loads(value)) for key, value in raw.items()})
+    after_decode, _ = tracemalloc.get_traced_memory()
+    data = OuraData(payloads=decoded)
+    total, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return {
+        "payload_json_bytes": sum(len(value) for value in raw.values()),
+        "payloads_mem_bytes": after_decode,
+        "snapshot_mem_bytes": total - after_decode,
+        "oura_data_mem_bytes": total,
+        "oura_data_peak_bytes": peak,
+    }
+
+async def _bench_cycles(profile: Profile, payloads: Dict[str, Any]) -> Dict[str, float]:
+    from homeassistant.core import HomeAssistant
+    from custom_components.oura.coordinator import OuraDataUpdateCoordinator
+
+    results: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+
+        async def _timed(coordinator) -> float:
+            started = time.perf_counter()
+            await coordinator.async_refresh()
+            return (time.perf_counter() - started) * 1e3
+
+        def _coordinator(client) -> OuraDataUpdateCoordinator:
+            return OuraDataUpdateCoordinator(
+                hass, client=client, update_interval=timedelta(minutes=30),
+                title=f"bench_{profile.name}", entry_id=f"bench_{profile.name}",
+            )
+
+        # Cold: empty coordinator, every endpoint due and changed
+        cold = []
+        for _ in range(CYCLES):
+            cold.append(await _timed(_coordinator(FakeOuraClient(payloads))))
+        results["cycle_cold_ms"] = statistics.median(cold)
+
+        # Warm, nothing changed: every endpoint re-fetched and fingerprinted, update skipped
+        client = FakeOuraClient(payloads)
+        coordinator = _coordinator(client)
+        await coordinator.async_refresh()
+        unchanged = []
+        for _ in range(CYCLES):
+            coordinator.invalidate()
+            unchanged.append(await _timed(coordinator))
+        results["cycle_unchanged_ms"] = statistics.median(unchanged)
+
+        # Warm, one daily endpoint changed per cycle: a new OuraData and snapshot are built
+        changed = []
+        for i in range(CYCLES):
+            varied = dict(payloads)
+            readiness = json.loads(json.dumps(payloads["daily_readiness"]))
+            readiness["data"][-1]["score"] = 50 + i
+            varied["daily_readiness"] = readiness
+            client.set_payloads(varied)
+            coordinator.invalidate()
+            changed.append(await _timed(coordinator))
+        results["cycle_changed_ms"] = statistics.median(changed)
+        results["updates_skipped"] = coordinator.updates_skipped
+
+        await hass.async_stop(force=True)
+    return results
+
+def run_profile(profile: Profile, seed: int) -> Dict[str, Any]:
+    from custom_components.oura.coordinator import OuraData
+
+    payloads = generate_payloads(profile, seed=seed, now=datetime.now(timezone.utc))
+    data = OuraData(payloads=_as_coordinator_payloads(payloads))
+    sensors = bench_sensors(data)
+    return {
+        "records": {key: len(value.get("data", [])) for key, value in payloads.items() if isinstance(value, dict) and "data" in value},
+        "sensors_us": sensors,
+        "all_sensors_us": sum(sensors.values()),
+        **bench_decode(payloads),
+        **bench_snapshot(payloads),
+        **bench_memory(payloads),
+        **asyncio.run(_bench_cycles(profile, payloads)),
+    }
+
+def _flatten(results: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    flat: Dict[str, float] = {}
+    for key, value in results.items():
+        if key == "records":
+            continue
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and name.rsplit(".", 1)[-1].endswith(("_us", "_ms", "_bytes", "_fn")):
+            flat[name] = float(value)
+    return flat
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Print every metric against the baseline; returns the ones that regressed past threshold."""
+    new, old = _flatten(current["results"]), _flatten(baseline["results"])
+    regressions = []
+    print(f"\n{'metric':<60} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for name in sorted(new.keys() & old.keys()):
+        ratio = new[name] / old[name] if old[name] else float("inf") if new[name] else 1.0
+        flag = ""
+        if ratio > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<60} {old[name]:>12.2f} {new[name]:>12.2f} {ratio:>6.2f}x{flag}")
+    for name in sorted(new.keys() - old.keys()):
+        print(f"{name:<60} {'-':>12} {new[name]:>12.2f}    new")
+    return regressions
+
+def _summary(results: Dict[str, Any]) -> None:
+    for name, res in results.items():
+        sensors = res["sensors_us"]
+        slowest = sorted(sensors.items(), key=lambda kv: kv[1], reverse=True)[:5]
+        print(f"\n[{name}] records: {res['records']}")
+        print(f"  all sensors, one pass: {res['all_sensors_us']:.1f} us ({len(sensors)} functions)")
+        print("  slowest: " + ", ".join(f"{k} {v:.2f} us" for k, v in slowest))
+        print(f"  decode + projection: {res['decode_all_us']:.1f} us, snapshot build: {res['snapshot_build_us']:.1f} us")
+        print(f"  OuraData memory: {res['oura_data_mem_bytes'] / 1024:.1f} KiB "
+              f"(payloads {res['payloads_mem_bytes'] / 1024:.1f}, snapshot {res['snapshot_mem_bytes'] / 1024:.1f}, "
+              f"json {res['payload_json_bytes'] / 1024:.1f})")
+        print(f"  refresh cycle: cold {res['cycle_cold_ms']:.2f} ms, unchanged {res['cycle_unchanged_ms']:.2f} ms, "
+              f"changed {res['cycle_changed_ms']:.2f} ms")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--profile", action="append", choices=sorted(PROFILES), help="default: all profiles")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="JSON from an earlier --save run")
+    parser.add_argument("--threshold", type=float, default=1.25, help="max allowed current/baseline ratio")
+    args = parser.parse_args(argv)
+
+    results = {name: run_profile(PROFILES[name], args.seed) for name in (args.profile or sorted(PROFILES))}
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git": _git_revision(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    _summary(results)
+    if args.save:
+        args.save.write_text(json.dumps(report, indent=2, sort_keys=True))
+        print(f"\nSaved to {args.save}")
+    if args.compare:
+        regressions = compare(report, json.loads(args.compare.read_text()), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} metric(s) regressed by more than {args.threshold:.2f}x")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""Run many Oura accounts against tools/mock_server.py, fully offline.
+
+Each account gets its own OAuth token from the mock, its own OuraApiClient and its own
+OuraDataUpdateCoordinator; all of them share one global request limiter, as config
+entries do inside Home Assistant. Three rounds are run:
+
+  cold    - empty coordinators, every endpoint fetched
+  cached  - immediately again; endpoint TTLs should keep requests near zero
+  forced  - every endpoint invalidated, as the refresh button/service does
+
+    python -m tools.load_test --accounts 50 --rate-429 0.05 --rate-5xx 0.02 --page-size 100 --token-ttl 30
+
+Needs Home Assistant installed (the integration modules import it).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import aiohttp
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.mock_server import add_fault_arguments, server_from_args  # noqa: E402
+
+from custom_components.oura.api import OuraRefreshingAuth  # noqa: E402
+
+class MockOAuthAuth(OuraRefreshingAuth):
+    """OAuth token from the mock's token endpoint, refreshed by the integration's own logic."""
+
+    def __init__(self, http: aiohttp.ClientSession, base_url: str, token: Dict[str, Any]) -> None:
+        super().__init__()
+        self._http = http
+        self._base_url = base_url
+        self._token = self._with_expiry(token)
+
+    @staticmethod
+    def _with_expiry(token: Dict[str, Any]) -> Dict[str, Any]:
+        return {**token, "expires_at": time.time() + token["expires_in"]}
+
+    @property
+    def token(self) -> Dict[str, Any]:
+        return self._token
+
+    @classmethod
+    async def authorize(cls, http: aiohttp.ClientSession, base_url: str, user: str) -> "MockOAuthAuth":
+        resp = await http.get(
+            f"{base_url}/oauth/authorize",
+            params={"redirect_uri": "http://localhost/cb", "state": user, "login_hint": user},
+            allow_redirects=False,
+        )
+        code = parse_qs(urlparse(resp.headers["Location"]).query)["code"][0]
+        resp = await http.post(f"{base_url}/oauth/token", data={"grant_type": "authorization_code", "code": code})
+        resp.raise_for_status()
+        return cls(http, base_url, await resp.json())
+
+    async def _async_refresh_token(self, token: Dict[str, Any]) -> Dict[str, Any]:
+        resp = await self._http.post(
+            f"{self._base_url}/oauth/token",
+            data={"grant_type": "refresh_token", "refresh_token": token["refresh_token"]},
+        )
+        resp.raise_for_status()
+        self._token = self._with_expiry(await resp.json())
+        return self._token
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))] if ordered else 0.0
+
+async def run(args: argparse.Namespace) -> int:
+    from homeassistant.core import HomeAssistant
+    from custom_components.oura.api import OuraApiClient
+    from custom_components.oura.coordinator import ENDPOINTS, OuraDataUpdateCoordinator
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        server = server_from_args(args, strict_tokens=True)
+        base_url = await server.start()
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        limiter = asyncio.Semaphore(args.global_in_flight)
+        async with aiohttp.ClientSession() as http:
+            auths = await asyncio.gather(*(
+                MockOAuthAuth.authorize(http, base_url, f"user-{i}") for i in range(args.accounts)
+            ))
+            coordinators = [
+                OuraDataUpdateCoordinator(
+                    hass,
+                    client=OuraApiClient(http, auth, api_base=f"{base_url}/v2", max_concurrency=args.max_concurrency,
+                                         request_limiter=limiter),
+                    update_interval=timedelta(minutes=30),
+                    title=f"load_{i}", entry_id=f"load_{i}",
+                )
+                for i, auth in enumerate(auths)
+            ]
+
+            async def _stats() -> Dict[str, Any]:
+                async with http.get(f"{base_url}/_mock/stats") as resp:
+                    return (await resp.json())["stats"]
+
+            async def _timed(coordinator) -> float:
+                started = time.perf_counter()
+                await coordinator.async_refresh()
+                return time.perf_counter() - started
+
+            for name in ("cold", "cached", "forced"):
+                if name == "forced":
+                    for coordinator in coordinators:
+                        coordinator.invalidate()
+                before = await _stats()
+                started = time.perf_counter()
+                durations = await asyncio.gather(*(_timed(c) for c in coordinators))
+                wall = time.perf_counter() - started
+                after = await _stats()
+                delta = {k: after.get(k, 0) - before.get(k, 0) for k in after if not k.startswith("endpoint.")}
+                incomplete = sum(
+                    1 for c in coordinators
+                    if not c.last_update_success or c.data is None or set(ENDPOINTS) - set(c.data.payloads)
+                )
+                failures += incomplete
+                print(
+                    f"[{name:>6}] {args.accounts} accounts in {wall:.2f}s | refresh p50 {statistics.median(durations):.2f}s "
+                    f"p95 {_percentile(durations, 95):.2f}s max {max(durations):.2f}s | "
+                    f"requests {delta.get('requests', 0)} 429 {delta.get('injected_429', 0)} "
+                    f"5xx {delta.get('injected_5xx', 0)} 401 {delta.get('rejected_401', 0)} "
+                    f"pages {delta.get('paged_responses', 0)} | incomplete accounts {incomplete}"
+                )
+            print(f"token refreshes: {sum(a.refreshes for a in auths)}")
+        await hass.async_stop(force=True)
+
+    if server is not None:
+        await server.stop()
+    return 1 if failures and args.fail_on_incomplete else 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--accounts", type=int, default=20)
+    parser.add_argument("--url", help="use an already running mock server instead of starting one")
+    parser.add_argument("--max-concurrency", type=int, default=4, help="per-account in-flight requests")
+    parser.add_argument("--global-in-flight", type=int, default=None, help="default: GLOBAL_MAX_IN_FLIGHT")
+    parser.add_argument("--fail-on-incomplete", action="store_true", help="exit 1 if any account lost an endpoint")
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.global_in_flight is None:
+        from custom_components.oura.const import GLOBAL_MAX_IN_FLIGHT
+        args.global_in_flight = GLOBAL_MAX_IN_FLIGHT
+    return asyncio.run(run(args))
+
+if __name__ == "__main__":
+    sys.exit(main())
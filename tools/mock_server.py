@@ -0,0 +1,293 @@
+"""Local stand-in for the Oura v2 API and OAuth token endpoint.
+
+Serves synthetic data (see tools/synthetic.py) from `/v2/usercollection/*` and
+`/v2/sandbox/usercollection/*`, issues and refreshes OAuth tokens, and can inject latency,
+429s with Retry-After, 5xx responses, short-lived tokens and multi-page `next_token`
+responses. Fault settings can be changed while running via `POST /_mock/faults`;
+request counters are at `GET /_mock/stats`.
+
+    python -m tools.mock_server --port 8787 --page-size 50 --rate-429 0.05 --latency-ms 80
+
+Only needs aiohttp, so it runs without Home Assistant.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import hashlib
+import json
+import random
+import secrets
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from aiohttp import web
+
+try:
+    from tools.synthetic import PROFILES, Profile, generate_payloads
+except ImportError:  # run as a script from tools/
+    from synthetic import PROFILES, Profile, generate_payloads
+
+SCOPES = "email personal daily heartrate workout tag session spo2"
+
+@dataclass
+class Faults:
+    """What the server does to otherwise valid requests; rates are probabilities per request."""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_429: float = 0.0
+    retry_after_sec: float = 1.0
+    rate_5xx: float = 0.0
+    page_size: Optional[int] = None  # None: whole collection in one page
+    token_ttl_sec: int = 86400
+
+def _parse_ts(value: str) -> Optional[datetime]:
+    try:
+        ts = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+class MockOuraServer:
+    def __init__(self, profile: Profile, *, faults: Optional[Faults] = None, history_days: int = 30,
+                 seed: int = 0, strict_tokens: bool = False) -> None:
+        self.profile = dataclasses.replace(profile, days=max(profile.days, history_days))
+        self.faults = faults or Faults()
+        self.seed = seed
+        # Unknown bearer tokens are treated as users of their own unless strict
+        self.strict_tokens = strict_tokens
+        self.stats: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._access: Dict[str, Tuple[str, float]] = {}  # token -> (user, expires_at)
+        self._refresh: Dict[str, str] = {}  # refresh token -> user
+        self._codes: Dict[str, str] = {}  # authorization code -> user
+        self._runner: Optional[web.AppRunner] = None
+
+    # --- application ---
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/oauth/authorize", self._authorize)
+        app.router.add_post("/oauth/token", self._token)
+        for prefix in ("/v2", "/v2/sandbox"):
+            app.router.add_get(prefix + "/usercollection/{endpoint}", self._collection)
+        app.router.add_get("/_mock/stats", self._stats)
+        app.router.add_post("/_mock/faults", self._set_faults)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving; returns the base URL (port 0 picks a free one)."""
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        return f"http://{host}:{bound}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    # --- tokens ---
+
+    def issue_token(self, user: str) -> Dict[str, Any]:
+        access, refresh = secrets.token_urlsafe(24), secrets.token_urlsafe(24)
+        self._access[access] = (user, time.time() + self.faults.token_ttl_sec)
+        self._refresh[refresh] = user
+        self.stats["tokens_issued"] += 1
+        return {
+            "access_token": access,
+            "refresh_token": refresh,
+            "token_type": "Bearer",
+            "expires_in": self.faults.token_ttl_sec,
+            "scope": SCOPES,
+        }
+
+    def create_code(self, user: Optional[str] = None) -> str:
+        code = secrets.token_urlsafe(16)
+        self._codes[code] = user or f"user-{len(self._codes) + 1}"
+        return code
+
+    def _user_for(self, request: web.Request) -> Tuple[Optional[str], Optional[str]]:
+        """(user, error) for the request's bearer token."""
+        header = request.headers.get("Authorization", "")
+        if not header.startswith("Bearer "):
+            return None, "missing bearer token"
+        token = header[7:]
+        known = self._access.get(token)
+        if known is None:
+            return (None, "invalid token") if self.strict_tokens else (token, None)
+        user, expires_at = known
+        if time.time() >= expires_at:
+            return None, "token expired"
+        return user, None
+
+    async def _authorize(self, request: web.Request) -> web.Response:
+        redirect_uri = request.query.get("redirect_uri")
+        if not redirect_uri:
+            return web.json_response({"detail": "redirect_uri required"}, status=400)
+        query = {"code": self.create_code(request.query.get("login_hint")), "state": request.query.get("state", "")}
+        raise web.HTTPFound(f"{redirect_uri}{'&' if '?' in redirect_uri else '?'}{urlencode(query)}")
+
+    async def _token(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        grant = form.get("grant_type")
+        if grant == "authorization_code":
+            user = self._codes.pop(str(form.get("code")), None)
+        elif grant == "refresh_token":
+            user = self._refresh.pop(str(form.get("refresh_token")), None)
+            self.stats["token_refreshes"] += 1
+        else:
+            return web.json_response({"error": "unsupported_grant_type"}, status=400)
+        if user is None:
+            return web.json_response({"error": "invalid_grant"}, status=400)
+        return web.json_response(self.issue_token(user))
+
+    # --- data ---
+
+    def _payloads(self, user: str) -> Dict[str, Any]:
+        data = self._data.get(user)
+        if data is None:
+            user_seed = self.seed + int(hashlib.blake2b(user.encode(), digest_size=4).hexdigest(), 16)
+            data = self._data[user] = generate_payloads(self.profile, seed=user_seed)
+        self._extend_heartrate(data["heartrate"]["data"], user)
+        return data
+
+    def _extend_heartrate(self, samples: List[Dict[str, Any]], user: str) -> None:
+        """Keep the series live: append samples up to now so incremental polling sees new data."""
+        step = timedelta(seconds=self.profile.hr_interval_sec)
+        last = _parse_ts(samples[-1]["timestamp"]) if samples else datetime.now(timezone.utc) - step
+        now = datetime.now(timezone.utc)
+        rng = random.Random(f"{user}{last.isoformat()}")
+        while last is not None and last + step <= now:
+            last += step
+            samples.append({"bpm": rng.randint(45, 160), "source": "awake", "timestamp": last.isoformat(timespec="seconds")})
+
+    def _filter(self, endpoint: str, records: List[Dict[str, Any]], query) -> List[Dict[str, Any]]:
+        if endpoint == "heartrate":
+            start, end = _parse_ts(query.get("start_datetime", "")), _parse_ts(query.get("end_datetime", ""))
+            return [
+                r for r in records
+                if (ts := _parse_ts(r["timestamp"])) and (start is None or ts >= start) and (end is None or ts <= end)
+            ]
+        start, end = query.get("start_date"), query.get("end_date")
+        return [
+            r for r in records
+            if "day" not in r or ((start is None or r["day"] >= start) and (end is None or r["day"] <= end))
+        ]
+
+    async def _inject(self, request: web.Request) -> Optional[web.Response]:
+        faults = self.faults
+        if faults.latency_ms or faults.jitter_ms:
+            await asyncio.sleep(max(0.0, faults.latency_ms + self._rng.uniform(-1, 1) * faults.jitter_ms) / 1000)
+        if self._rng.random() < faults.rate_429:
+            self.stats["injected_429"] += 1
+            return web.json_response(
+                {"detail": "Too Many Requests"}, status=429,
+                headers={"Retry-After": f"{faults.retry_after_sec:g}"},
+            )
+        if self._rng.random() < faults.rate_5xx:
+            self.stats["injected_5xx"] += 1
+            return web.json_response({"detail": "Service Unavailable"}, status=self._rng.choice([500, 502, 503, 504]))
+        return None
+
+    async def _collection(self, request: web.Request) -> web.Response:
+        endpoint = request.match_info["endpoint"]
+        self.stats["requests"] += 1
+        self.stats[f"endpoint.{endpoint}"] += 1
+        user, error = self._user_for(request)
+        if error:
+            self.stats["rejected_401"] += 1
+            return web.json_response({"detail": error}, status=401)
+        injected = await self._inject(request)
+        if injected is not None:
+            return injected
+        payloads = self._payloads(user)
+        if endpoint not in payloads:
+            self.stats["not_found"] += 1
+            return web.json_response({"detail": "Not Found"}, status=404)
+        if endpoint == "personal_info":
+            return self._compressed(web.json_response(payloads[endpoint]))
+
+        records = self._filter(endpoint, payloads[endpoint]["data"], request.query)
+        offset = 0
+        token = request.query.get("next_token")
+        if token:
+            try:
+                offset = int(token.removeprefix("page-"))
+            except ValueError:
+                return web.json_response({"detail": "invalid next_token"}, status=400)
+        size = self.faults.page_size or len(records) or 1
+        page = records[offset:offset + size]
+        next_token = f"page-{offset + size}" if offset + size < len(records) else None
+        if next_token:
+            self.stats["paged_responses"] += 1
+        return self._compressed(web.json_response({"data": page, "next_token": next_token}))
+
+    @staticmethod
+    def _compressed(resp: web.Response) -> web.Response:
+        # Negotiated from Accept-Encoding, like the real API
+        resp.enable_compression()
+        return resp
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            "stats": dict(self.stats),
+            "faults": dataclasses.asdict(self.faults),
+            "users": len(self._data),
+        })
+
+    async def _set_faults(self, request: web.Request) -> web.Response:
+        try:
+            changes = await request.json()
+            self.faults = dataclasses.replace(self.faults, **changes)
+        except (TypeError, ValueError) as err:
+            return web.json_response({"detail": str(err)}, status=400)
+        if "token_ttl_sec" in changes:
+            # Let "expire every token now" be requested with token_ttl_sec=0
+            cutoff = time.time() + self.faults.token_ttl_sec
+            self._access = {t: (u, min(exp, cutoff)) for t, (u, exp) in self._access.items()}
+        return web.json_response(dataclasses.asdict(self.faults))
+
+def add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="realistic")
+    parser.add_argument("--history-days", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    parser.add_argument("--page-size", type=int)
+    parser.add_argument("--token-ttl", type=int, default=86400)
+
+def server_from_args(args: argparse.Namespace, *, strict_tokens: bool = False) -> MockOuraServer:
+    faults = Faults(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, rate_429=args.rate_429,
+        retry_after_sec=args.retry_after, rate_5xx=args.rate_5xx, page_size=args.page_size,
+        token_ttl_sec=args.token_ttl,
+    )
+    return MockOuraServer(PROFILES[args.profile], faults=faults, history_days=args.history_days,
+                          seed=args.seed, strict_tokens=strict_tokens)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--strict-tokens", action="store_true", help="reject bearer tokens the server did not issue")
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+    server = server_from_args(args, strict_tokens=args.strict_tokens)
+    print(f"Mock Oura API on http://{args.host}:{args.port} (API base http://{args.host}:{args.port}/v2)")
+    print(json.dumps(dataclasses.asdict(server.faults)))
+    web.run_app(server.make_app(), host=args.host, port=args.port, print=None)
+
+if __name__ == "__main__":
+    main()
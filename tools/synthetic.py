@@ -0,0 +1,183 @@
+"""Synthetic Oura v2 payloads shaped like the real `/v2/usercollection/*` responses.
+
+Used by the benchmark suite and the local mock API server; no Home Assistant imports.
+"""
+from __future__ import annotations
+
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+@dataclass(frozen=True)
+class Profile:
+    """How much data one account carries."""
+    name: str
+    days: int  # days of daily summaries / sleep / activity
+    hr_hours: int  # length of the heart-rate series
+    hr_interval_sec: int
+    workouts: int
+    sessions: int
+    naps_per_day: int = 0
+
+PROFILES = {
+    # What the coordinator holds for a typical account on a normal day
+    "realistic": Profile("realistic", days=2, hr_hours=30, hr_interval_sec=300, workouts=2, sessions=1, naps_per_day=1),
+    # Multi-day sleep lists, a week of minute-level heart rate, dozens of workouts
+    "stress": Profile("stress", days=14, hr_hours=7 * 24, hr_interval_sec=60, workouts=48, sessions=24, naps_per_day=2),
+}
+
+def _id(rng: random.Random) -> str:
+    return uuid.UUID(int=rng.getrandbits(128)).hex
+
+def _iso(ts: datetime) -> str:
+    return ts.isoformat(timespec="seconds")
+
+def _items(rng: random.Random, count: int, low: float, high: float) -> List[float]:
+    return [round(rng.uniform(low, high), 1) for _ in range(count)]
+
+def _contributors(rng: random.Random, keys) -> Dict[str, int]:
+    return {k: rng.randint(40, 100) for k in keys}
+
+def personal_info(rng: random.Random) -> Dict[str, Any]:
+    return {
+        "id": _id(rng),
+        "age": rng.randint(20, 70),
+        "weight": round(rng.uniform(50, 100), 1),
+        "height": round(rng.uniform(1.5, 2.0), 2),
+        "biological_sex": rng.choice(["male", "female"]),
+        "email": "user@example.com",
+    }
+
+def daily_readiness(rng: random.Random, day: date) -> Dict[str, Any]:
+    return {
+        "id": _id(rng), "day": day.isoformat(), "score": rng.randint(50, 95),
+        "temperature_deviation": round(rng.uniform(-1, 1), 2),
+        "temperature_trend_deviation": round(rng.uniform(-1, 1), 2),
+        "timestamp": f"{day.isoformat()}T00:00:00+00:00",
+        "contributors": _contributors(rng, [
+            "activity_balance", "body_temperature", "hrv_balance", "previous_day_activity",
+            "previous_night", "recovery_index", "resting_heart_rate", "sleep_balance",
+        ]),
+    }
+
+def daily_sleep(rng: random.Random, day: date) -> Dict[str, Any]:
+    return {
+        "id": _id(rng), "day": day.isoformat(), "score": rng.randint(50, 95),
+        "timestamp": f"{day.isoformat()}T00:00:00+00:00",
+        "contributors": _contributors(rng, [
+            "deep_sleep", "efficiency", "latency", "rem_sleep", "restfulness", "timing", "total_sleep",
+        ]),
+    }
+
+def daily_activity(rng: random.Random, day: date) -> Dict[str, Any]:
+    return {
+        "id": _id(rng), "day": day.isoformat(), "score": rng.randint(50, 95),
+        "active_calories": rng.randint(100, 900), "average_met_minutes": round(rng.uniform(1, 3), 2),
+        "class_5_min": "".join(rng.choice("012345") for _ in range(288)),
+        "equivalent_walking_distance": rng.randint(2000, 15000),
+        "high_activity_met_minutes": rng.randint(0, 60), "high_activity_time": rng.randint(0, 3600),
+        "inactivity_alerts": rng.randint(0, 5),
+        "low_activity_met_minutes": rng.randint(50, 300), "low_activity_time": rng.randint(3600, 20000),
+        "medium_activity_met_minutes": rng.randint(0, 200), "medium_activity_time": rng.randint(0, 7200),
+        "met": {"interval": 60, "items": _items(rng, 1440, 0.9, 6), "timestamp": f"{day.isoformat()}T04:00:00+00:00"},
+        "meters_to_target": rng.randint(0, 8000), "non_wear_time": rng.randint(0, 3600),
+        "resting_time": rng.randint(20000, 40000),
+        "sedentary_met_minutes": rng.randint(0, 50), "sedentary_time": rng.randint(10000, 40000),
+        "steps": rng.randint(1000, 20000), "target_calories": 500, "target_meters": 10000,
+        "total_calories": rng.randint(1800, 3500),
+        "timestamp": f"{day.isoformat()}T04:00:00+00:00",
+        "contributors": _contributors(rng, [
+            "meet_daily_targets", "move_every_hour", "recovery_time", "stay_active",
+            "training_frequency", "training_volume",
+        ]),
+    }
+
+def sleep_period(rng: random.Random, day: date, kind: str = "long_sleep") -> Dict[str, Any]:
+    if kind == "long_sleep":
+        start = datetime.combine(day - timedelta(days=1), datetime.min.time(), timezone.utc) + timedelta(hours=22 + rng.random() * 2)
+        length = timedelta(hours=rng.uniform(6, 9))
+    else:
+        start = datetime.combine(day, datetime.min.time(), timezone.utc) + timedelta(hours=12 + rng.random() * 4)
+        length = timedelta(minutes=rng.uniform(20, 90))
+    five_min = int(length.total_seconds() // 300)
+    return {
+        "id": _id(rng), "day": day.isoformat(), "type": kind,
+        "bedtime_start": _iso(start), "bedtime_end": _iso(start + length),
+        "average_breath": round(rng.uniform(12, 18), 2), "average_heart_rate": round(rng.uniform(50, 65), 2),
+        "average_hrv": rng.randint(20, 90), "awake_time": rng.randint(600, 3600),
+        "deep_sleep_duration": rng.randint(3000, 7000), "efficiency": rng.randint(75, 98),
+        "latency": rng.randint(120, 1800), "light_sleep_duration": rng.randint(10000, 16000),
+        "lowest_heart_rate": rng.randint(40, 60), "rem_sleep_duration": rng.randint(4000, 8000),
+        "restless_periods": rng.randint(50, 300), "time_in_bed": int(length.total_seconds()),
+        "total_sleep_duration": int(length.total_seconds()) - rng.randint(600, 3600),
+        "heart_rate": {"interval": 300, "items": _items(rng, five_min, 45, 70), "timestamp": _iso(start)},
+        "hrv": {"interval": 300, "items": _items(rng, five_min, 20, 100), "timestamp": _iso(start)},
+        "movement_30_sec": "".join(rng.choice("1234") for _ in range(five_min * 10)),
+        "sleep_phase_5_min": "".join(rng.choice("1234") for _ in range(five_min)),
+        "readiness": {"score": rng.randint(50, 95), "temperature_deviation": round(rng.uniform(-1, 1), 2)},
+    }
+
+def heartrate_samples(rng: random.Random, end: datetime, hours: int, interval_sec: int) -> List[Dict[str, Any]]:
+    count = hours * 3600 // interval_sec
+    start = end - timedelta(seconds=count * interval_sec)
+    sources = ["awake", "rest", "sleep", "workout", "live"]
+    return [
+        {"bpm": rng.randint(45, 160), "source": rng.choice(sources), "timestamp": _iso(start + timedelta(seconds=i * interval_sec))}
+        for i in range(count)
+    ]
+
+def workout(rng: random.Random, day: date) -> Dict[str, Any]:
+    start = datetime.combine(day, datetime.min.time(), timezone.utc) + timedelta(hours=rng.uniform(6, 20))
+    return {
+        "id": _id(rng), "day": day.isoformat(), "activity": rng.choice(["walking", "running", "cycling"]),
+        "calories": round(rng.uniform(50, 800), 1), "distance": round(rng.uniform(500, 15000), 1),
+        "intensity": rng.choice(["easy", "moderate", "hard"]), "label": None, "source": "autodetected",
+        "start_datetime": _iso(start), "end_datetime": _iso(start + timedelta(minutes=rng.uniform(10, 120))),
+    }
+
+def session(rng: random.Random, day: date) -> Dict[str, Any]:
+    start = datetime.combine(day, datetime.min.time(), timezone.utc) + timedelta(hours=rng.uniform(6, 22))
+    return {
+        "id": _id(rng), "day": day.isoformat(), "type": rng.choice(["breathing", "meditation", "rest"]),
+        "mood": rng.choice(["good", "great", None]),
+        "start_datetime": _iso(start), "end_datetime": _iso(start + timedelta(minutes=rng.uniform(5, 30))),
+        "heart_rate": {"interval": 5, "items": _items(rng, 120, 50, 80), "timestamp": _iso(start)},
+    }
+
+def collection(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"data": records, "next_token": None}
+
+def generate_payloads(profile: Profile, *, seed: int = 0, now: datetime | None = None) -> Dict[str, Dict[str, Any]]:
+    """Every endpoint the coordinator fetches, keyed like OuraData.payloads."""
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc)
+    today = now.date()
+    days = [today - timedelta(days=i) for i in range(profile.days - 1, -1, -1)]
+    sleeps = []
+    for day in days:
+        sleeps.append(sleep_period(rng, day))
+        sleeps.extend(sleep_period(rng, day, "rest") for _ in range(profile.naps_per_day))
+    return {
+        "personal_info": personal_info(rng),
+        "ring_configuration": collection([{"id": _id(rng), "color": "silver", "design": "heritage",
+                                           "firmware_version": "2.9.20", "hardware_type": "gen3", "size": 9}]),
+        "rest_mode_period": collection([]),
+        "daily_readiness": collection([daily_readiness(rng, d) for d in days]),
+        "daily_sleep": collection([daily_sleep(rng, d) for d in days]),
+        "daily_activity": collection([daily_activity(rng, d) for d in days]),
+        "daily_spo2": collection([{"id": _id(rng), "day": d.isoformat(), "breathing_disturbance_index": rng.randint(0, 20),
+                                   "spo2_percentage": {"average": round(rng.uniform(94, 99), 2)}} for d in days]),
+        "daily_stress": collection([{"id": _id(rng), "day": d.isoformat(), "stress_high": rng.randint(0, 7200),
+                                     "recovery_high": rng.randint(0, 7200), "day_summary": "normal"} for d in days]),
+        "daily_resilience": collection([{"id": _id(rng), "day": d.isoformat(), "level": "solid",
+                                         "contributors": _contributors(rng, ["sleep_recovery", "daytime_recovery", "stress"])} for d in days]),
+        "heartrate": collection(heartrate_samples(rng, now, profile.hr_hours, profile.hr_interval_sec)),
+        "workout": collection([workout(rng, days[i % len(days)]) for i in range(profile.workouts)]),
+        "session": collection([session(rng, days[i % len(days)]) for i in range(profile.sessions)]),
+        "sleep": collection(sleeps),
+        "enhanced_tag": collection([]),
+        "vo2max": collection([{"id": _id(rng), "day": d.isoformat(), "vo2_max": rng.randint(30, 55)} for d in days]),
+        "daily_cardiovascular_age": collection([{"day": d.isoformat(), "vascular_age": rng.randint(25, 60)} for d in days]),
+    }